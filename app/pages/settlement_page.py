@@ -1,14 +1,40 @@
-import io
-import tempfile
-import zipfile
+import time
+import uuid
 from typing import Optional
 import pandas as pd
 import streamlit as st
 
-from app.settlement.pdf_generator import (
-    generate_kakao_pdf,
-    generate_multi_pdf
+from app.settlement.batch import KakaoPdfJob
+from app.settlement.billing import (
+    check_against_drafts,
+    has_stats_dates,
+    load_rate_table,
+    price_kakao_stats,
+    settle_org_map,
+    summarize_by_org,
 )
+from app.settlement.cache import (
+    configure_workbook_cache,
+    workbook_cache,
+)
+from app.settlement.carriers import CarrierStats
+from app.settlement.classifier import classify_files, classify_headers
+from app.settlement.index import SettlementIndex
+from app.settlement.jobs import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    get_job_runner,
+)
+from app.settlement.kakao_invoice import build_kakao_invoices
+from app.settlement.metrics import BatchMetrics, format_eta
+from app.settlement.normalize import categorize_frames
+from app.settlement.partners import load_partner_directory
+from app.settlement.reconcile import (
+    MultiMonthReconciler,
+    guess_month,
+    load_monthly_files,
+)
+from app.utils.loader import load_settings, subscribe_settings
 
 # ------------------------------------------------------
 # 공통 컬럼명 정규화
@@ -25,10 +51,28 @@ def normalize_col(col: str):
     )
 
 def normalize_dataframe_columns(df: pd.DataFrame):
+    # 캐시된 원본 DF를 건드리지 않도록 얕은 복사본의 컬럼만 교체
+    df = df.copy(deep=False)
     df.columns = [normalize_col(c) for c in df.columns]
     return df
 
 
+# 강제 컬럼명 맵핑 (정규화 이후 이름 기준)
+COL_FIX = {
+    "settleid": "settleid",
+    "카카오settleid": "settleid",
+    "카카오settlid": "settleid",
+    "id": "settleid",
+    "기관명": "기관명",
+    "기관": "기관명",
+}
+
+
+def apply_col_fix(df: pd.DataFrame):
+    fixed_cols = {c: COL_FIX[c] for c in df.columns if c in COL_FIX}
+    return df.rename(columns=fixed_cols)
+
+
 # ------------------------------------------------------
 # 엑셀 시트 선택 로더
 # ------------------------------------------------------
@@ -37,20 +81,21 @@ def load_excel_sheet(file, label: str) -> Optional[pd.DataFrame]:
         st.info(f"{label} 파일을 업로드하세요.")
         return None
 
+    # 파일 내용 해시 기준 캐시 → 같은 파일이면 rerun 마다 재파싱하지 않음
     try:
-        xls = pd.ExcelFile(file)
+        sheet_names = workbook_cache.sheet_names(file)
     except Exception as e:
         st.error(f"{label} 파일 읽기 오류: {e}")
         return None
 
     sheet = st.selectbox(
         f"{label} 시트 선택",
-        xls.sheet_names,
+        sheet_names,
         key=f"{label}_sheet"
     )
 
     try:
-        df = pd.read_excel(xls, sheet)
+        df = workbook_cache.read_sheet(file, sheet)
     except Exception as e:
         st.error(f"{label} 시트 로드 오류: {e}")
         return None
@@ -63,6 +108,68 @@ def load_excel_sheet(file, label: str) -> Optional[pd.DataFrame]:
     return df
 
 
+# ------------------------------------------------------
+# 설정 변경 → 워크북 캐시 재설정
+# ------------------------------------------------------
+def apply_cache_settings(settings: dict) -> None:
+    """settings.json 의 workbook_cache_dir 을 공용 워크북 캐시에 반영"""
+    configure_workbook_cache(spill_dir=settings.get("workbook_cache_dir"))
+
+
+# import 시 1회 적용 + 이후 설정이 바뀔 때마다 (설정 페이지 저장 / 파일 직접 수정) 다시 적용
+apply_cache_settings(load_settings())
+subscribe_settings(apply_cache_settings)
+
+
+# ------------------------------------------------------
+# 백그라운드 ZIP 작업 현황
+# ------------------------------------------------------
+def job_owner() -> str:
+    """세션별 작업 소유자 ID (자기 세션의 작업만 목록에 표시)"""
+    if "job_owner" not in st.session_state:
+        st.session_state["job_owner"] = uuid.uuid4().hex
+    return st.session_state["job_owner"]
+
+
+def _zip_reader(path: str):
+    """download_button 용 지연 읽기 (클릭 시에만 호출됨)"""
+    def read() -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+    return read
+
+
+@st.fragment(run_every=2)
+def render_job_panel():
+    """2초마다 이 영역만 다시 그려 진행률을 폴링 (페이지 전체 rerun 없음)"""
+    jobs = get_job_runner().list_jobs(job_owner())
+    if not jobs:
+        st.caption("등록된 작업이 없습니다.")
+        return
+
+    for job in jobs:
+        label = f"{job.file_name} · {job.done}/{job.total}건"
+
+        if job.status == STATUS_DONE:
+            expires = time.strftime("%H:%M", time.localtime(job.expires_at))
+            # 폴링마다 ZIP 을 읽지 않도록, 파일은 다운로드를 누를 때만 읽는다
+            st.download_button(
+                f"📥 {label} · {job.bytes / 1024 / 1024:.1f}MB (만료 {expires})",
+                data=_zip_reader(job.result_path),
+                file_name=job.file_name,
+                mime="application/zip",
+                key=f"job_{job.job_id}",
+            )
+        elif job.status == STATUS_FAILED:
+            st.error(f"{label} 실패: {job.error}")
+        else:
+            speed = f"{job.pdfs_per_sec:.1f}건/초" if job.pdfs_per_sec else "-"
+            st.progress(
+                job.progress,
+                text=f"⏳ {label} · {speed} · 남은 시간 {format_eta(job.eta_seconds)}",
+            )
+
+
 # ------------------------------------------------------
 # Settlement Page
 # ------------------------------------------------------
@@ -93,18 +200,20 @@ def settlement_page():
     # --------------------------------------------------
     st.subheader("2️⃣ 시트 선택")
 
+    settings = load_settings()  # 변경됐으면 여기서 구독자(apply_cache_settings)가 호출됨
+
     kakao_df = load_excel_sheet(kakao_file, "카카오 정산")
     if kakao_df is None:
         return
 
-    master_xls = pd.ExcelFile(master_file)
+    master_sheets = workbook_cache.sheet_names(master_file)
 
-    rates_sheet = st.selectbox("발송료 시트 선택", master_xls.sheet_names, key="rates")
-    rates_df = pd.read_excel(master_xls, rates_sheet)
+    rates_sheet = st.selectbox("발송료 시트 선택", master_sheets, key="rates")
+    rates_df = workbook_cache.read_sheet(master_file, rates_sheet)
     st.success(f"발송료 시트 '{rates_sheet}' 로드 완료")
 
-    drafts_sheet = st.selectbox("기안자료 시트 선택", master_xls.sheet_names, key="drafts")
-    drafts_df = pd.read_excel(master_xls, drafts_sheet)
+    drafts_sheet = st.selectbox("기안자료 시트 선택", master_sheets, key="drafts")
+    drafts_df = workbook_cache.read_sheet(master_file, drafts_sheet)
     st.success(f"기안자료 시트 '{drafts_sheet}' 로드 완료")
 
     st.write("---")
@@ -119,33 +228,51 @@ def settlement_page():
     drafts_df = normalize_dataframe_columns(drafts_df)
 
     # 강제 컬럼명 맵핑
-    col_fix = {
-        "settleid": "settleid",
-        "카카오settleid": "settleid",
-        "카카오settlid": "settleid",
-        "id": "settleid",
-        "기관명": "기관명",
-        "기관": "기관명",
-    }
-
-    fixed_cols = {}
-    for c in rates_df.columns:
-        if c in col_fix:
-            fixed_cols[c] = col_fix[c]
-    rates_df.rename(columns=fixed_cols, inplace=True)
+    rates_df = apply_col_fix(rates_df)
 
     # 카카오 DF에서도 동일하게
-    fixed_cols = {}
-    for c in kakao_df.columns:
-        if c in col_fix:
-            fixed_cols[c] = col_fix[c]
-    kakao_df.rename(columns=fixed_cols, inplace=True)
+    kakao_df = apply_col_fix(kakao_df)
+
+    # 기관명/settleid/중계자 등 반복 문자열 → 공통 카테고리 (메모리 · groupby 절감)
+    frames, memory_report = categorize_frames(
+        {"카카오": kakao_df, "발송료": rates_df, "기안자료": drafts_df}
+    )
+    kakao_df, rates_df, drafts_df = frames["카카오"], frames["발송료"], frames["기안자료"]
 
     st.success("정규화 완료 → Settle ID 자동 매칭 OK")
 
+    # settleid / 기관명 → 행 위치 인덱스 (업로드 파일+시트 당 1회 생성)
+    master_digest = workbook_cache.digest(master_file)
+    rates_index = workbook_cache.get_or_load(
+        master_digest,
+        ("settlement_index", rates_sheet),
+        lambda: SettlementIndex(rates_df),
+    )
+
+    # 작업 계측용: 업로드 파일을 처음 파싱할 때 걸린 시간 (캐시 적중이어도 원래 값)
+    xlsx_parse_seconds = (
+        workbook_cache.load_seconds(
+            workbook_cache.digest(kakao_file),
+            ("sheet", st.session_state.get("카카오 정산_sheet")),
+        )
+        + workbook_cache.load_seconds(master_digest, ("sheet", rates_sheet))
+        + workbook_cache.load_seconds(master_digest, ("sheet", drafts_sheet))
+    )
+
     with st.expander("정규화 결과 확인"):
         st.write("카카오 DF 컬럼:", list(kakao_df.columns))
         st.write("발송료 DF 컬럼:", list(rates_df.columns))
+        st.write("category 변환 전/후 메모리")
+        st.dataframe(memory_report, use_container_width=True)
+
+    # PDF 는 이미 압축된 포맷이라 기본은 무압축(store)
+    zip_compression = st.radio(
+        "ZIP 압축 방식",
+        ["store", "deflate"],
+        index=0 if settings.get("zip_compression", "store") == "store" else 1,
+        format_func=lambda x: "무압축 (빠름)" if x == "store" else "압축 (deflate)",
+        horizontal=True,
+    )
 
     st.write("---")
 
@@ -182,34 +309,38 @@ def settlement_page():
             if not selected_ids:
                 st.warning("선택된 기관이 없습니다.")
             else:
-                zip_buf = io.BytesIO()
-                with zipfile.ZipFile(zip_buf, "w") as zipf:
+                # 행 조회 · 청구 데이터 구성 시간은 lookup 단계로 계측
+                metrics = BatchMetrics()
+                metrics.stages["xlsx_parse"] = xlsx_parse_seconds
+                with metrics.stage("lookup"):
+                    # 선택된 ID 전체의 summary + detail 을 groupby 한 번으로 생성
+                    invoices = build_kakao_invoices(kakao_df, selected_ids, rates_index)
+
+                    jobs = []
                     for sid in selected_ids:
-                        row = rates_df[rates_df["settleid"] == sid].iloc[0]
+                        row = rates_index.first_row_for_settle_id(sid)
                         org_name = row.get("기관명", f"기관_{sid}")
-
-                        # summary + detail
-                        from app.pages.settlement_page import (
-                            build_kakao_summary_row,
-                            build_kakao_detail_df,
+                        summary_row, detail_df = invoices[str(sid)]
+
+                        jobs.append(
+                            KakaoPdfJob(
+                                filename=f"{org_name}_{sid}.pdf",
+                                org_name=org_name,
+                                settle_id=sid,
+                                summary_row=summary_row,
+                                detail_df=detail_df,
+                            )
                         )
-                        summary_row = build_kakao_summary_row(kakao_df, rates_df, sid)
-                        detail_df = build_kakao_detail_df(kakao_df, sid)
-
-                        # temp PDF
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                            pdf_path = tmp.name
 
-                        generate_kakao_pdf(pdf_path, org_name, sid, summary_row, detail_df)
-
-                        with open(pdf_path, "rb") as f:
-                            zipf.writestr(f"{org_name}_{sid}.pdf", f.read())
-
-                st.download_button(
-                    "📥 ZIP 다운로드",
-                    data=zip_buf.getvalue(),
-                    file_name="kakao_single_pdf.zip"
+                # 생성은 백그라운드 작업으로 — 아래 '작업 현황'에서 진행률 확인 후 다운로드
+                get_job_runner().submit_kakao(
+                    job_owner(),
+                    jobs,
+                    compression=zip_compression,
+                    pdf_workers=settings.get("pdf_workers"),
+                    metrics=metrics,
                 )
+                st.success(f"{len(jobs)}건 PDF 생성 작업을 등록했습니다.")
 
     st.write("---")
 
@@ -230,25 +361,198 @@ def settlement_page():
     if select_all_org:
         selected_orgs = org_list
 
+    # 기관 담당자 DB (파일이 바뀌지 않으면 캐시 재사용)
+    try:
+        partners = load_partner_directory(settings.get("partner_db_path"))
+    except Exception as e:
+        partners = None
+        st.warning(f"기관 담당자 DB 읽기 오류 (담당자 정보 없이 진행): {e}")
+    else:
+        if partners is None:
+            st.caption("기관 담당자 DB 파일이 없어 담당자 정보를 표시하지 않습니다.")
+
+    if partners is not None and selected_orgs:
+        with st.expander(f"선택 기관 담당자 ({len(selected_orgs)}곳)"):
+            st.dataframe(
+                partners.join(pd.DataFrame({"기관명": selected_orgs})),
+                use_container_width=True,
+            )
+            missing = partners.missing_orgs(selected_orgs)
+            if missing:
+                st.warning(f"담당자 DB에 없는 기관 {len(missing)}곳: {', '.join(missing[:20])}")
+
     if st.button("📦 다수기관 ZIP 다운로드"):
         if not selected_orgs:
             st.warning("선택된 기관이 없습니다.")
         else:
-            zip_buf = io.BytesIO()
-            with zipfile.ZipFile(zip_buf, "w") as zipf:
-                for org in selected_orgs:
-                    rows = rates_df[rates_df["기관명"] == org].copy()
+            metrics = BatchMetrics()
+            metrics.stages["xlsx_parse"] = xlsx_parse_seconds
+            with metrics.stage("lookup"):
+                items = [(f"{org}_다수기관.pdf", rates_index.rows_for_org(org)) for org in selected_orgs]
+            get_job_runner().submit_multi(job_owner(), items, compression=zip_compression, metrics=metrics)
+            st.success(f"{len(items)}건 PDF 생성 작업을 등록했습니다.")
 
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                        pdf_path = tmp.name
+    st.write("---")
 
-                    generate_multi_pdf(pdf_path, rows)
+    # --------------------------------------------------
+    # 작업 현황 (백그라운드 ZIP 생성)
+    # --------------------------------------------------
+    st.subheader("📋 PDF ZIP 작업 현황")
+    render_job_panel()
 
-                    with open(pdf_path, "rb") as f:
-                        zipf.writestr(f"{org}_다수기관.pdf", f.read())
+    st.write("---")
 
-            st.download_button(
-                "📥 ZIP 다운로드",
-                data=zip_buf.getvalue(),
-                file_name="multi_org_pdf.zip"
-            )
+    # --------------------------------------------------
+    # 6) 연간 대사 (월별 카카오 통계 N개 ↔ 발송료 1월~12월)
+    # --------------------------------------------------
+    st.subheader("6️⃣ 연간 대사 (월별 카카오 통계 일괄 비교)")
+
+    monthly_files = st.file_uploader(
+        "월별 카카오 통계 엑셀 (파일명에 '3월' / '2025-03' 등 월 표기)",
+        type=["xlsx"],
+        accept_multiple_files=True,
+        key="monthly_kakao",
+    )
+
+    if monthly_files and st.button("🔍 연간 대사 실행"):
+        # 헤더(첫 행)만 읽어 카카오 통계가 아닌 파일은 전체 로드 전에 제외
+        # (월별 로더는 첫 시트를 읽으므로 파일별 첫 시트의 분류 기준)
+        first_sheet_company = {}
+        for c in classify_headers({f.name: f.getvalue() for f in monthly_files}):
+            first_sheet_company.setdefault(c["filename"], c["company"])
+        kakao_names = {name for name, company in first_sheet_company.items() if company == "kakao"}
+
+        by_month = {}
+        for f in monthly_files:
+            if f.name not in kakao_names:
+                st.warning(f"카카오 통계 형식이 아닌 파일은 제외: {f.name}")
+                continue
+            month = guess_month(f.name)
+            if month is None:
+                st.warning(f"월을 알 수 없는 파일은 제외: {f.name}")
+                continue
+            by_month.setdefault(month, []).append(f.getvalue())
+
+        # 같은 월로 판별된 파일이 여러 개면 덮어쓰지 않고 합산
+        for month, parts in sorted(by_month.items()):
+            if len(parts) > 1:
+                st.info(f"{month}월 파일 {len(parts)}개를 합산합니다.")
+
+        monthly = load_monthly_files(by_month, workers=settings.get("load_workers"))
+        monthly = {
+            m: apply_col_fix(normalize_dataframe_columns(df))
+            for m, df in monthly.items()
+        }
+
+        result = MultiMonthReconciler(
+            rates_df,
+            kakao_key="settleid",
+            master_key="settleid",
+        ).reconcile(monthly)
+
+        counts = result.counts()
+        c1, c2, c3 = st.columns(3)
+        c1.metric("누락 셀", counts["누락"])
+        c2.metric("초과 셀", counts["초과"])
+        c3.metric("금액불일치 셀", counts["금액불일치"])
+
+        st.dataframe(result.cells, use_container_width=True)
+
+    st.write("---")
+
+    # --------------------------------------------------
+    # 7) 중계사(KT/네이버) 통계 집계 ↔ 발송료 중계자 배정
+    # --------------------------------------------------
+    st.subheader("7️⃣ KT · 네이버 통계 집계 (중계자 배정 대조)")
+
+    carrier_files = st.file_uploader(
+        "KT / 네이버 통계 엑셀 (여러 개 가능, 형식은 헤더로 자동 판별)",
+        type=["xlsx"],
+        accept_multiple_files=True,
+        key="carrier_stats",
+    )
+
+    if carrier_files and st.button("📊 중계사 통계 집계"):
+        loaded = classify_files(
+            {f.name: f.getvalue() for f in carrier_files},
+            companies=["kt", "naver"],
+        )
+        if not loaded:
+            st.warning("KT / 네이버 형식의 시트를 찾지 못했습니다.")
+        else:
+            stats = CarrierStats()
+            for item in loaded:
+                try:
+                    stats.add(item["company"], item["df"], month=guess_month(item["filename"]))
+                except ValueError as e:
+                    st.warning(f"{item['filename']} / {item['sheet']}: {e}")
+
+            joined = stats.join_master(rates_df)
+            status_counts = joined["상태"].value_counts()
+            c1, c2, c3 = st.columns(3)
+            c1.metric("정상", int(status_counts.get("정상", 0)))
+            c2.metric("미배정", int(status_counts.get("미배정", 0)))
+            c3.metric("통계없음", int(status_counts.get("통계없음", 0)))
+
+            st.dataframe(joined, use_container_width=True)
+
+            with st.expander("기관 × 월 발송량"):
+                st.dataframe(stats.monthly_matrix("발송"), use_container_width=True)
+
+    st.write("---")
+
+    # --------------------------------------------------
+    # 8) 요율표 기반 재계산 ↔ 기안자료 금액 대조
+    # --------------------------------------------------
+    st.subheader("8️⃣ 요율표 기반 금액 재계산 (기안자료 대조)")
+
+    rate_table_path = settings.get("rate_table_path", "")
+    try:
+        rate_table = load_rate_table(rate_table_path)
+    except Exception as e:
+        st.error(f"요율표 읽기 오류: {rate_table_path} ({e})")
+        return
+    if rate_table is None:
+        st.info(f"요율표 파일이 없습니다: {rate_table_path} (설정 페이지에서 경로 지정)")
+        return
+
+    st.caption(f"요율표: {rate_table_path} · 규칙 {rate_table.rule_count}건")
+
+    # 통계에 일자가 없으면 정산월 1일 기준 요율 적용 (오늘 요율이 아님)
+    as_of = None
+    if not has_stats_dates(kakao_df):
+        last_month = pd.Timestamp.today().normalize().replace(day=1) - pd.offsets.MonthBegin(1)
+        default_month = guess_month(kakao_file.name) or last_month.month
+        c1, c2 = st.columns(2)
+        as_of_year = c1.number_input("정산 연도", 2000, 2100, last_month.year, key="rate_as_of_year")
+        as_of_month = c2.selectbox(
+            "정산 월", list(range(1, 13)), index=default_month - 1, key="rate_as_of_month"
+        )
+        as_of = pd.Timestamp(year=int(as_of_year), month=int(as_of_month), day=1)
+        st.caption(f"통계에 일자 컬럼이 없어 {as_of:%Y-%m} 기준 요율로 계산합니다.")
+
+    if st.button("🧮 요율표로 금액 재계산"):
+        start = time.perf_counter()
+        priced = price_kakao_stats(
+            kakao_df, rate_table, org_map=settle_org_map(rates_df), as_of=as_of
+        )
+        org_summary = summarize_by_org(priced)
+        compared = check_against_drafts(org_summary, drafts_df)
+        elapsed = time.perf_counter() - start
+
+        status_counts = compared["상태"].value_counts()
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("일치", int(status_counts.get("일치", 0)))
+        c2.metric("불일치", int(status_counts.get("불일치", 0)))
+        c3.metric("기안없음", int(status_counts.get("기안없음", 0)))
+        c4.metric("계산없음", int(status_counts.get("계산없음", 0)))
+        st.caption(f"통계 {len(priced):,}행 계산 {elapsed:.2f}초")
+
+        unpriced = int((~priced["요율있음"]).sum())
+        if unpriced:
+            st.warning(f"요율을 찾지 못한 통계 행 {unpriced:,}건 (금액 0 처리)")
+
+        st.dataframe(compared, use_container_width=True)
+
+        with st.expander("행별 계산 내역"):
+            st.dataframe(priced, use_container_width=True)
@@ -0,0 +1,89 @@
+import tempfile
+import zipfile
+from typing import Literal
+
+# -------------------------------------------------------
+# 대량 PDF → ZIP 스트리밍 아카이브
+#   ZIP 전체를 BytesIO 에 만든 뒤 getvalue() 로 한 번 더 복사하는 대신,
+#   항목을 하나씩 SpooledTemporaryFile 에 기록한다.
+#   (spool_size 를 넘으면 자동으로 디스크 임시파일로 넘어감)
+# -------------------------------------------------------
+
+Compression = Literal["store", "deflate"]
+
+_COMPRESSION = {
+    "store": zipfile.ZIP_STORED,      # PDF 는 이미 압축되어 있어 대부분 이 쪽이 빠름
+    "deflate": zipfile.ZIP_DEFLATED,
+}
+
+
+class ZipArchiveBuilder:
+    """
+    사용 예:
+        with ZipArchiveBuilder(compression="store") as archive:
+            for name, pdf in ...:
+                archive.writestr(name, pdf)
+        st.download_button(..., data=archive.read_bytes())
+
+    writestr 를 제공하므로 zipfile.ZipFile 자리에 그대로 넘길 수 있다.
+    """
+
+    def __init__(self, compression: Compression = "store", spool_size: int = 16 * 1024 * 1024):
+        if compression not in _COMPRESSION:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+
+        self.compression = compression
+        self.file = tempfile.SpooledTemporaryFile(max_size=spool_size, suffix=".zip")
+        self._zip = zipfile.ZipFile(self.file, "w", compression=_COMPRESSION[compression])
+        self.count = 0
+        self.bytes_written = 0
+
+    def writestr(self, name: str, data: bytes):
+        self._zip.writestr(name, data)
+        self.count += 1
+        self.bytes_written += len(data)
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        self.file.seek(0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is not None:
+            self.file.close()
+        return False
+
+    @property
+    def size(self) -> int:
+        pos = self.file.tell()
+        self.file.seek(0, 2)
+        end = self.file.tell()
+        self.file.seek(pos)
+        return end
+
+    def read_bytes(self) -> bytes:
+        """완성된 ZIP 을 다운로드용 bytes 로 한 번만 읽는다."""
+        self.close()
+        data = self.file.read()
+        self.file.seek(0)
+        return data
+
+    def save_to(self, path: str, chunk_size: int = 1024 * 1024):
+        """완성된 ZIP 을 파일로 청크 단위 복사 (메모리에 전체를 올리지 않음)."""
+        self.close()
+        with open(path, "wb") as out:
+            while True:
+                chunk = self.file.read(chunk_size)
+                if not chunk:
+                    break
+                out.write(chunk)
+        self.file.seek(0)
+
+    def discard(self):
+        self.close()
+        self.file.close()
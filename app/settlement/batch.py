@@ -0,0 +1,97 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from app.settlement.metrics import BatchMetrics, stage_timer
+from app.settlement.pdf_generator import generate_kakao_pdf
+
+
+# -------------------------------------------------------
+# 카카오 단일기관 PDF 일괄 생성 (프로세스 풀)
+# -------------------------------------------------------
+
+@dataclass
+class KakaoPdfJob:
+    """PDF 1건 생성에 필요한 입력 (워커 프로세스로 pickle 되어 전달됨)."""
+    filename: str            # ZIP 안에서의 파일명
+    org_name: str
+    settle_id: str
+    summary_row: dict        # 발송료/인증료/부가세/총금액
+    detail_df: pd.DataFrame
+
+
+def default_workers() -> int:
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _render_kakao(job: KakaoPdfJob) -> Tuple[bytes, Dict[str, float]]:
+    """워커에서 실행: 디스크를 거치지 않고 PDF 바이트 + 단계별 시간을 반환."""
+    timings: Dict[str, float] = {}
+    pdf = generate_kakao_pdf(
+        None, job.org_name, job.settle_id, job.summary_row, job.detail_df, timings=timings
+    )
+    return pdf, timings
+
+
+def render_kakao_pdfs(
+    jobs: Iterable[KakaoPdfJob],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    metrics: Optional[BatchMetrics] = None,
+) -> Iterator[Tuple[KakaoPdfJob, bytes]]:
+    """
+    (job, pdf_bytes) 를 jobs 순서 그대로 yield.
+    - workers=None : CPU 수 - 1
+    - workers<=1   : 현재 프로세스에서 순차 생성 (풀 생성 비용 없음)
+    - chunksize    : 워커에 한 번에 넘기는 건수 (None 이면 워커당 약 4묶음)
+    - metrics      : 넘기면 워커에서 잰 PDF 단계 시간 · 건수 · 바이트를 누적
+    executor.map 은 앞 순서 결과가 준비되는 즉시 돌려주므로
+    호출 측은 결과가 나오는 대로 ZIP 에 기록하면서도 순서는 결정적이다.
+    """
+    jobs: List[KakaoPdfJob] = list(jobs)
+    if workers is None:
+        workers = default_workers()
+    workers = min(workers, len(jobs)) if jobs else 1
+
+    def _collect(job, result):
+        pdf, timings = result
+        if metrics is not None:
+            metrics.merge(timings)
+            metrics.add_pdf(len(pdf))
+        return job, pdf
+
+    if workers <= 1:
+        for job in jobs:
+            yield _collect(job, _render_kakao(job))
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(jobs) // (workers * 4))
+
+    # JobRunner 스레드 · Streamlit 스크립트 스레드에서 호출되므로 fork 금지
+    # (다른 스레드가 잡고 있던 락이 자식에 복사돼 교착될 수 있음)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as ex:
+        for job, result in zip(jobs, ex.map(_render_kakao, jobs, chunksize=chunksize)):
+            yield _collect(job, result)
+
+
+def write_kakao_zip(
+    zipf,
+    jobs: Iterable[KakaoPdfJob],
+    workers: Optional[int] = None,
+    metrics: Optional[BatchMetrics] = None,
+) -> int:
+    """
+    열린 zipfile.ZipFile 에 PDF 를 생성되는 대로 기록한다.
+    반환값: 기록한 PDF 수
+    """
+    count = 0
+    for job, pdf in render_kakao_pdfs(jobs, workers=workers, metrics=metrics):
+        with stage_timer(metrics.stages if metrics else None, "zip_write"):
+            zipf.writestr(job.filename, pdf)
+        count += 1
+    return count
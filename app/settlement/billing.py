@@ -0,0 +1,325 @@
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.settlement.parsing import resolve_gubun_series
+from app.settlement.utils import find_column, to_dates
+
+
+# -------------------------------------------------------
+# 요율표(rate_table.xlsx) 기반 정산 계산기
+#   요율표를 한 번 읽어 (기관명, 중계자, 문서유형) 구체성 단계별로
+#   적용시작일 정렬 프레임을 만들어 두고,
+#   통계 행의 단가는 merge_asof(단계별 1회)로, 금액은 NumPy 배열 연산으로 계산한다.
+#
+# 요율표 컬럼
+#   기관명 / 중계자 / 문서유형 : 비어 있으면 '전체'에 적용
+#   적용시작일                 : 비어 있으면 처음부터 적용
+#   발송단가 / 인증단가         : 건당 단가(원)
+#   OTT단가                    : 없으면 인증단가 사용
+#   부가세율                   : 없으면 0.1
+# -------------------------------------------------------
+
+KEY_COLS = ["기관명", "중계자", "문서유형"]
+PRICE_COLS = ["발송단가", "인증단가", "OTT단가", "부가세율"]
+DEFAULT_VAT_RATE = 0.1
+MIN_DATE = pd.Timestamp("1900-01-01")
+
+# 구체적인 규칙부터 적용 (기관+중계자+문서유형 → … → 전체 기본값)
+LEVELS: Tuple[Tuple[str, ...], ...] = (
+    ("기관명", "중계자", "문서유형"),
+    ("기관명", "중계자"),
+    ("기관명", "문서유형"),
+    ("기관명",),
+    ("중계자", "문서유형"),
+    ("중계자",),
+    ("문서유형",),
+    (),
+)
+
+# 카카오 통계 컬럼 후보 (원본명 / settlement_page 정규화명 모두 매칭)
+STATS_SETTLE_CANDIDATES = ["Settle ID", "settleid", "카카오 settle id"]
+STATS_ORG_CANDIDATES = ["기관명"]
+STATS_DATE_CANDIDATES = ["일자", "날짜", "발송일", "발송일자"]
+STATS_DOC_CANDIDATES = ["문서유형", "문서명", "서비스명"]
+STATS_COUNT_CANDIDATES = {
+    "발송건수": ["알림 수신 건수"],
+    "인증건수": ["열람 시 인증 건수"],
+    "OTT건수": ["OTT검증 건수"],
+}
+
+STATUS_MATCH = "일치"
+STATUS_MISMATCH = "불일치"
+STATUS_NO_DRAFT = "기안없음"
+STATUS_NO_CALC = "계산없음"
+
+
+def _clean(s: pd.Series) -> pd.Series:
+    s = s.astype(object)
+    return s.where(s.notna(), "").astype(str).str.strip()
+
+
+class RateTable:
+    """
+    요율표 → 구체성 단계별 정렬 프레임.
+    lookup() 은 (기관명, 중계자, 문서유형, 일자) 고유 조합마다
+    가장 구체적인 단계에서, 일자 이전 가장 최근 적용시작일의 규칙을 찾는다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        rules = pd.DataFrame(index=df.index)
+        for col in KEY_COLS:
+            src = find_column(df, [col])
+            rules[col] = _clean(df[src]) if src else ""
+
+        start = find_column(df, ["적용시작일"])
+        dates = to_dates(df[start]) if start else pd.Series(pd.NaT, index=df.index)
+        rules["적용시작일"] = dates.fillna(MIN_DATE).astype("datetime64[ns]")
+
+        for col in PRICE_COLS:
+            src = find_column(df, [col])
+            rules[col] = pd.to_numeric(df[src], errors="coerce") if src else np.nan
+        rules["OTT단가"] = rules["OTT단가"].fillna(rules["인증단가"])
+        rules["부가세율"] = rules["부가세율"].fillna(DEFAULT_VAT_RATE)
+        rules[["발송단가", "인증단가", "OTT단가"]] = rules[["발송단가", "인증단가", "OTT단가"]].fillna(0.0)
+
+        # 규칙이 지정한 키 조합 = 단계
+        filled = rules[KEY_COLS].ne("")
+        self.levels: Dict[Tuple[str, ...], pd.DataFrame] = {}
+        for level in LEVELS:
+            mask = np.ones(len(rules), dtype=bool)
+            for col in KEY_COLS:
+                mask &= filled[col].to_numpy() == (col in level)
+            part = rules.loc[mask, [*level, "적용시작일", *PRICE_COLS]]
+            if len(part):
+                self.levels[level] = part.sort_values("적용시작일", kind="stable").reset_index(drop=True)
+
+        self.rule_count = len(rules)
+
+    @classmethod
+    def from_excel(cls, path: str, sheet_name=0) -> "RateTable":
+        return cls(pd.read_excel(path, sheet_name=sheet_name))
+
+    def lookup(self, keys: pd.DataFrame) -> pd.DataFrame:
+        """
+        keys: [기관명, 중계자, 문서유형, 일자] (행 수 N)
+        반환: keys.index 에 맞춘 [발송단가, 인증단가, OTT단가, 부가세율, 요율단계]
+        규칙을 못 찾은 행은 단가 NaN, 요율단계 ''.
+        """
+        # 같은 조합이 수만 행 반복되므로 고유 조합만 조회
+        #   (groupby.ngroup → 등장 순서 조합 코드, 정수 키 곱셈이 없어 overflow 없음)
+        codes = keys.groupby(KEY_COLS + ["일자"], sort=False, dropna=False).ngroup().to_numpy()
+        _, first = np.unique(codes, return_index=True)
+
+        uniq = keys.iloc[first][KEY_COLS + ["일자"]].reset_index(drop=True)
+        uniq["일자"] = uniq["일자"].fillna(pd.Timestamp.max.normalize()).astype("datetime64[ns]")
+        uniq["_pos"] = np.arange(len(uniq))
+
+        result = pd.DataFrame(np.nan, index=uniq.index, columns=PRICE_COLS)
+        level_name = np.full(len(uniq), "", dtype=object)
+        pending = uniq.sort_values("일자", kind="stable")
+
+        for level, rules in self.levels.items():
+            if pending.empty:
+                break
+            matched = pd.merge_asof(
+                pending,
+                rules,
+                left_on="일자",
+                right_on="적용시작일",
+                by=list(level) or None,
+                direction="backward",
+            )
+            hit = matched["발송단가"].notna().to_numpy()
+            pos = matched.loc[hit, "_pos"].to_numpy()
+            result.iloc[pos] = matched.loc[hit, PRICE_COLS].to_numpy()
+            level_name[pos] = "+".join(level) or "기본"
+            pending = pending[~np.isin(pending["_pos"].to_numpy(), pos)]
+
+        out = pd.DataFrame(result.to_numpy()[codes], index=keys.index, columns=PRICE_COLS)
+        out["요율단계"] = level_name[codes]
+        return out
+
+
+# -------------------------------------------------------
+# 요율표 로드 (경로 + 수정시각 기준 캐시)
+# -------------------------------------------------------
+
+_rate_cache: Dict[str, Tuple[float, RateTable]] = {}
+_rate_lock = threading.Lock()
+
+
+def load_rate_table(path: str) -> Optional[RateTable]:
+    """파일이 없으면 None. 같은 파일이 바뀌지 않았으면 다시 읽지 않는다."""
+    if not path or not os.path.exists(path):
+        return None
+
+    mtime = os.path.getmtime(path)
+    with _rate_lock:
+        cached = _rate_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    table = RateTable.from_excel(path)
+    with _rate_lock:
+        _rate_cache[path] = (mtime, table)
+    return table
+
+
+# -------------------------------------------------------
+# 카카오 통계 금액 계산
+# -------------------------------------------------------
+
+def settle_org_map(rates_df: pd.DataFrame) -> pd.Series:
+    """발송료 시트 카카오 settle id → 기관명 (중복 시 첫 행)"""
+    sid_col = find_column(rates_df, ["카카오 settle id", "settleid"])
+    org_col = find_column(rates_df, ["기관명"])
+    if sid_col is None or org_col is None:
+        return pd.Series(dtype=object)
+
+    sid = _clean(rates_df[sid_col])
+    mapping = pd.Series(_clean(rates_df[org_col]).to_numpy(), index=sid.to_numpy())
+    mapping = mapping[mapping.index != ""]
+    return mapping[~mapping.index.duplicated()]
+
+
+def has_stats_dates(kakao_df: pd.DataFrame) -> bool:
+    """통계에 일자 컬럼이 있는지 (없으면 price_kakao_stats 에 as_of 필요)"""
+    return find_column(kakao_df, STATS_DATE_CANDIDATES) is not None
+
+
+def price_kakao_stats(
+    kakao_df: pd.DataFrame,
+    rate_table: RateTable,
+    org_map: Optional[pd.Series] = None,
+    carrier: str = "카카오",
+    as_of: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    카카오 통계 행마다 발송료 / 인증료 / 부가세 / 총금액 계산.
+    - 기관명: 통계에 기관명 컬럼이 없으면 org_map(settle id → 기관명)으로 채움
+    - 일자  : 일자 컬럼이 없으면 as_of (정산월 기준일) — 이때 as_of 는 필수.
+              오늘 날짜로 대신하면 지난 달 통계에 오늘 요율이 적용되므로 ValueError
+    - 금액은 원 단위 소수까지 유지 (합산 후 summarize_by_org 에서 절사)
+    """
+    index = kakao_df.index
+
+    sid_col = find_column(kakao_df, STATS_SETTLE_CANDIDATES)
+    sid = _clean(kakao_df[sid_col]) if sid_col else pd.Series("", index=index, dtype=object)
+
+    org_col = find_column(kakao_df, STATS_ORG_CANDIDATES)
+    if org_col is not None:
+        org = _clean(kakao_df[org_col])
+    elif org_map is not None:
+        org = sid.map(org_map).fillna("")
+    else:
+        org = pd.Series("", index=index, dtype=object)
+
+    date_col = find_column(kakao_df, STATS_DATE_CANDIDATES)
+    if date_col is not None:
+        dates = to_dates(kakao_df[date_col])
+    elif as_of is not None:
+        dates = pd.Series(pd.Timestamp(as_of).normalize(), index=index)
+    else:
+        raise ValueError("통계에 일자 컬럼이 없으면 as_of(정산 기준일)를 지정해야 합니다.")
+
+    doc_col = find_column(kakao_df, STATS_DOC_CANDIDATES)
+    doc = _clean(kakao_df[doc_col]) if doc_col else pd.Series("", index=index, dtype=object)
+
+    counts = {}
+    for name, candidates in STATS_COUNT_CANDIDATES.items():
+        col = find_column(kakao_df, candidates)
+        counts[name] = (
+            pd.to_numeric(kakao_df[col], errors="coerce").fillna(0).to_numpy(dtype=float)
+            if col else np.zeros(len(index))
+        )
+
+    prices = rate_table.lookup(
+        pd.DataFrame({"기관명": org, "중계자": carrier, "문서유형": doc, "일자": dates}, index=index)
+    )
+    has_rate = prices["발송단가"].notna().to_numpy()
+    p = prices[PRICE_COLS].fillna(0).to_numpy(dtype=float)
+
+    send_fee = counts["발송건수"] * p[:, 0]
+    auth_fee = counts["인증건수"] * p[:, 1] + counts["OTT건수"] * p[:, 2]
+    vat = (send_fee + auth_fee) * p[:, 3]
+
+    return pd.DataFrame(
+        {
+            "기관명": org,
+            "settle_id": sid,
+            "일자": dates,
+            **counts,
+            "발송료": send_fee,
+            "인증료": auth_fee,
+            "부가세": vat,
+            "총금액": send_fee + auth_fee + vat,
+            "요율단계": prices["요율단계"],
+            "요율있음": has_rate,
+        },
+        index=index,
+    )
+
+
+def summarize_by_org(priced: pd.DataFrame) -> pd.DataFrame:
+    """기관별 합계 (원 미만 절사)"""
+    amounts = ["발송료", "인증료", "부가세"]
+    summary = priced.groupby("기관명", sort=True)[amounts].sum()
+    summary = np.floor(summary).astype("int64")
+    summary["총금액"] = summary[amounts].sum(axis=1)
+    summary["요율없음건수"] = (~priced["요율있음"]).groupby(priced["기관명"], sort=True).sum().astype("int64")
+    return summary.reset_index()
+
+
+def check_against_drafts(
+    org_summary: pd.DataFrame,
+    drafts_df: pd.DataFrame,
+    tolerance: int = 0,
+) -> pd.DataFrame:
+    """
+    계산 결과(summarize_by_org) ↔ 기안자료 기관별 금액 대조.
+    기안자료 기관명은 '구분'(기관명(청구명))에서 파싱, 총액은 정산금액 → 금액 순으로 사용.
+    """
+    gubun_col = find_column(drafts_df, ["구분"])
+    if gubun_col is None:
+        raise ValueError("기안자료에 '구분' 컬럼이 없습니다.")
+
+    gubun = _clean(drafts_df[gubun_col])
+    gubun = gubun[gubun != ""]
+    org = resolve_gubun_series(gubun)["org_name"]
+
+    def _amount(candidates):
+        col = find_column(drafts_df, candidates)
+        if col is None:
+            return pd.Series(0.0, index=gubun.index)
+        return pd.to_numeric(drafts_df.loc[gubun.index, col], errors="coerce").fillna(0)
+
+    drafts = pd.DataFrame(
+        {
+            "기관명": org,
+            "기안발송료": _amount(["발송료"]),
+            "기안인증료": _amount(["인증료"]),
+            "기안부가세": _amount(["부가세"]),
+            "기안총금액": _amount(["정산금액", "금액"]),
+        }
+    ).groupby("기관명", sort=True).sum().round().astype("int64").reset_index()
+
+    merged = org_summary.merge(drafts, on="기관명", how="outer", indicator=True)
+    value_cols = ["발송료", "인증료", "부가세", "총금액", "기안발송료", "기안인증료", "기안부가세", "기안총금액", "요율없음건수"]
+    merged[value_cols] = merged[value_cols].fillna(0).astype("int64")
+    merged["차이"] = merged["총금액"] - merged["기안총금액"]
+
+    both = merged["_merge"].eq("both").to_numpy()
+    merged["상태"] = np.select(
+        [
+            both & (merged["차이"].abs() <= tolerance).to_numpy(),
+            both,
+            merged["_merge"].eq("left_only").to_numpy(),
+        ],
+        [STATUS_MATCH, STATUS_MISMATCH, STATUS_NO_DRAFT],
+        default=STATUS_NO_CALC,
+    )
+    return merged.drop(columns="_merge")
@@ -0,0 +1,235 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+from app.settlement.uploader import MasterData, load_master_workbook
+
+
+# -------------------------------------------------------
+# 업로드 파일 → SHA-256 (캐시 키)
+# -------------------------------------------------------
+
+def file_bytes(file_obj: BinaryIO) -> bytes:
+    """
+    Streamlit UploadedFile / BytesIO / 일반 파일 객체에서 전체 바이트를 꺼낸다.
+    읽은 뒤 커서는 처음으로 되돌린다.
+    """
+    if hasattr(file_obj, "getvalue"):
+        return file_obj.getvalue()
+
+    pos = file_obj.tell() if hasattr(file_obj, "tell") else 0
+    file_obj.seek(0)
+    data = file_obj.read()
+    file_obj.seek(pos)
+    return data
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def upload_key(file_obj: BinaryIO) -> Optional[Hashable]:
+    """
+    Streamlit UploadedFile 의 file_id (업로드마다 새로 발급) → 해시 생략용 키.
+    file_id 가 없는 객체(BytesIO 등)는 None → 매번 내용 해시.
+    """
+    file_id = getattr(file_obj, "file_id", None)
+    return ("file_id", file_id) if file_id else None
+
+
+# -------------------------------------------------------
+# 파싱된 워크북 캐시 (메모리 LRU + 선택적 디스크 spill)
+# -------------------------------------------------------
+
+class WorkbookCache:
+    """
+    (파일 내용 SHA-256, 시트명) → 파싱 결과 캐시.
+
+    - 메모리: OrderedDict 기반 LRU, max_entries 초과 시 가장 오래된 항목 제거
+    - spill_dir 지정 시: DataFrame 결과를 Parquet 로 저장해 두고,
+      메모리에서 밀려난 뒤에도 xlsx 재파싱 없이 다시 읽는다.
+      (pyarrow 등 Parquet 엔진이 없거나 저장 실패 시 메모리 캐시만 사용)
+
+    Streamlit 세션(스레드)들이 하나의 인스턴스를 공유하므로 lock 으로 보호한다.
+    캐시된 DataFrame 은 여러 rerun/세션이 공유하므로 호출 측에서 수정하지 않는다.
+    loader 실행(=실제 파싱)에 걸린 시간은 키별로 남겨 계측 레코드에 쓴다.
+    (LRU 에서 항목이 빠질 때 같이 삭제)
+
+    rerun 마다 업로드 전체를 SHA-256 하지 않도록 file_id → 해시를 따로 기억한다.
+    """
+
+    def __init__(self, max_entries: int = 32, spill_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self._entries: "OrderedDict[Tuple[str, Hashable], object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_seconds: Dict[Tuple[str, Hashable], float] = {}
+        self._digests: "OrderedDict[Hashable, str]" = OrderedDict()
+
+    # ---------------------------
+    # 메모리 LRU
+    # ---------------------------
+    def _get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return True, self._entries[key]
+        return False, None
+
+    def _put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._load_seconds.pop(old_key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._load_seconds.clear()
+            self._digests.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ---------------------------
+    # 디스크 spill (Parquet)
+    # ---------------------------
+    def _spill_path(self, key) -> Optional[Path]:
+        if self.spill_dir is None:
+            return None
+        digest, part = key
+        name = hashlib.sha256(f"{digest}:{part}".encode("utf-8")).hexdigest()
+        return self.spill_dir / f"{name}.parquet"
+
+    def _read_spill(self, key) -> Optional[pd.DataFrame]:
+        path = self._spill_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            return None
+
+    def _write_spill(self, key, df: pd.DataFrame):
+        path = self._spill_path(key)
+        if path is None:
+            return
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            df.to_parquet(tmp)
+            os.replace(tmp, path)
+        except Exception:
+            # 엔진 미설치 / 혼합 타입 컬럼 등 → 메모리 캐시만 사용
+            pass
+
+    # ---------------------------
+    # 공통 조회
+    # ---------------------------
+    def get_or_load(self, digest: str, part: Hashable, loader: Callable[[], object]):
+        """
+        캐시에 있으면 반환, 없으면 loader() 결과를 캐시에 넣고 반환.
+        DataFrame 결과만 디스크로 spill 한다.
+        """
+        key = (digest, part)
+
+        hit, value = self._get(key)
+        if hit:
+            return value
+
+        value = self._read_spill(key)
+        if value is None:
+            t0 = time.perf_counter()
+            value = loader()
+            with self._lock:
+                self._load_seconds[key] = time.perf_counter() - t0
+            if isinstance(value, pd.DataFrame):
+                self._write_spill(key, value)
+
+        self._put(key, value)
+        return value
+
+    def load_seconds(self, digest: str, part: Hashable) -> float:
+        """해당 항목을 처음 파싱할 때 걸린 시간(초). 기록이 없으면 0."""
+        return self._load_seconds.get((digest, part), 0.0)
+
+    # ---------------------------
+    # 업로드 파일 → 캐시 키
+    # ---------------------------
+    def digest(self, file_obj: BinaryIO) -> str:
+        """
+        업로드 파일의 SHA-256. 같은 file_id 로 다시 오면 해시를 다시 계산하지 않는다.
+        (file_id 기억 개수도 max_entries 로 제한)
+        """
+        upload = upload_key(file_obj)
+        if upload is not None:
+            with self._lock:
+                if upload in self._digests:
+                    self._digests.move_to_end(upload)
+                    return self._digests[upload]
+
+        digest = content_hash(file_bytes(file_obj))
+
+        if upload is not None:
+            with self._lock:
+                self._digests[upload] = digest
+                while len(self._digests) > self.max_entries:
+                    self._digests.popitem(last=False)
+        return digest
+
+    # ---------------------------
+    # 엑셀 전용 헬퍼 (바이트는 실제 파싱할 때만 꺼냄)
+    # ---------------------------
+    def sheet_names(self, file_obj: BinaryIO) -> List[str]:
+        return self.get_or_load(
+            self.digest(file_obj),
+            "__sheet_names__",
+            lambda: pd.ExcelFile(BytesIO(file_bytes(file_obj))).sheet_names,
+        )
+
+    def read_sheet(self, file_obj: BinaryIO, sheet_name: str) -> pd.DataFrame:
+        return self.get_or_load(
+            self.digest(file_obj),
+            ("sheet", sheet_name),
+            lambda: pd.read_excel(BytesIO(file_bytes(file_obj)), sheet_name=sheet_name),
+        )
+
+    def master_workbook(self, file_obj: BinaryIO) -> MasterData:
+        digest = self.digest(file_obj)
+
+        loaded: dict = {}
+
+        def _load(part: str) -> pd.DataFrame:
+            if not loaded:
+                loaded.update(load_master_workbook(BytesIO(file_bytes(file_obj)))._asdict())
+            return loaded[part]
+
+        return MasterData(
+            rates=self.get_or_load(digest, ("master", "rates"), lambda: _load("rates")),
+            drafts=self.get_or_load(digest, ("master", "drafts"), lambda: _load("drafts")),
+        )
+
+
+# 프로세스 전체에서 공유하는 기본 캐시
+workbook_cache = WorkbookCache()
+
+
+def configure_workbook_cache(max_entries: Optional[int] = None, spill_dir: Optional[str] = None):
+    """설정값(settings.json 등)으로 기본 캐시의 크기/spill 경로를 조정."""
+    if max_entries is not None:
+        workbook_cache.max_entries = max_entries
+    workbook_cache.spill_dir = Path(spill_dir) if spill_dir else None
+
+
+def load_master_workbook_cached(file_obj: BinaryIO) -> MasterData:
+    """uploader.load_master_workbook 의 캐시 버전."""
+    return workbook_cache.master_workbook(file_obj)
@@ -0,0 +1,226 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.settlement.utils import find_column, to_dates
+
+
+# -------------------------------------------------------
+# 중계사(카카오 / KT / 네이버) 통계 수집 엔진
+#   중계사별 원천 통계의 컬럼을 공통 지표(발송/수신/열람/인증)로 맞춘 뒤
+#   기관명 × 중계자 × 월 단위로 groupby 한 번에 집계하고,
+#   2025년 발송료 시트의 중계자(1..3) 배정과 조인한다.
+# -------------------------------------------------------
+
+CARRIER_KAKAO = "카카오"
+CARRIER_KT = "KT"
+CARRIER_NAVER = "네이버"
+
+# classifier.detect_company 결과 → 중계자명
+COMPANY_TO_CARRIER = {"kakao": CARRIER_KAKAO, "kt": CARRIER_KT, "naver": CARRIER_NAVER}
+
+METRICS = ["발송", "수신", "열람", "인증"]
+
+# 지표별 원천 컬럼 후보. 각 후보는 '합산할 컬럼 묶음'이며 앞쪽 후보 우선.
+CARRIER_SPECS: Dict[str, Dict[str, List[Tuple[str, ...]]]] = {
+    CARRIER_KAKAO: {
+        "발송": [("알림 수신 건수",)],
+        "수신": [("알림 수신 건수",)],
+        "열람": [("열람 시 인증 건수",)],
+        "인증": [("열람 시 인증 건수", "OTT검증 건수"), ("열람 시 인증 건수",)],
+    },
+    CARRIER_KT: {
+        "발송": [("발송요청건",)],
+        "수신": [("수신건수",)],
+        "열람": [("열람건수",), ("xMS열람건", "rcs열람건")],
+        "인증": [("맵핑건수",)],
+    },
+    CARRIER_NAVER: {
+        "발송": [("발송건수",)],
+        "수신": [("수신건수",), ("발송건수",)],
+        "열람": [("열람건수",)],
+        "인증": [("인증건수",)],
+    },
+}
+
+ORG_CANDIDATES = ["기관명", "기관", "이용기관명", "고객사명"]
+MONTH_CANDIDATES = ["월", "정산월"]
+DATE_CANDIDATES = ["일자", "날짜", "발송일", "발송일자"]
+
+STATUS_OK = "정상"
+STATUS_UNASSIGNED = "미배정"      # 통계에는 물량이 있는데 마스터 중계자에 없음
+STATUS_NO_STATS = "통계없음"      # 마스터에는 배정돼 있는데 통계 물량이 없음
+
+
+def _clean(s: pd.Series) -> pd.Series:
+    s = s.astype(object)
+    return s.where(s.notna(), "").astype(str).str.strip()
+
+
+def normalize_carrier(value: str) -> str:
+    """'kt' / '케이티' / 'Naver' / ' 카카오 ' 등 → 카카오 / KT / 네이버 (그 외는 원문 strip)"""
+    v = value.strip()
+    low = v.lower()
+    if "카카오" in v or "kakao" in low:
+        return CARRIER_KAKAO
+    if low.startswith("kt") or "케이티" in v:
+        return CARRIER_KT
+    if "네이버" in v or "naver" in low:
+        return CARRIER_NAVER
+    return v
+
+
+def normalize_carrier_series(s: pd.Series) -> pd.Series:
+    """고유값만 normalize_carrier 로 변환 후 펼침"""
+    codes, uniques = pd.factorize(_clean(s))
+    table = np.array([normalize_carrier(u) for u in uniques], dtype=object)
+    return pd.Series(table[codes] if len(table) else [], index=s.index, dtype=object)
+
+
+def carrier_assignments(rates_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    발송료 시트 중계자(1..3) → long 프레임 [기관명, 중계자, 순위]
+    같은 기관·중계자가 여러 줄이면 가장 앞 순위 1건만 남긴다.
+    """
+    org_col = find_column(rates_df, ["기관명"])
+    if org_col is None:
+        return pd.DataFrame(columns=["기관명", "중계자", "순위"])
+
+    org = _clean(rates_df[org_col])
+    parts = []
+    for rank in (1, 2, 3):
+        col = find_column(rates_df, [f"중계자({rank})"])
+        if col is None:
+            continue
+        parts.append(
+            pd.DataFrame(
+                {"기관명": org, "중계자": normalize_carrier_series(rates_df[col]), "순위": rank}
+            )
+        )
+
+    if not parts:
+        return pd.DataFrame(columns=["기관명", "중계자", "순위"])
+
+    long = pd.concat(parts, ignore_index=True)
+    long = long[(long["기관명"] != "") & (long["중계자"] != "")]
+    return (
+        long.sort_values("순위", kind="stable")
+        .drop_duplicates(["기관명", "중계자"], keep="first")
+        .reset_index(drop=True)
+    )
+
+
+def _month_series(df: pd.DataFrame, month: Optional[int]) -> pd.Series:
+    """파일 단위 월이 주어지면 그 값, 아니면 월/일자 컬럼에서 추출 (실패 시 0)"""
+    if month is not None:
+        return pd.Series(month, index=df.index, dtype="int64")
+
+    col = find_column(df, MONTH_CANDIDATES)
+    if col is not None:
+        raw = df[col].astype(object).astype(str).str.extract(r"(\d{1,2})\s*월?$")[0]
+        m = pd.to_numeric(raw, errors="coerce")
+        return m.where(m.between(1, 12), 0).fillna(0).astype("int64")
+
+    col = find_column(df, DATE_CANDIDATES)
+    if col is not None:
+        return to_dates(df[col]).dt.month.fillna(0).astype("int64")
+
+    return pd.Series(0, index=df.index, dtype="int64")
+
+
+def _metric_values(df: pd.DataFrame, options: List[Tuple[str, ...]]) -> pd.Series:
+    for cols in options:
+        found = [find_column(df, [c]) for c in cols]
+        if all(found):
+            values = df[found].apply(pd.to_numeric, errors="coerce").fillna(0)
+            return values.sum(axis=1).astype("int64")
+    return pd.Series(0, index=df.index, dtype="int64")
+
+
+class CarrierStats:
+    """
+    중계사 통계 파일을 add() 로 여러 개 넣고 volumes() 로 한 번에 집계.
+
+        stats = CarrierStats()
+        stats.add("KT", kt_df, month=3)
+        stats.add("네이버", naver_df)          # 월은 월/일자 컬럼에서 추출
+        joined = stats.join_master(rates_df)
+    """
+
+    def __init__(self):
+        self._parts: List[pd.DataFrame] = []
+        self._volumes: Optional[pd.DataFrame] = None
+
+    def add(self, carrier: str, df: pd.DataFrame, month: Optional[int] = None) -> "CarrierStats":
+        carrier = COMPANY_TO_CARRIER.get(carrier, normalize_carrier(carrier))
+        spec = CARRIER_SPECS.get(carrier)
+        if spec is None:
+            raise ValueError(f"지원하지 않는 중계사입니다: {carrier}")
+
+        org_col = find_column(df, ORG_CANDIDATES)
+        if org_col is None:
+            raise ValueError(f"{carrier} 통계에 기관명 컬럼이 없습니다. 후보: {ORG_CANDIDATES}")
+
+        part = pd.DataFrame(
+            {
+                "기관명": _clean(df[org_col]),
+                "중계자": carrier,
+                "월": _month_series(df, month),
+                **{metric: _metric_values(df, spec[metric]) for metric in METRICS},
+            }
+        )
+        self._parts.append(part[part["기관명"] != ""])
+        self._volumes = None
+        return self
+
+    @property
+    def carriers(self) -> List[str]:
+        return sorted({p["중계자"].iat[0] for p in self._parts if len(p)})
+
+    def volumes(self) -> pd.DataFrame:
+        """기관명 × 중계자 × 월 물량 (long, 캐시)"""
+        if self._volumes is None:
+            if not self._parts:
+                self._volumes = pd.DataFrame(columns=["기관명", "중계자", "월", *METRICS])
+            else:
+                long = pd.concat(self._parts, ignore_index=True)
+                self._volumes = (
+                    long.groupby(["기관명", "중계자", "월"], sort=True)[METRICS]
+                    .sum()
+                    .reset_index()
+                )
+        return self._volumes
+
+    def monthly_matrix(self, metric: str = "발송", carrier: Optional[str] = None) -> pd.DataFrame:
+        """기관명 × 1~12월 행렬 (carrier 지정 시 해당 중계사만)"""
+        vol = self.volumes()
+        if carrier is not None:
+            vol = vol[vol["중계자"] == normalize_carrier(carrier)]
+        matrix = vol.pivot_table(index="기관명", columns="월", values=metric, aggfunc="sum", fill_value=0)
+        return matrix.reindex(columns=range(1, 13), fill_value=0)
+
+    def join_master(self, rates_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        물량과 마스터 중계자 배정을 기관명 · 중계자 기준 outer join.
+        상태: 정상 / 미배정(물량은 있는데 배정 없음) / 통계없음(배정은 있는데 물량 없음)
+        통계없음은 이번에 통계를 넣은 중계사만 대상으로 한다.
+        """
+        vol = self.volumes()
+        assign = carrier_assignments(rates_df)
+        assign = assign[assign["중계자"].isin(self.carriers)]
+
+        merged = vol.merge(assign, on=["기관명", "중계자"], how="outer", indicator=True)
+        merged["상태"] = np.select(
+            [merged["_merge"].eq("both"), merged["_merge"].eq("left_only")],
+            [STATUS_OK, STATUS_UNASSIGNED],
+            default=STATUS_NO_STATS,
+        )
+        merged[METRICS] = merged[METRICS].fillna(0).astype("int64")
+        merged["월"] = merged["월"].fillna(0).astype("int64")
+        merged["순위"] = merged["순위"].astype("Int64")
+        return (
+            merged.drop(columns="_merge")
+            .sort_values(["기관명", "중계자", "월"], kind="stable")
+            .reset_index(drop=True)
+        )
@@ -1,53 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional, Union
+
 import pandas as pd
 
+from app.settlement.xlsx_stream import StreamWorkbook, read_sheet_stream
+
 # -------------------------------------------------------
 # 회사 / 유형 자동 분류
 # -------------------------------------------------------
 
-def detect_company(df: pd.DataFrame) -> str:
-    """
-    엑셀 컬럼만 보고 카카오 / KT / 네이버 / 다수기관 자동 판별
-    """
+# 카카오 패턴
+KAKAO_KEYS = {
+    "앱 ID", "알림 수신 건수", "열람 시 인증 건수", "OTT검증 건수",
+    "D10_2", "D11_2", "D10_2T", "D11_2T"
+}
 
-    cols = set(df.columns)
+# KT 패턴
+KT_KEYS = {
+    "발송요청건", "수신건수", "열람건수", "맵핑건수",
+    "xMS열람건", "rcs열람건"
+}
 
-    # 카카오 패턴
-    kakao_keys = {
-        "앱 ID", "알림 수신 건수", "열람 시 인증 건수", "OTT검증 건수",
-        "D10_2", "D11_2", "D10_2T", "D11_2T"
-    }
+# 네이버 패턴
+NAVER_KEYS = {"발송건수", "열람건수"}
 
-    # KT 패턴
-    kt_keys = {
-        "발송요청건", "수신건수", "열람건수", "맵핑건수",
-        "xMS열람건", "rcs열람건"
-    }
+# 다수기관 PDF 구성용 패턴 (너의 대금청구서 파일)
+MULTI_KEYS = {"기관명", "Settle ID", "청구금액", "요율"}
 
-    # 네이버 패턴
-    naver_keys = {"발송건수", "열람건수"}
 
-    # 다수기관 PDF 구성용 패턴 (너의 대금청구서 파일)
-    multi_keys = {"기관명", "Settle ID", "청구금액", "요율"}
+def detect_company_columns(columns: Iterable[object]) -> str:
+    """
+    컬럼명 목록만 보고 카카오 / KT / 네이버 / 다수기관 판별.
+    (헤더 전용 분류와 DataFrame 분류가 같은 규칙을 쓴다)
+    """
+    cols = set(columns)
 
     # -------------------------
     # 회사 판별
     # -------------------------
-    if len(kakao_keys & cols) >= 2:
+    if len(KAKAO_KEYS & cols) >= 2:
         return "kakao"
 
-    if len(kt_keys & cols) >= 2:
+    if len(KT_KEYS & cols) >= 2:
         return "kt"
 
-    if len(naver_keys & cols) >= 1:
+    if len(NAVER_KEYS & cols) >= 1:
         return "naver"
 
-    if len(multi_keys & cols) >= 2:
+    if len(MULTI_KEYS & cols) >= 2:
         return "multi"
 
     # 기본값 (안전)
     return "unknown"
 
 
+def detect_company(df: pd.DataFrame) -> str:
+    """
+    엑셀 컬럼만 보고 카카오 / KT / 네이버 / 다수기관 자동 판별
+    """
+    return detect_company_columns(df.columns)
+
+
 def classify_uploaded_files(data_map: dict):
     """
     {파일명: DF} -> [{filename, df, company}] 리스트 반환
@@ -66,3 +80,116 @@ def classify_uploaded_files(data_map: dict):
         )
 
     return results
+
+
+# -------------------------------------------------------
+# 헤더 전용 분류 (대량 업로드용)
+#   시트마다 첫 행(헤더)만 읽어 회사를 판별하고,
+#   필요한 회사의 파일·시트만 나중에 전체 로드한다.
+#   파일 단위 작업은 스레드 풀에서 병렬 처리.
+# -------------------------------------------------------
+
+FileSource = Union[bytes, BytesIO]
+
+
+def _as_buffer(src: FileSource) -> BytesIO:
+    if isinstance(src, (bytes, bytearray)):
+        return BytesIO(src)
+    if hasattr(src, "getvalue"):
+        return BytesIO(src.getvalue())
+    src.seek(0)
+    return BytesIO(src.read())
+
+
+def read_sheet_headers(src: FileSource) -> Dict[str, List[str]]:
+    """
+    {시트명: 컬럼명 목록}. xlsx 는 스트리밍 리더로 첫 행만 읽고,
+    zip 형식이 아닌 파일(xls 등)은 pandas 로 nrows=0 만 읽는다.
+    """
+    buf = _as_buffer(src)
+    try:
+        book = StreamWorkbook(buf)
+    except Exception:
+        buf.seek(0)
+        frames = pd.read_excel(buf, sheet_name=None, nrows=0)
+        return {name: [str(c) for c in df.columns] for name, df in frames.items()}
+
+    return {name: book.read_header(name) for name in book.sheet_names}
+
+
+def _classify_one(fname: str, src: FileSource) -> List[dict]:
+    try:
+        headers = read_sheet_headers(src)
+    except Exception as e:
+        return [{"filename": fname, "sheet": None, "company": "unknown", "columns": [], "error": str(e)}]
+
+    return [
+        {
+            "filename": fname,
+            "sheet": sheet,
+            "company": detect_company_columns(cols),
+            "columns": cols,
+            "error": None,
+        }
+        for sheet, cols in headers.items()
+    ]
+
+
+def classify_headers(files: Dict[str, FileSource], workers: int = 8) -> List[dict]:
+    """
+    {파일명: bytes/버퍼} → [{filename, sheet, company, columns, error}]
+    파일 순서 → 시트 순서 그대로 반환. 읽을 수 없는 파일은 company='unknown' + error.
+    """
+    if not files:
+        return []
+
+    workers = max(1, min(workers, len(files)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        per_file = ex.map(lambda item: _classify_one(*item), files.items())
+        return [entry for entries in per_file for entry in entries]
+
+
+def load_classified(
+    files: Dict[str, FileSource],
+    classified: List[dict],
+    companies: Optional[Iterable[str]] = None,
+    workers: int = 8,
+) -> List[dict]:
+    """
+    classify_headers 결과 중 companies 에 해당하는 시트만 전체 로드.
+    companies=None 이면 'unknown' 을 제외한 모든 회사.
+    반환: [{filename, sheet, company, df}] (classify_uploaded_files 와 같은 키 + sheet)
+    """
+    wanted = set(companies) if companies is not None else {"kakao", "kt", "naver", "multi"}
+    targets = [c for c in classified if c["sheet"] is not None and c["company"] in wanted]
+    if not targets:
+        return []
+
+    def _load(entry: dict) -> dict:
+        buf = _as_buffer(files[entry["filename"]])
+        try:
+            df = read_sheet_stream(StreamWorkbook(buf), entry["sheet"])
+        except Exception:
+            buf.seek(0)
+            df = pd.read_excel(buf, sheet_name=entry["sheet"])
+        df = df.dropna(how="all")
+        return {
+            "filename": entry["filename"],
+            "sheet": entry["sheet"],
+            "company": entry["company"],
+            "df": df,
+        }
+
+    workers = max(1, min(workers, len(targets)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_load, targets))
+
+
+def classify_files(
+    files: Dict[str, FileSource],
+    companies: Optional[Iterable[str]] = None,
+    workers: int = 8,
+) -> List[dict]:
+    """헤더로 분류한 뒤 필요한 회사의 시트만 로드 (classify_headers + load_classified)"""
+    classified = classify_headers(files, workers=workers)
+    return load_classified(files, classified, companies=companies, workers=workers)
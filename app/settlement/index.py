@@ -0,0 +1,72 @@
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# -------------------------------------------------------
+# 업로드 1회당 한 번 만드는 행 위치 인덱스
+#   rates_df[rates_df["settleid"] == sid] 같은 O(N) 불리언 스캔을
+#   dict 조회(O(1)) + iloc 로 바꾼다.
+# -------------------------------------------------------
+
+class SettlementIndex:
+    """
+    DataFrame 의 키 컬럼(settleid, 기관명 등) → 행 위치(np.ndarray) 인덱스.
+
+    키는 화면에서 선택지로 쓰는 값과 맞추기 위해 str 로 변환해 저장한다.
+    (settlement_page 는 astype(str) 한 값으로 multiselect 를 구성)
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        settle_col: str = "settleid",
+        org_col: str = "기관명",
+    ):
+        self.df = df
+        self.settle_col = settle_col
+        self.org_col = org_col
+
+        self._by_settle_id = self._build(settle_col)
+        self._by_org = self._build(org_col)
+
+    def _build(self, col: str) -> Dict[str, np.ndarray]:
+        if col not in self.df.columns:
+            return {}
+        keys = self.df[col]
+        keys = keys.astype(str).where(keys.notna())
+        return keys.groupby(keys.to_numpy(), dropna=True, sort=False).indices
+
+    # ---------------------------
+    # Settle ID
+    # ---------------------------
+    def settle_ids(self) -> List[str]:
+        return list(self._by_settle_id)
+
+    def positions_for_settle_id(self, settle_id) -> np.ndarray:
+        return self._by_settle_id.get(str(settle_id), np.empty(0, dtype=np.intp))
+
+    def rows_for_settle_id(self, settle_id) -> pd.DataFrame:
+        return self.df.iloc[self.positions_for_settle_id(settle_id)]
+
+    def first_row_for_settle_id(self, settle_id) -> Optional[pd.Series]:
+        pos = self.positions_for_settle_id(settle_id)
+        if len(pos) == 0:
+            return None
+        return self.df.iloc[pos[0]]
+
+    # ---------------------------
+    # 기관명
+    # ---------------------------
+    def orgs(self) -> List[str]:
+        return list(self._by_org)
+
+    def positions_for_org(self, org) -> np.ndarray:
+        return self._by_org.get(str(org), np.empty(0, dtype=np.intp))
+
+    def rows_for_org(self, org) -> pd.DataFrame:
+        return self.df.iloc[self.positions_for_org(org)]
+
+    def rows_for_orgs(self, orgs: Iterable) -> Dict[str, pd.DataFrame]:
+        return {str(o): self.rows_for_org(o) for o in orgs}
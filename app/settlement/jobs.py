@@ -0,0 +1,327 @@
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from app.settlement.archive import ZipArchiveBuilder
+from app.settlement.batch import KakaoPdfJob, render_kakao_pdfs
+from app.settlement.metrics import BatchMetrics
+from app.settlement.pdf_generator import generate_multi_pdf
+from app.utils.logger import write_metrics
+
+
+# -------------------------------------------------------
+# 백그라운드 PDF ZIP 작업 큐
+#   - 작업 상태/진행률은 SQLite 파일에 기록 (세션·rerun 과 무관하게 유지)
+#   - 실제 생성은 스레드 풀에서 실행, 완성된 ZIP 은 archive_dir 에 저장
+#   - 페이지는 job_id 로 상태를 폴링하고, 만료 시각이 지나면 파일/기록 삭제
+#   - 작업마다 BatchMetrics 로 단계별 시간을 재고, 끝나면 metrics 로그에 1줄 기록
+# -------------------------------------------------------
+
+BASE_DIR = Path(__file__).resolve().parent.parent      # app/
+JOB_DIR = BASE_DIR / "jobs"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class JobStatus:
+    job_id: str
+    owner: str
+    kind: str
+    status: str
+    total: int
+    done: int
+    created_at: float
+    finished_at: Optional[float]
+    expires_at: Optional[float]
+    result_path: Optional[str]
+    file_name: str
+    error: Optional[str]
+    bytes: int
+    pdfs_per_sec: Optional[float]
+    eta_seconds: Optional[float]
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+
+_COLUMNS = (
+    "job_id, owner, kind, status, total, done, created_at, "
+    "finished_at, expires_at, result_path, file_name, error, "
+    "bytes, pdfs_per_sec, eta_seconds"
+)
+
+# 처음 스키마 이후 추가된 컬럼 (기존 jobs.sqlite3 에는 ALTER TABLE 로 추가)
+_ADDED_COLUMNS = {
+    "bytes": "INTEGER DEFAULT 0",
+    "pdfs_per_sec": "REAL",
+    "eta_seconds": "REAL",
+}
+
+
+class JobRunner:
+    """
+    submit_kakao / submit_multi 로 작업을 넣으면 job_id 를 즉시 반환한다.
+    Streamlit rerun 으로 스크립트가 다시 돌아도 작업은 계속 진행된다.
+    """
+
+    def __init__(
+        self,
+        job_dir: Path = JOB_DIR,
+        workers: int = 2,
+        ttl_seconds: int = 60 * 60,
+    ):
+        self.job_dir = Path(job_dir)
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.job_dir / "jobs.sqlite3"
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-job")
+        self._init_db()
+
+    # ---------------------------
+    # SQLite
+    # ---------------------------
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_db(self):
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id      TEXT PRIMARY KEY,
+                    owner       TEXT,
+                    kind        TEXT,
+                    status      TEXT,
+                    total       INTEGER,
+                    done        INTEGER,
+                    created_at  REAL,
+                    finished_at REAL,
+                    expires_at  REAL,
+                    result_path TEXT,
+                    file_name   TEXT,
+                    error       TEXT
+                )
+                """
+            )
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for col, ddl in _ADDED_COLUMNS.items():
+                if col not in existing:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {col} {ddl}")
+
+            # 이전 프로세스에서 끝나지 못한 작업은 실패 처리
+            #   (만료 시각도 넣어야 cleanup_expired 가 기록/남은 ZIP 을 지운다)
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ?, expires_at = ? "
+                "WHERE status IN (?, ?)",
+                (STATUS_FAILED, "서버 재시작으로 중단됨", now, now + self.ttl_seconds,
+                 STATUS_QUEUED, STATUS_RUNNING),
+            )
+
+    def _update(self, job_id: str, **fields):
+        cols = ", ".join(f"{k} = ?" for k in fields)
+        with self._lock, self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {cols} WHERE job_id = ?", (*fields.values(), job_id))
+
+    # ---------------------------
+    # 조회
+    # ---------------------------
+    def get(self, job_id: str) -> Optional[JobStatus]:
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return JobStatus(*row) if row else None
+
+    def list_jobs(self, owner: Optional[str] = None) -> List[JobStatus]:
+        self.cleanup_expired()
+        query = f"SELECT {_COLUMNS} FROM jobs"
+        params: tuple = ()
+        if owner is not None:
+            query += " WHERE owner = ?"
+            params = (owner,)
+        query += " ORDER BY created_at DESC"
+        with self._connect() as conn:
+            return [JobStatus(*row) for row in conn.execute(query, params)]
+
+    def cleanup_expired(self) -> int:
+        """만료된 완료/실패 작업의 ZIP 파일과 기록 삭제. 삭제 건수 반환."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT job_id, result_path FROM jobs WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (now,),
+            ).fetchall()
+            for job_id, path in rows:
+                # 중단된 작업은 result_path 가 없으므로 만들다 만 ZIP 경로도 확인
+                path = path or str(self.job_dir / f"{job_id}.zip")
+                if os.path.exists(path):
+                    os.remove(path)
+            conn.execute("DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+        return len(rows)
+
+    # ---------------------------
+    # 등록 / 실행
+    # ---------------------------
+    def _submit(
+        self,
+        owner: str,
+        kind: str,
+        total: int,
+        file_name: str,
+        produce: Callable[[BatchMetrics], Iterator[Tuple[str, bytes]]],
+        compression: str,
+        metrics: Optional[BatchMetrics],
+    ) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO jobs ({_COLUMNS}) VALUES ({', '.join('?' * 15)})",
+                (job_id, owner, kind, STATUS_QUEUED, total, 0, time.time(),
+                 None, None, None, file_name, None, 0, None, None),
+            )
+
+        # 페이지에서 lookup 단계를 잰 metrics 가 있으면 이어서 사용
+        metrics = metrics if metrics is not None else BatchMetrics()
+        metrics.total = total
+        self._pool.submit(self._run, job_id, kind, produce, compression, metrics)
+        return job_id
+
+    def _report(self, job_id: str, metrics: BatchMetrics, **fields):
+        self._update(
+            job_id,
+            done=metrics.count,
+            bytes=metrics.bytes,
+            pdfs_per_sec=metrics.pdfs_per_sec,
+            eta_seconds=metrics.eta_seconds,
+            **fields,
+        )
+
+    def _run(self, job_id: str, kind: str, produce, compression: str, metrics: BatchMetrics):
+        result_path = self.job_dir / f"{job_id}.zip"
+        status, error = STATUS_FAILED, None
+        try:
+            # 페이지에서 만든 metrics 는 등록 시점부터 재고 있으므로 실제 실행 시작으로 맞춤
+            metrics.start()
+            self._update(job_id, status=STATUS_RUNNING)
+            last_report = 0.0
+            with ZipArchiveBuilder(compression=compression) as archive:
+                for name, pdf in produce(metrics):
+                    with metrics.stage("zip_write"):
+                        archive.writestr(name, pdf)
+                    # 진행률 기록은 0.5초 간격으로만 (SQLite 쓰기 최소화)
+                    if time.monotonic() - last_report > 0.5:
+                        self._report(job_id, metrics)
+                        last_report = time.monotonic()
+            with metrics.stage("zip_save"):
+                archive.save_to(str(result_path))
+            archive.discard()
+
+            metrics.finish()
+            now = time.time()
+            self._report(
+                job_id,
+                metrics,
+                status=STATUS_DONE,
+                finished_at=now,
+                expires_at=now + self.ttl_seconds,
+                result_path=str(result_path),
+            )
+            status = STATUS_DONE
+        except Exception as e:
+            error = str(e)
+            self._fail(job_id, metrics, error, result_path)
+        finally:
+            try:
+                write_metrics(
+                    metrics.to_record(
+                        job_id=job_id,
+                        kind=kind,
+                        status=status,
+                        error=error,
+                        compression=compression,
+                    )
+                )
+            except Exception:
+                pass  # 계측 로그 실패가 작업 상태에 영향을 주지 않도록
+
+    def _fail(self, job_id: str, metrics: BatchMetrics, error: str, result_path: Path):
+        """실패 처리: 만들다 만 ZIP 삭제 + 상태 기록 (기록 자체가 실패해도 예외를 올리지 않음)"""
+        metrics.finish()
+        try:
+            if result_path.exists():
+                result_path.unlink()
+        except OSError:
+            pass
+        now = time.time()
+        try:
+            self._update(
+                job_id,
+                status=STATUS_FAILED,
+                error=error,
+                done=metrics.count,
+                finished_at=now,
+                expires_at=now + self.ttl_seconds,
+                result_path=None,
+            )
+        except Exception:
+            pass
+
+    def submit_kakao(
+        self,
+        owner: str,
+        jobs: List[KakaoPdfJob],
+        file_name: str = "kakao_single_pdf.zip",
+        compression: str = "store",
+        pdf_workers: Optional[int] = None,
+        metrics: Optional[BatchMetrics] = None,
+    ) -> str:
+        def produce(metrics: BatchMetrics):
+            for job, pdf in render_kakao_pdfs(jobs, workers=pdf_workers, metrics=metrics):
+                yield job.filename, pdf
+
+        return self._submit(owner, "kakao", len(jobs), file_name, produce, compression, metrics)
+
+    def submit_multi(
+        self,
+        owner: str,
+        items: Iterable[Tuple[str, pd.DataFrame]],
+        file_name: str = "multi_org_pdf.zip",
+        compression: str = "store",
+        metrics: Optional[BatchMetrics] = None,
+    ) -> str:
+        items = list(items)
+
+        def produce(metrics: BatchMetrics):
+            for name, rows in items:
+                pdf = generate_multi_pdf(None, rows, timings=metrics.stages)
+                metrics.add_pdf(len(pdf))
+                yield name, pdf
+
+        return self._submit(owner, "multi", len(items), file_name, produce, compression, metrics)
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """프로세스 전체에서 하나의 JobRunner 를 공유 (모든 Streamlit 세션 공통)."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner()
+        return _runner
@@ -0,0 +1,164 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.settlement.index import SettlementIndex
+from app.settlement.utils import find_column
+
+
+# -------------------------------------------------------
+# 카카오 단일기관 대금청구서 데이터 (요약 + 상세) 일괄 생성
+#   Settle ID 마다 kakao_df 를 필터링하지 않고,
+#   선택된 ID 전체를 groupby("settleid") 한 번으로 처리한다.
+#   (settlement_page 의 정규화된 컬럼명 기준: 공백/_/- 제거 + 소문자)
+#
+#   요약 금액은 발송료 시트(마스터)의 정산발송료/정산인증료/부가세가 기준.
+#   마스터에 없는 ID 만 카카오 통계 금액(발송료 컬럼, 없으면 '금액')으로 채운다.
+# -------------------------------------------------------
+
+SETTLE_COL = "settleid"
+FEE_NAMES = ["발송료", "인증료", "부가세"]
+
+# 마스터(발송료 시트) 금액 컬럼 후보 (앞쪽 우선)
+MASTER_FEE_CANDIDATES = {
+    "발송료": ["정산발송료", "발송료"],
+    "인증료": ["정산인증료", "인증료"],
+    "부가세": ["부가세"],
+}
+
+# 카카오 통계 금액 컬럼 후보 (월별 통계는 보통 '금액' 만 있음)
+FEE_CANDIDATES = {
+    "발송료": ["발송료", "정산발송료", "금액"],
+    "인증료": ["인증료", "정산인증료"],
+    "부가세": ["부가세"],
+}
+
+# 상세내역 표에 싣는 컬럼 후보 (있는 것만, 이 순서대로)
+DETAIL_CANDIDATES = [
+    "일자", "날짜", "월", "발송일", "문서명", "서비스명",
+    "알림수신건수", "열람시인증건수", "ott검증건수",
+    "발송료", "정산발송료", "인증료", "정산인증료", "부가세", "금액",
+]
+
+
+def _pick(columns, candidates: List[str]) -> Optional[str]:
+    for c in candidates:
+        if c in columns:
+            return c
+    return None
+
+
+def _detail_columns(kakao_df: pd.DataFrame) -> List[str]:
+    cols = [c for c in DETAIL_CANDIDATES if c in kakao_df.columns]
+    if not cols:
+        cols = [c for c in kakao_df.columns if c != SETTLE_COL]
+    # 같은 금액이 후보 두 개로 중복 표시되지 않도록 정리
+    for name, cands in FEE_CANDIDATES.items():
+        picked = _pick(kakao_df.columns, cands)
+        cols = [c for c in cols if c not in cands or c == picked]
+    return cols
+
+
+def _fee_sums(df: pd.DataFrame, keys, candidates: Dict[str, List[str]]) -> Dict[str, dict]:
+    """금액 후보 컬럼을 숫자로 바꿔 keys 별 합계 → {key: {발송료, 인증료, 부가세, 총금액}}"""
+    cols = {name: _pick(df.columns, cands) for name, cands in candidates.items()}
+    fees = pd.DataFrame(
+        {
+            name: (
+                pd.to_numeric(df[col], errors="coerce").fillna(0)
+                if col else pd.Series(0, index=df.index)
+            )
+            for name, col in cols.items()
+        },
+        index=df.index,
+    )
+    grouped = fees.groupby(keys, sort=False).sum().round().astype("int64")
+    grouped["총금액"] = grouped[FEE_NAMES].sum(axis=1)
+    return {
+        sid: {k: int(v) for k, v in row.items()}
+        for sid, row in grouped.to_dict("index").items()
+    }
+
+
+def _master_fees(rates_index: SettlementIndex, wanted: List[str]) -> Dict[str, dict]:
+    """마스터에서 Settle ID 별 정산 금액 합계 (인덱스 위치 조회 + groupby 한 번)"""
+    df = rates_index.df
+    if not any(_pick(df.columns, c) for c in MASTER_FEE_CANDIDATES.values()):
+        return {}
+
+    positions, keys = [], []
+    for sid in wanted:
+        pos = rates_index.positions_for_settle_id(sid)
+        if len(pos):
+            positions.append(pos)
+            keys.append(np.full(len(pos), sid, dtype=object))
+    if not positions:
+        return {}
+
+    sub = df.iloc[np.concatenate(positions)]
+    return _fee_sums(sub, np.concatenate(keys), MASTER_FEE_CANDIDATES)
+
+
+def build_kakao_invoices(
+    kakao_df: pd.DataFrame,
+    settle_ids: Iterable[str],
+    rates_index: Optional[SettlementIndex] = None,
+) -> Dict[str, Tuple[dict, pd.DataFrame]]:
+    """
+    선택된 Settle ID 전체의 (summary_row, detail_df) 를 한 번에 만든다.
+
+    - summary_row: {"발송료", "인증료", "부가세", "총금액"} (int)
+      rates_index(발송료 시트)에 있는 ID 는 마스터 정산 금액 합계,
+      없으면 카카오 통계 금액 합계 (발송료 컬럼, 없으면 '금액')
+    - detail_df  : 해당 Settle ID 의 카카오 통계 행 (상세내역 표 컬럼만)
+
+    카카오 통계 · 마스터 어디에도 없는 ID 는 0원 요약 + 빈 상세로 채운다.
+    """
+    wanted = [str(s) for s in settle_ids]
+    detail_cols = _detail_columns(kakao_df)
+    empty_detail = pd.DataFrame(columns=detail_cols)
+
+    result: Dict[str, Tuple[dict, pd.DataFrame]] = {
+        sid: ({"발송료": 0, "인증료": 0, "부가세": 0, "총금액": 0}, empty_detail)
+        for sid in wanted
+    }
+    if not wanted:
+        return result
+
+    master = _master_fees(rates_index, wanted) if rates_index is not None else {}
+    for sid, summary in master.items():
+        result[sid] = (summary, empty_detail)
+
+    if SETTLE_COL not in kakao_df.columns:
+        return result
+
+    keys = kakao_df[SETTLE_COL].astype(str)
+    sub = kakao_df[keys.isin(wanted)]
+    if sub.empty:
+        return result
+    sub_keys = keys[sub.index]
+
+    stats = _fee_sums(sub, sub_keys, FEE_CANDIDATES)
+
+    details = sub[detail_cols].groupby(sub_keys, sort=False)
+    for sid, detail in details:
+        summary = master.get(sid, stats[sid])
+        result[sid] = (summary, detail.reset_index(drop=True))
+
+    return result
+
+
+# -------------------------------------------------------
+# 단건 호환용 (내부적으로 배치 함수 사용)
+# -------------------------------------------------------
+
+def build_kakao_summary_row(kakao_df: pd.DataFrame, rates_df: pd.DataFrame, settle_id) -> dict:
+    """rates_df(발송료 시트)의 정산 금액 기준 요약. 마스터에 없으면 카카오 통계 금액."""
+    settle_col = find_column(rates_df, [SETTLE_COL, "카카오 settle id"]) or SETTLE_COL
+    rates_index = SettlementIndex(rates_df, settle_col=settle_col)
+    return build_kakao_invoices(kakao_df, [settle_id], rates_index)[str(settle_id)][0]
+
+
+def build_kakao_detail_df(kakao_df: pd.DataFrame, settle_id) -> pd.DataFrame:
+    return build_kakao_invoices(kakao_df, [settle_id])[str(settle_id)][1]
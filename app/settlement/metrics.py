@@ -0,0 +1,97 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+# -------------------------------------------------------
+# PDF 일괄 생성 계측
+#   단계별 누적 시간(lookup / pdf.text / pdf.table / pdf.save / zip_write),
+#   생성 건수 · 바이트 · 초당 PDF 수를 모아 작업 1건당 레코드 1줄로 남긴다.
+# -------------------------------------------------------
+
+
+@contextmanager
+def stage_timer(timings: Optional[Dict[str, float]], name: str):
+    """timings[name] 에 경과 시간을 누적. timings 가 None 이면 계측하지 않음."""
+    if timings is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - t0
+
+
+class BatchMetrics:
+    """
+    ZIP 작업 1건의 계측값.
+    - stage(name)    : with 블록 시간을 단계별로 누적
+    - merge(timings) : 워커 프로세스에서 돌아온 PDF 1건의 단계 시간 합산
+    - add_pdf(nbytes): PDF 1건 완료
+    """
+
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.count = 0
+        self.bytes = 0
+        self.stages: Dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def start(self):
+        """처리 시작 시점 재설정 (큐 대기 시간은 속도 · ETA 에서 제외)"""
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def stage(self, name: str):
+        return stage_timer(self.stages, name)
+
+    def merge(self, timings: Dict[str, float]):
+        for name, sec in timings.items():
+            self.stages[name] = self.stages.get(name, 0.0) + sec
+
+    def add_pdf(self, nbytes: int):
+        self.count += 1
+        self.bytes += nbytes
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def pdfs_per_sec(self) -> float:
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """남은 건수 / 현재 처리 속도. 아직 1건도 끝나지 않았으면 None."""
+        if not self.count or not self.total:
+            return None
+        return max(0, self.total - self.count) / self.pdfs_per_sec
+
+    def to_record(self, **extra) -> dict:
+        """metrics 로그에 남길 구조화 레코드 (초 단위는 소수 4자리)"""
+        record = {
+            "total": self.total,
+            "count": self.count,
+            "bytes": self.bytes,
+            "seconds": round(self.elapsed, 4),
+            "pdfs_per_sec": round(self.pdfs_per_sec, 2),
+            "stages": {k: round(v, 4) for k, v in self.stages.items()},
+        }
+        record.update(extra)
+        return record
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "계산 중"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}초"
+    return f"{seconds // 60}분 {seconds % 60}초"
@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
 
 
 class MissingFinder:
@@ -7,6 +7,9 @@ class MissingFinder:
     카카오 월별통계(kakao_df)와
     2025 발송료/기안자료 master_df(= rates_df 또는 drafts_df)의
     Settle ID 불일치(누락기관)를 자동 탐지하는 클래스.
+
+    정리된 ID 집합은 한 번만 만들어 캐시하고, 누락/초과/요약은 그 캐시에서 계산한다.
+    add_kakao() 로 카카오 파일을 추가하면 새 파일의 ID 만 집합에 합친다.
     """
 
     def __init__(
@@ -16,11 +19,18 @@ class MissingFinder:
         kakao_key: str = "Settle ID",
         master_key: str = "카카오 settle id",
     ):
-        self.kakao_df = kakao_df.copy()
-        self.master_df = master_settle_df.copy()
+        # 입력 DF는 읽기 전용으로 참조만 한다 (copy 하지 않음)
+        self.kakao_frames: List[pd.DataFrame] = [kakao_df]
+        self.master_df = master_settle_df
         self.kakao_key = kakao_key
         self.master_key = master_key
 
+        # ID 집합 / 결과 캐시
+        self._kakao_ids: Optional[Set[str]] = None
+        self._master_ids: Optional[Set[str]] = None
+        self._missing: Optional[List[str]] = None
+        self._extra: Optional[List[str]] = None
+
     @staticmethod
     def _clean(value):
         """공백/NaN 제거 후 문자열화"""
@@ -28,17 +38,54 @@ class MissingFinder:
             return ""
         return str(value).strip()
 
+    @staticmethod
+    def _id_set(df: pd.DataFrame, col: str) -> Set[str]:
+        """컬럼 단위로 NaN 제거 → 문자열화 → strip → 빈 값 제외 후 고유 ID 집합"""
+        if col not in df.columns:
+            return set()
+        ids = df[col].dropna().astype(str).str.strip()
+        return set(ids[ids != ""].unique())
+
     def extract_unique_ids(self, df: pd.DataFrame, col: str) -> List[str]:
         """특정 컬럼에서 고유한 ID 추출"""
-        return sorted(
-            list(
-                {
-                    self._clean(x)
-                    for x in df.get(col, [])
-                    if self._clean(x) != ""
-                }
-            )
-        )
+        return sorted(self._id_set(df, col))
+
+    # -------------------------------------------------------
+    # 캐시된 ID 집합
+    # -------------------------------------------------------
+
+    @property
+    def kakao_df(self) -> pd.DataFrame:
+        """추가된 카카오 파일 전체 (여러 개면 이어붙인 결과)"""
+        if len(self.kakao_frames) > 1:
+            self.kakao_frames = [pd.concat(self.kakao_frames, ignore_index=True)]
+        return self.kakao_frames[0]
+
+    @property
+    def kakao_ids(self) -> Set[str]:
+        if self._kakao_ids is None:
+            self._kakao_ids = set()
+            for df in self.kakao_frames:
+                self._kakao_ids |= self._id_set(df, self.kakao_key)
+        return self._kakao_ids
+
+    @property
+    def master_ids(self) -> Set[str]:
+        if self._master_ids is None:
+            self._master_ids = self._id_set(self.master_df, self.master_key)
+        return self._master_ids
+
+    def add_kakao(self, kakao_df: pd.DataFrame) -> "MissingFinder":
+        """
+        기존 대사 결과에 카카오 파일 하나를 추가.
+        기존 파일은 다시 읽지 않고 새 파일의 ID 만 집합에 합친다.
+        """
+        self.kakao_frames.append(kakao_df)
+        if self._kakao_ids is not None:
+            self._kakao_ids |= self._id_set(kakao_df, self.kakao_key)
+        self._missing = None
+        self._extra = None
+        return self
 
     # -------------------------------------------------------
     # 🔥 settlement_page.py에서 요구하는 메서드들 추가
@@ -48,17 +95,17 @@ class MissingFinder:
         """
         카카오에는 있는데 발송료/기안자료에는 없는 Settle ID
         """
-        kakao_ids = self.extract_unique_ids(self.kakao_df, self.kakao_key)
-        master_ids = self.extract_unique_ids(self.master_df, self.master_key)
-        return sorted(list(set(kakao_ids) - set(master_ids)))
+        if self._missing is None:
+            self._missing = sorted(self.kakao_ids - self.master_ids)
+        return list(self._missing)
 
     def get_extra_settle_ids(self) -> List[str]:
         """
         발송료/기안자료에는 있는데 카카오 통계에는 없는 Settle ID
         """
-        kakao_ids = self.extract_unique_ids(self.kakao_df, self.kakao_key)
-        master_ids = self.extract_unique_ids(self.master_df, self.master_key)
-        return sorted(list(set(master_ids) - set(kakao_ids)))
+        if self._extra is None:
+            self._extra = sorted(self.master_ids - self.kakao_ids)
+        return list(self._extra)
 
     def get_missing_orgs(self) -> pd.DataFrame:
         """
@@ -66,18 +113,18 @@ class MissingFinder:
         """
         missing_ids = self.get_missing_settle_ids()
 
-        df = self.master_df.copy()
-        df[self.master_key] = df[self.master_key].astype(str).str.strip()
+        df = self.master_df
+        keys = df[self.master_key].astype(str).str.strip()
 
-        return df[df[self.master_key].isin(missing_ids)]
+        return df[keys.isin(missing_ids)]
 
     def summary(self) -> Dict[str, int]:
         """
         누락/초과 수량 요약
         """
         return {
-            "카카오 총 ID": len(self.extract_unique_ids(self.kakao_df, self.kakao_key)),
-            "마스터 총 ID": len(self.extract_unique_ids(self.master_df, self.master_key)),
+            "카카오 총 ID": len(self.kakao_ids),
+            "마스터 총 ID": len(self.master_ids),
             "누락 ID 수": len(self.get_missing_settle_ids()),
             "초과 ID 수": len(self.get_extra_settle_ids()),
         }
@@ -0,0 +1,89 @@
+from typing import Dict, Iterable, List, Tuple
+
+import pandas as pd
+
+
+# -------------------------------------------------------
+# 반복 문자열 컬럼 → category 변환 (프레임 단위 카테고리)
+#   기관명 / settleid / 중계자 / Y·N 플래그처럼 작은 어휘가
+#   수만 행에 반복되는 컬럼을 category 로 바꾸면
+#   groupby · isin 이 코드(int) 기준으로 동작하고 메모리가 크게 준다.
+#   한 프레임 안에서 같은 그룹의 컬럼(중계자(1)~(3) 등)은 같은 카테고리 집합을 쓴다.
+#   카테고리는 그 프레임에 실제 있는 값만 — 다른 프레임 값까지 합치면
+#   작은 프레임이 오히려 커진다. 변환 후 더 큰 컬럼은 object 그대로 둔다.
+# -------------------------------------------------------
+
+# 그룹명 → 해당 그룹에 속하는 컬럼명 (원본명 + settlement_page 정규화명)
+CATEGORY_GROUPS: Dict[str, List[str]] = {
+    "기관명": ["기관명"],
+    "지역": ["지역"],
+    "settle_id": ["settleid", "Settle ID", "카카오 settle id", "카카오settleid"],
+    "중계자": ["중계자(1)", "중계자(2)", "중계자(3)"],
+    "PDF유형": ["PDF유형", "pdf유형"],
+    "YN": ["카카오전용", "VAT별도", "vat별도"],
+}
+
+
+def _is_text(s: pd.Series) -> bool:
+    return (
+        not isinstance(s.dtype, pd.CategoricalDtype)
+        and not pd.api.types.is_numeric_dtype(s)
+        and not pd.api.types.is_datetime64_any_dtype(s)
+    )
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """DataFrame 전체 메모리 (object 문자열 포함, bytes)."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def categorize_frames(
+    frames: Dict[str, pd.DataFrame],
+    groups: Dict[str, Iterable[str]] = None,
+) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    frames: {"카카오": kakao_df, "발송료": rates_df, ...}
+
+    반환: (변환된 frames, 메모리 리포트 DF)
+    - 원본 프레임은 수정하지 않는다 (얕은 복사본의 컬럼만 교체)
+    - 숫자/날짜 컬럼은 건드리지 않음
+    - 컬럼별로 category 가 object 보다 작을 때만 교체 → 프레임이 커지지 않음
+    - 리포트 컬럼: 프레임, 변환 컬럼 수, 변환 전(MB), 변환 후(MB), 절감률(%)
+    """
+    groups = groups if groups is not None else CATEGORY_GROUPS
+
+    out: Dict[str, pd.DataFrame] = {}
+    report = []
+    for name, df in frames.items():
+        before = frame_memory(df)
+        converted = df.copy(deep=False)
+        n_cols = 0
+
+        for cols in groups.values():
+            targets = [c for c in cols if c in df.columns and _is_text(df[c])]
+            if not targets:
+                continue
+
+            # 이 프레임의 그룹 컬럼들에 실제 있는 값만 카테고리로
+            values = pd.concat([df[c].dropna() for c in targets], ignore_index=True)
+            dtype = pd.CategoricalDtype(categories=pd.Index(pd.unique(values.astype(object))))
+
+            for c in targets:
+                candidate = df[c].astype(object).astype(dtype)
+                if candidate.memory_usage(deep=True) < df[c].memory_usage(deep=True):
+                    converted[c] = candidate
+                    n_cols += 1
+
+        after = frame_memory(converted)
+        out[name] = converted
+        report.append(
+            {
+                "프레임": name,
+                "변환 컬럼 수": n_cols,
+                "변환 전(MB)": round(before / 1024 / 1024, 2),
+                "변환 후(MB)": round(after / 1024 / 1024, 2),
+                "절감률(%)": round((1 - after / before) * 100, 1) if before else 0.0,
+            }
+        )
+
+    return out, pd.DataFrame(report)
@@ -0,0 +1,95 @@
+import re
+import sys
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# -------------------------------------------------------
+# 기안자료 '구분' / 기관명 파싱 (processor · summary 공용)
+#   - 정규식은 모듈 로드 시 1회 컴파일
+#   - 같은 기관명이 수천 줄 반복되므로 결과는 LRU 캐시
+#   - Series 단위 함수는 고유값만 파싱한 뒤 전체 행에 다시 펼친다
+# -------------------------------------------------------
+
+_ORG_CHARGE_RE = re.compile(r"^(.*)\((.*)\)$")
+
+# ○○시 → ○○군 → ○○구 순서로 우선 적용
+_REGION_RES = (
+    re.compile(r"([가-힣]+시)"),
+    re.compile(r"([가-힣]+군)"),
+    re.compile(r"([가-힣]+구)"),
+)
+
+DEFAULT_REGION = "전국"
+
+
+@lru_cache(maxsize=8192)
+def parse_org_and_charge(gubun: str) -> Tuple[str, str]:
+    """
+    구분 예시: '수원시 영통구청(영통3동 주민등록증 재발급 안내문)'
+    → ('수원시 영통구청', '영통3동 주민등록증 재발급 안내문')
+    괄호가 없으면 전체를 기관명으로 본다.
+    """
+    txt = gubun.strip()
+    m = _ORG_CHARGE_RE.match(txt)
+    if m:
+        return m.group(1).strip(), m.group(2).strip()
+    return txt, ""
+
+
+@lru_cache(maxsize=8192)
+def extract_region(org_name: str) -> str:
+    """
+    기관명에서 지역명 추출.
+    예: '수원시 영통구청' → '수원시'
+        '평택시종합관제사업소' → '평택시'
+        그 외 → '전국'
+    """
+    for pattern in _REGION_RES:
+        m = pattern.search(org_name)
+        if m:
+            return m.group(1)
+    return DEFAULT_REGION
+
+
+@lru_cache(maxsize=8192)
+def resolve_gubun(gubun: str) -> Tuple[str, str, str]:
+    """구분 → (지역, 기관명, 청구명). 반복되는 문자열은 intern 해서 공유."""
+    org_name, charge_name = parse_org_and_charge(gubun)
+    return (
+        sys.intern(extract_region(org_name)),
+        sys.intern(org_name),
+        sys.intern(charge_name),
+    )
+
+
+def _clean_text(s: pd.Series) -> pd.Series:
+    s = s.astype(object)
+    return s.where(s.notna(), "").astype(str)
+
+
+def resolve_gubun_series(gubun: pd.Series) -> pd.DataFrame:
+    """
+    구분 컬럼 전체를 (region, org_name, charge_name) 프레임으로.
+    고유값마다 resolve_gubun 을 한 번씩만 호출하고 factorize 코드로 펼친다.
+    """
+    codes, uniques = pd.factorize(_clean_text(gubun))
+    resolved = [resolve_gubun(u) for u in uniques]
+
+    if resolved:
+        table = np.array(resolved, dtype=object).reshape(len(resolved), 3)
+        values = table[codes]
+    else:
+        values = np.empty((0, 3), dtype=object)
+
+    return pd.DataFrame(values, index=gubun.index, columns=["region", "org_name", "charge_name"])
+
+
+def region_series(org_name: pd.Series) -> pd.Series:
+    """기관명 컬럼 → 지역 컬럼 (고유 기관명만 파싱)."""
+    codes, uniques = pd.factorize(_clean_text(org_name))
+    table = np.array([extract_region(u.strip()) for u in uniques], dtype=object)
+    return pd.Series(table[codes] if len(table) else [], index=org_name.index, dtype=object)
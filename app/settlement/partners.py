@@ -0,0 +1,150 @@
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.settlement.utils import find_column
+from app.utils.loader import PARTNER_DB_FILE
+
+
+# -------------------------------------------------------
+# 기관 담당자 DB (partner_db.xlsx / settings partner_db_path)
+#   워크북을 한 번 읽어 공통 컬럼으로 맞추고
+#   기관명 · Settle ID → 행 위치 dict 를 만들어 둔다.
+#   - 단건 조회: by_org / by_settle_id (dict 조회 O(1))
+#   - 일괄 조인: join (Index.get_indexer 한 번 + take)
+#   파일은 경로 + 수정시각 기준으로 캐시한다.
+# -------------------------------------------------------
+
+# 공통 컬럼명 → 원본 컬럼 후보 (앞쪽 우선)
+FIELD_CANDIDATES: Dict[str, List[str]] = {
+    "기관명": ["기관명", "기관", "이용기관명"],
+    "settle_id": ["Settle ID", "카카오 settle id", "settleid"],
+    "부서": ["부서", "부서명", "담당부서"],
+    "담당자": ["담당자", "담당자명", "성명", "이름"],
+    "연락처": ["연락처", "전화번호", "전화", "휴대폰"],
+    "이메일": ["이메일", "email", "메일"],
+}
+CONTACT_COLUMNS = ["부서", "담당자", "연락처", "이메일"]
+
+# 한 칸에 Settle ID 가 여러 개 적힌 경우 구분자
+_SETTLE_SPLIT = re.compile(r"[,/;\s]+")
+
+
+def _clean(s: pd.Series) -> pd.Series:
+    s = s.astype(object)
+    return s.where(s.notna(), "").astype(str).str.strip()
+
+
+class PartnerDirectory:
+    """
+    담당자 DB 한 벌. 같은 기관이 여러 줄이면 첫 줄을 대표 연락처로 쓴다.
+
+        partners = load_partner_directory(settings.get("partner_db_path"))
+        partners.by_org("수원시")           # {'기관명': ..., '담당자': ..., ...}
+        detail = partners.join(detail_df)   # 담당자 컬럼이 붙은 DF
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        org_col = find_column(df, FIELD_CANDIDATES["기관명"])
+        if org_col is None:
+            raise ValueError("담당자 DB에 기관명 컬럼이 없습니다.")
+
+        table = pd.DataFrame(index=df.index)
+        for field, candidates in FIELD_CANDIDATES.items():
+            src = find_column(df, candidates)
+            table[field] = _clean(df[src]) if src else ""
+
+        table = table[table["기관명"] != ""].reset_index(drop=True)
+        self.frame: pd.DataFrame = table
+
+        # 기관명 → 첫 행 위치
+        orgs = table["기관명"].to_numpy()
+        first = ~pd.Index(orgs).duplicated(keep="first")
+        self._org_pos: Dict[str, int] = dict(zip(orgs[first], np.flatnonzero(first).tolist()))
+
+        # Settle ID → 행 위치 (한 칸에 여러 ID 허용, 먼저 나온 행 우선)
+        self._sid_pos: Dict[str, int] = {}
+        for pos, cell in enumerate(table["settle_id"].to_numpy()):
+            if not cell:
+                continue
+            for sid in _SETTLE_SPLIT.split(cell):
+                if sid:
+                    self._sid_pos.setdefault(sid, pos)
+
+        # 일괄 조인용 기관 대표 행 (기관명 index)
+        self._org_frame = table.loc[first, ["기관명", *CONTACT_COLUMNS]].set_index("기관명")
+
+    @classmethod
+    def from_excel(cls, path, sheet_name=0) -> "PartnerDirectory":
+        # 연락처 앞자리 0 · Settle ID 숫자 변환 방지
+        return cls(pd.read_excel(path, sheet_name=sheet_name, dtype=str))
+
+    def __len__(self) -> int:
+        return len(self._org_pos)
+
+    def _record(self, pos: Optional[int]) -> Optional[dict]:
+        if pos is None:
+            return None
+        return self.frame.iloc[pos].to_dict()
+
+    def by_org(self, org_name: str) -> Optional[dict]:
+        return self._record(self._org_pos.get(str(org_name).strip()))
+
+    def by_settle_id(self, settle_id: str) -> Optional[dict]:
+        return self._record(self._sid_pos.get(str(settle_id).strip()))
+
+    def join(self, df: pd.DataFrame, on: str = "기관명") -> pd.DataFrame:
+        """
+        df[on](기관명) 기준으로 담당자 컬럼(부서/담당자/연락처/이메일)을 붙인다.
+        없는 기관은 빈 문자열. df 의 행 순서 · index 는 그대로.
+        """
+        keys = _clean(df[on])
+        pos = self._org_frame.index.get_indexer(keys)
+        found = pos >= 0
+
+        values = self._org_frame.to_numpy()
+        contacts = np.full((len(df), len(CONTACT_COLUMNS)), "", dtype=object)
+        contacts[found] = values[pos[found]]
+
+        out = df.copy()
+        for i, col in enumerate(CONTACT_COLUMNS):
+            out[col] = contacts[:, i]
+        return out
+
+    def missing_orgs(self, org_names) -> List[str]:
+        """담당자 DB에 없는 기관명 목록 (입력 순서, 중복 제거)"""
+        seen = dict.fromkeys(str(o).strip() for o in org_names)
+        return [o for o in seen if o and o not in self._org_pos]
+
+
+# -------------------------------------------------------
+# 로드 (경로 + 수정시각 기준 캐시)
+# -------------------------------------------------------
+
+_partner_cache: Dict[str, Tuple[float, PartnerDirectory]] = {}
+_partner_lock = threading.Lock()
+
+
+def load_partner_directory(path: Optional[str] = None) -> Optional[PartnerDirectory]:
+    """
+    path 가 비어 있으면 기본 PARTNER_DB_FILE. 파일이 없으면 None.
+    같은 파일이 바뀌지 않았으면 다시 읽지 않는다.
+    """
+    path = str(path or PARTNER_DB_FILE)
+    if not os.path.exists(path):
+        return None
+
+    mtime = os.path.getmtime(path)
+    with _partner_lock:
+        cached = _partner_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    directory = PartnerDirectory.from_excel(path)
+    with _partner_lock:
+        _partner_cache[path] = (mtime, directory)
+    return directory
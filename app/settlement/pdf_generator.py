@@ -4,20 +4,41 @@ from reportlab.platypus import Table, TableStyle
 from reportlab.lib import colors
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase import pdfmetrics
+from io import BytesIO
 import os
+import threading
 import pandas as pd
 
+from app.settlement.metrics import stage_timer
+
 
 # -------------------------------------
-# 폰트 등록 (Korean Friendly)
+# 폰트 (Korean Friendly)
+#   import 시점에는 등록하지 않고, 첫 PDF 생성 때 프로세스당 1회 등록한다.
+#   TTFont 는 문서마다 실제로 쓴 글리프만 서브셋으로 임베드한다.
+#   PREFERRED_FONT 는 "등록 시도할" 폰트일 뿐, 실제로 쓰는 폰트는
+#   get_renderer().font_name (등록 실패 시 Helvetica) 이다.
 # -------------------------------------
-FONT_NAME = "NotoSansKR"
+PREFERRED_FONT = "NotoSansKR"
+FONT_NAME = PREFERRED_FONT  # 기존 import 호환용 별칭
 FONT_FILE = "app/static/NotoSansKR-Regular.otf"
+FALLBACK_FONT = "Helvetica"
+
+_font_lock = threading.Lock()
+
 
-if os.path.exists(FONT_FILE):
-    pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_FILE))
-else:
-    FONT_NAME = "Helvetica"
+def _register_font(font_name: str, font_file: str) -> str:
+    """폰트를 등록하고 실제 사용할 폰트명을 반환 (파일 없음/로드 실패 시 Helvetica)."""
+    with _font_lock:
+        if font_name in pdfmetrics.getRegisteredFontNames():
+            return font_name
+        if not os.path.exists(font_file):
+            return FALLBACK_FONT
+        try:
+            pdfmetrics.registerFont(TTFont(font_name, font_file))
+        except Exception:
+            return FALLBACK_FONT
+        return font_name
 
 
 # 좌표 변환
@@ -25,139 +46,246 @@ def mm(v):
     return v * 2.83465
 
 
-# 텍스트 출력 헬퍼
-def draw_text(c, text, x, y, size=11):
-    c.setFont(FONT_NAME, size)
-    c.drawString(x, y, text)
+# 출력 대상 헬퍼
+#   save_path: 파일 경로 / 쓰기 가능한 버퍼(BytesIO 등) / None
+#   None 이면 메모리(BytesIO)에 렌더링하고 PDF bytes 를 반환한다.
+def _open_target(save_path):
+    if save_path is None:
+        return BytesIO()
+    return save_path
 
 
-# =====================================================================
-# ① 카카오 단일기관 PDF 생성
-# =====================================================================
-def generate_kakao_pdf(save_path, org_name, settle_id, summary_row, detail_df):
-    c = canvas.Canvas(save_path, pagesize=A4)
-    width, height = A4
+def _finish(c, save_path, target, timings=None):
+    with stage_timer(timings, "pdf.save"):
+        c.save()
+    if save_path is None:
+        return target.getvalue()
+    return None
 
-    # Page 1 — 기본요약
-    draw_text(c, f"[카카오 대금청구서] {org_name}", mm(20), height - mm(25), size=18)
-    draw_text(c, f"Settle ID : {settle_id}", mm(20), height - mm(40), size=12)
 
-    draw_text(c, "발송료:", mm(25), height - mm(65))
-    draw_text(c, f"{summary_row['발송료']:,} 원", mm(60), height - mm(65))
+# 텍스트 출력 헬퍼
+def draw_text(c, text, x, y, size=11):
+    c.setFont(get_renderer().font_name, size)
+    c.drawString(x, y, text)
 
-    draw_text(c, "인증료:", mm(25), height - mm(80))
-    draw_text(c, f"{summary_row['인증료']:,} 원", mm(60), height - mm(80))
 
-    draw_text(c, "부가세:", mm(25), height - mm(95))
-    draw_text(c, f"{summary_row['부가세']:,} 원", mm(60), height - mm(95))
+MONTH_TABLE_COLS = [
+    "1월","2월","3월","4월","5월","6월",
+    "7월","8월","9월","10월","11월","12월","합 계"
+]
 
-    draw_text(c, "총 합계:", mm(25), height - mm(115), size=14)
-    draw_text(c, f"{summary_row['총금액']:,} 원", mm(60), height - mm(115), size=14)
 
-    c.showPage()
+# =====================================================================
+# PDF 렌더러
+#   폰트 · TableStyle · 고정 문구 배치(템플릿)를 한 번만 만들어 두고
+#   청구서마다 가변 데이터(기관명/금액/표 내용)만 그린다.
+#   일괄 생성 시 get_renderer() 로 같은 인스턴스를 재사용한다.
+# =====================================================================
+class PdfRenderer:
+    def __init__(self, font_name: str = PREFERRED_FONT, font_file: str = FONT_FILE):
+        self._font_request = (font_name, font_file)
+        self._font_name = None
+        self._styles = None
+
+        _, height = A4
+        self.height = height
+
+        # 고정 문구: (텍스트, x, y, 크기) — 좌표는 미리 계산
+        self.kakao_labels = [
+            ("발송료:", mm(25), height - mm(65), 11),
+            ("인증료:", mm(25), height - mm(80), 11),
+            ("부가세:", mm(25), height - mm(95), 11),
+            ("총 합계:", mm(25), height - mm(115), 14),
+        ]
+        self.kakao_values = [
+            ("발송료", mm(60), height - mm(65), 11),
+            ("인증료", mm(60), height - mm(80), 11),
+            ("부가세", mm(60), height - mm(95), 11),
+            ("총금액", mm(60), height - mm(115), 14),
+        ]
+        self.multi_cover_labels = [
+            ("[대금청구서(다수기관)]", mm(20), height - mm(25), 18),
+            ("총 합계 :", mm(20), height - mm(95), 11),
+        ]
+
+    # ---------------------------
+    # 지연 로딩 자원
+    # ---------------------------
+    @property
+    def font_name(self) -> str:
+        if self._font_name is None:
+            self._font_name = _register_font(*self._font_request)
+        return self._font_name
+
+    @property
+    def styles(self) -> dict:
+        """표 스타일은 내용과 무관하므로 렌더러당 1회 생성해 공유"""
+        if self._styles is None:
+            font = self.font_name
+            self._styles = {
+                "kakao_detail": TableStyle(
+                    [
+                        ("FONTNAME", (0, 0), (-1, -1), font),
+                        ("FONTSIZE", (0, 0), (-1, -1), 9),
+                        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+                        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                        ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
+                    ]
+                ),
+                "multi_month": TableStyle(
+                    [
+                        ("FONTNAME", (0, 0), (-1, -1), font),
+                        ("FONTSIZE", (0, 0), (-1, -1), 9),
+                        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+                        ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
+                    ]
+                ),
+                "multi_total": TableStyle(
+                    [
+                        ("FONTNAME", (0, 0), (-1, -1), font),
+                        ("FONTSIZE", (0, 0), (-1, -1), 10),
+                        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+                        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                        ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
+                    ]
+                ),
+            }
+        return self._styles
+
+    # ---------------------------
+    # 그리기 헬퍼
+    # ---------------------------
+    def _draw_lines(self, c, lines):
+        """(텍스트, x, y, 크기) 목록 출력. 글자 크기가 바뀔 때만 setFont 호출."""
+        font = self.font_name
+        current = None
+        for text, x, y, size in lines:
+            if size != current:
+                c.setFont(font, size)
+                current = size
+            c.drawString(x, y, text)
+
+    def _draw_table(self, c, data, col_widths, style, x):
+        table = Table(data, colWidths=col_widths)
+        table.setStyle(self.styles[style])
+        table.wrapOn(c, x, self.height - mm(200))
+        table.drawOn(c, x, self.height - mm(250))
+
+    # =================================================================
+    # ① 카카오 단일기관 PDF
+    #   timings: dict 를 넘기면 pdf.text / pdf.table / pdf.save 단계 시간(초)을 누적
+    # =================================================================
+    def render_kakao(self, save_path, org_name, settle_id, summary_row, detail_df, timings=None):
+        target = _open_target(save_path)
+        c = canvas.Canvas(target, pagesize=A4)
+        height = self.height
+
+        # Page 1 — 기본요약
+        with stage_timer(timings, "pdf.text"):
+            self._draw_lines(
+                c,
+                [
+                    (f"[카카오 대금청구서] {org_name}", mm(20), height - mm(25), 18),
+                    (f"Settle ID : {settle_id}", mm(20), height - mm(40), 12),
+                    *self.kakao_labels,
+                    *[
+                        (f"{summary_row[key]:,} 원", x, y, size)
+                        for key, x, y, size in self.kakao_values
+                    ],
+                ],
+            )
+            c.showPage()
+
+            # Page 2 — 상세내역
+            self._draw_lines(c, [(f"[상세내역] {org_name}", mm(20), height - mm(25), 15)])
+
+        with stage_timer(timings, "pdf.table"):
+            table_data = [detail_df.columns.tolist()] + detail_df.values.tolist()
+            self._draw_table(
+                c, table_data, [mm(25)] * len(detail_df.columns), "kakao_detail", mm(15)
+            )
+
+        c.showPage()
+        return _finish(c, save_path, target, timings)
+
+    # =================================================================
+    # ② 다수기관 PDF
+    # =================================================================
+    def render_multi(self, save_path, org_rows_df, timings=None):
+        target = _open_target(save_path)
+        c = canvas.Canvas(target, pagesize=A4)
+        height = self.height
+
+        row = org_rows_df.iloc[0]
+        org_name = row.get("기관명", "")
+        total_amt = int(row.get("합 계", row.get("합계", 0)))
+
+        # Page 1 — 표지
+        with stage_timer(timings, "pdf.text"):
+            self._draw_lines(
+                c,
+                [
+                    *self.multi_cover_labels,
+                    (f"기관명 : {org_name}", mm(20), height - mm(45), 11),
+                    (f"청구명 : {row.get('청구명', '')}", mm(20), height - mm(60), 11),
+                    (f"부서 : {row.get('부서(서식)', '')}", mm(20), height - mm(75), 11),
+                    (f"{total_amt:,} 원", mm(60), height - mm(95), 14),
+                ],
+            )
+            c.showPage()
+
+            # Page 2 — 월별 금액표
+            self._draw_lines(c, [(f"[월별 금액표] {org_name}", mm(20), height - mm(25), 15)])
+
+        with stage_timer(timings, "pdf.table"):
+            month_cols = [x for x in MONTH_TABLE_COLS if x in org_rows_df.columns]
+
+            table_data = [["항목"] + month_cols]
+            table_data.append(["금액"] + [f"{int(row[c]):,}" for c in month_cols])
+            self._draw_table(
+                c, table_data, [mm(25)] * len(table_data[0]), "multi_month", mm(20)
+            )
+
+        c.showPage()
+
+        # Page 3 — 총괄표
+        with stage_timer(timings, "pdf.text"):
+            self._draw_lines(c, [(f"[총괄표] {org_name}", mm(20), height - mm(25), 15)])
+
+        with stage_timer(timings, "pdf.table"):
+            total_table = [
+                ["항목", "금액"],
+                ["발송료", f"{int(row.get('정산발송료', 0)):,}"],
+                ["인증료", f"{int(row.get('정산인증료', 0)):,}"],
+                ["부가세", f"{int(row.get('부가세', 0)):,}"],
+                ["총금액", f"{total_amt:,}"],
+            ]
+            self._draw_table(c, total_table, [mm(40), mm(40)], "multi_total", mm(20))
 
-    # Page 2 — 상세내역
-    draw_text(c, f"[상세내역] {org_name}", mm(20), height - mm(25), size=15)
+        c.showPage()
+        return _finish(c, save_path, target, timings)
 
-    table_data = [detail_df.columns.tolist()] + detail_df.values.tolist()
-    table = Table(table_data, colWidths=[mm(25)] * len(detail_df.columns))
 
-    table.setStyle(
-        TableStyle(
-            [
-                ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
-            ]
-        )
-    )
+_renderer = None
 
-    table.wrapOn(c, mm(15), height - mm(200))
-    table.drawOn(c, mm(15), height - mm(250))
 
-    c.showPage()
-    c.save()
+def get_renderer() -> PdfRenderer:
+    """프로세스 공용 렌더러 (프로세스 풀 워커도 워커당 1개를 재사용)"""
+    global _renderer
+    if _renderer is None:
+        _renderer = PdfRenderer()
+    return _renderer
 
 
 # =====================================================================
-# ② 다수기관 PDF 생성
+# 기존 함수형 API — 공용 렌더러에 위임
 # =====================================================================
-def generate_multi_pdf(save_path, org_rows_df):
-    c = canvas.Canvas(save_path, pagesize=A4)
-    width, height = A4
-
-    row = org_rows_df.iloc[0]
-
-    # Page 1 — 표지
-    draw_text(c, "[대금청구서(다수기관)]", mm(20), height - mm(25), size=18)
-    draw_text(c, f"기관명 : {row.get('기관명', '')}", mm(20), height - mm(45))
-    draw_text(c, f"청구명 : {row.get('청구명', '')}", mm(20), height - mm(60))
-    draw_text(c, f"부서 : {row.get('부서(서식)', '')}", mm(20), height - mm(75))
-
-    total_amt = int(row.get("합 계", row.get("합계", 0)))
-    draw_text(c, "총 합계 :", mm(20), height - mm(95))
-    draw_text(c, f"{total_amt:,} 원", mm(60), height - mm(95), size=14)
-
-    c.showPage()
-
-    # Page 2 — 월별 금액표
-    draw_text(c, f"[월별 금액표] {row.get('기관명','')}", mm(20), height - mm(25), size=15)
-
-    month_cols = [
-        "1월","2월","3월","4월","5월","6월",
-        "7월","8월","9월","10월","11월","12월","합 계"
-    ]
-    month_cols = [x for x in month_cols if x in org_rows_df.columns]
-
-    table_data = [["항목"] + month_cols]
-    table_data.append(["금액"] + [f"{int(row[c]):,}" for c in month_cols])
-
-    table = Table(table_data, colWidths=[mm(25)] * len(table_data[0]))
-    table.setStyle(
-        TableStyle(
-            [
-                ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
-            ]
-        )
-    )
-
-    table.wrapOn(c, mm(20), height - mm(200))
-    table.drawOn(c, mm(20), height - mm(250))
-
-    c.showPage()
-
-    # Page 3 — 총괄표
-    draw_text(c, f"[총괄표] {row.get('기관명','')}", mm(20), height - mm(25), size=15)
-
-    total_table = [
-        ["항목", "금액"],
-        ["발송료", f"{int(row.get('정산발송료', 0)):,}"],
-        ["인증료", f"{int(row.get('정산인증료', 0)):,}"],
-        ["부가세", f"{int(row.get('부가세', 0)):,}"],
-        ["총금액", f"{total_amt:,}"],
-    ]
-
-    tt = Table(total_table, colWidths=[mm(40), mm(40)])
-    tt.setStyle(
-        TableStyle(
-            [
-                ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
-            ]
-        )
+def generate_kakao_pdf(save_path, org_name, settle_id, summary_row, detail_df, timings=None):
+    return get_renderer().render_kakao(
+        save_path, org_name, settle_id, summary_row, detail_df, timings=timings
     )
 
-    tt.wrapOn(c, mm(20), height - mm(200))
-    tt.drawOn(c, mm(20), height - mm(250))
 
-    c.showPage()
-    c.save()
+def generate_multi_pdf(save_path, org_rows_df, timings=None):
+    return get_renderer().render_multi(save_path, org_rows_df, timings=timings)
@@ -1,14 +1,23 @@
-import re
+import heapq
+import sys
 from dataclasses import dataclass
 from typing import Dict, List, Literal, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from app.settlement.parsing import (
+    extract_region,
+    parse_org_and_charge,
+    resolve_gubun_series,
+)
+from app.settlement.partners import PartnerDirectory
+
 
 # -----------------------------
 #  데이터 구조 정의
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class OrgSummary:
     org_name: str
     charge_name: str          # 청구명 (구분에서 괄호 안)
@@ -20,6 +29,20 @@ class OrgSummary:
     pdf_type: Literal["kakao", "multi"]  # PDF 템플릿 유형
 
 
+# build_org_frame() 컬럼 순서 = OrgSummary 필드 순서
+ORG_FRAME_COLUMNS = [
+    "org_name",
+    "charge_name",
+    "region",
+    "total_amount",
+    "vat_amount",
+    "is_kakao_only",
+    "has_vat",
+    "pdf_type",
+]
+ORG_STR_COLUMNS = {"org_name", "charge_name", "region", "pdf_type"}
+
+
 @dataclass
 class OverviewResult:
     # ① 총 매출
@@ -68,9 +91,11 @@ class SettlementProcessor:
         drafts_df: pd.DataFrame,
         kakao_df: pd.DataFrame,
     ):
-        self.rates_df = rates_df.copy()
-        self.drafts_df = drafts_df.copy()
-        self.kakao_df = kakao_df.copy()
+        # 입력 DF는 읽기 전용으로 참조만 한다 (copy 하지 않음).
+        # 엔진이 만드는 컬럼은 모두 별도의 파생 프레임에 추가한다.
+        self.rates_df = rates_df
+        self.drafts_df = drafts_df
+        self.kakao_df = kakao_df
 
         # 내부 캐시
         self.org_rows: List[OrgSummary] = []
@@ -90,35 +115,17 @@ class SettlementProcessor:
         """
         구분 예시: '수원시 영통구청(영통3동 주민등록증 재발급 안내문)'
         → ('수원시 영통구청', '영통3동 주민등록증 재발급 안내문')
+        (parsing.parse_org_and_charge 위임)
         """
-        txt = from_gubun.strip()
-        m = re.match(r"^(.*)\((.*)\)$", txt)
-        if m:
-            return m.group(1).strip(), m.group(2).strip()
-        return txt, ""  # 괄호 없으면 전체를 기관명으로
+        return parse_org_and_charge(from_gubun)
 
     @staticmethod
     def _extract_region(org_name: str) -> str:
         """
-        기관명에서 지역명 추출.
-        예: '수원시 영통구청' → '수원시'
-            '평택시종합관제사업소' → '평택시'
-            그 외 → '전국'
+        기관명에서 지역명 추출. 예: '수원시 영통구청' → '수원시', 그 외 → '전국'
+        (parsing.extract_region 위임)
         """
-        # ○○시, ○○군, ○○구 패턴
-        m = re.search(r"([가-힣]+시)", org_name)
-        if m:
-            return m.group(1)
-
-        m = re.search(r"([가-힣]+군)", org_name)
-        if m:
-            return m.group(1)
-
-        m = re.search(r"([가-힣]+구)", org_name)
-        if m:
-            return m.group(1)
-
-        return "전국"
+        return extract_region(org_name)
 
     @staticmethod
     def _normalize_yes(value) -> bool:
@@ -127,119 +134,130 @@ class SettlementProcessor:
         return s in {"Y", "O", "YES", "예", "과세", "별도"}
 
     # -----------------------------
-    #  1) 카카오 단일 / 다수기관 판별용 맵 생성
+    #  컬럼 단위(벡터) 유틸
     # -----------------------------
-    def _build_org_type_map(self) -> Dict[str, bool]:
-        """
-        rates_df(2025 발송료) 기준으로
-        - 카카오만 사용하는 기관 → True
-        - 카카오+KT 등 다중 중계자 → False
-        """
-        org_type: Dict[str, bool] = {}
-
-        for _, row in self.rates_df.iterrows():
-            기관명 = self._clean_str(row.get("기관명", ""))
-
-            if not 기관명:
-                continue
-
-            carrier1 = self._clean_str(row.get("중계자(1)", ""))
-            carrier2 = self._clean_str(row.get("중계자(2)", ""))
-            carrier3 = self._clean_str(row.get("중계자(3)", ""))
+    @staticmethod
+    def _column(df: pd.DataFrame, col: str, default=None) -> pd.Series:
+        """컬럼이 없으면 default 값으로 채운 Series 반환 (row.get 과 동일한 의미)."""
+        if col in df.columns:
+            return df[col]
+        return pd.Series(default, index=df.index, dtype=object)
 
-            carriers = {c for c in [carrier1, carrier2, carrier3] if c}
+    @staticmethod
+    def _clean_series(s: pd.Series) -> pd.Series:
+        """_clean_str 의 컬럼 버전: NaN → '', 나머지는 문자열 + strip."""
+        s = s.astype(object)
+        return s.where(s.notna(), "").astype(str).str.strip()
 
-            if not carriers:
-                # 중계자 정보 없으면 일단 다수기관으로 보지 않고 False
-                org_type[기관명] = False
-                continue
+    @staticmethod
+    def _to_int_series(s: pd.Series) -> pd.Series:
+        """int(round(float(x))) 의 컬럼 버전. 변환 불가/NaN/inf 는 0."""
+        num = pd.to_numeric(s.astype(object), errors="coerce").astype(float)
+        num = num.where(np.isfinite(num), 0.0)
+        return num.round().astype("int64")
 
-            # 카카오만 있으면 True, 그 외는 False
-            if carriers == {"카카오"}:
-                org_type[기관명] = True
-            else:
-                org_type[기관명] = False
+    # -----------------------------
+    #  1) 기관 속성 프레임 (카카오 단일 여부 + VAT 여부)
+    # -----------------------------
+    def _build_org_attr_frame(self) -> pd.DataFrame:
+        """
+        rates_df(2025 발송료) 기준 기관별 속성을 한 번에 계산한다.
+        - is_kakao_only : 중계자(1..3)가 카카오뿐인 기관 → True
+                          (카카오+KT 등 다중 중계자, 중계자 정보 없음 → False)
+        - has_vat       : '부가세' 컬럼 값이 예/과세/Y 이면 True (부가세 별도)
+        같은 기관명이 여러 줄이면 마지막 줄 기준.
+        """
+        rates = self.rates_df
+        org = self._clean_series(self._column(rates, "기관명", ""))
+
+        carriers = [
+            self._clean_series(self._column(rates, f"중계자({i})", ""))
+            for i in (1, 2, 3)
+        ]
+        has_carrier = carriers[0].ne("") | carriers[1].ne("") | carriers[2].ne("")
+        all_kakao = pd.Series(True, index=rates.index)
+        for c in carriers:
+            all_kakao &= c.eq("") | c.eq("카카오")
+
+        vat_raw = self._column(rates, "부가세", "")
+        has_vat = (
+            vat_raw.astype(object).astype(str).str.strip().str.upper()
+            .isin(["Y", "O", "YES", "예", "과세", "별도"])
+        )
 
-        return org_type
+        attrs = pd.DataFrame(
+            {
+                "org_name": org,
+                "is_kakao_only": (has_carrier & all_kakao).astype(bool),
+                "has_vat": has_vat.astype(bool),
+            }
+        )
+        attrs = attrs[attrs["org_name"] != ""]
+        return attrs.drop_duplicates("org_name", keep="last")
 
     # -----------------------------
-    #  2) VAT 여부 맵 생성
+    #  3) 기안자료 → 기관별 정산 프레임 (벡터 연산)
     # -----------------------------
-    def _build_vat_map(self) -> Dict[str, bool]:
+    def build_org_frame(self) -> pd.DataFrame:
         """
-        rates_df 기준으로 기관별 VAT 여부를 판단.
-        - '부가세' 컬럼 값이 예/과세/Y 이면 True (부가세 별도)
+        기안자료 한 줄 = 기관+청구명 1건.
+        구분 파싱/지역 추출/금액 변환을 컬럼 단위로 처리하고
+        기관 속성 프레임과 merge 하여 OrgSummary 와 같은 컬럼의 DF를 만든다.
         """
-        vat_map: Dict[str, bool] = {}
+        drafts = self.drafts_df
 
-        for _, row in self.rates_df.iterrows():
-            기관명 = self._clean_str(row.get("기관명", ""))
-            if not 기관명:
-                continue
+        gubun = self._clean_series(self._column(drafts, "구분", ""))
+        gubun = gubun[gubun != ""]
 
-            vat_flag = self._normalize_yes(row.get("부가세", ""))
-            vat_map[기관명] = vat_flag
+        # 고유 구분값만 파싱(캐시) 후 전체 행에 펼침
+        resolved = resolve_gubun_series(gubun)
 
-        return vat_map
+        # 정산금액이 없으면 '금액' 컬럼을 사용 (파일 구조에 따라 조정)
+        amount_raw = self._column(drafts, "정산금액").loc[gubun.index]
+        amount_raw = amount_raw.where(
+            amount_raw.notna(), self._column(drafts, "금액", 0).loc[gubun.index]
+        )
+        total_amount = self._to_int_series(amount_raw)
+        vat_amount = self._to_int_series(self._column(drafts, "부가세", 0).loc[gubun.index])
+
+        frame = pd.DataFrame(
+            {
+                "org_name": resolved["org_name"],
+                "charge_name": resolved["charge_name"],
+                "region": resolved["region"],
+                "total_amount": total_amount,
+                "vat_amount": vat_amount,
+            }
+        )
+
+        attrs = self._build_org_attr_frame()
+        frame = frame.merge(attrs, on="org_name", how="left")
+
+        frame["is_kakao_only"] = frame["is_kakao_only"].fillna(False).astype(bool)
+        frame["has_vat"] = (
+            frame["has_vat"].astype(object)
+            .where(frame["has_vat"].notna(), frame["vat_amount"] > 0)
+            .astype(bool)
+        )
+        frame["pdf_type"] = np.where(frame["is_kakao_only"], "kakao", "multi")
+
+        return frame[ORG_FRAME_COLUMNS]
 
-    # -----------------------------
-    #  3) 기안자료 → OrgSummary 리스트 구축
-    # -----------------------------
     def build_org_rows(self):
         """
-        기안자료에서 한 줄 = 기관+청구명 1건으로 보고,
-        OrgSummary 리스트를 채운다.
+        build_org_frame() 결과를 OrgSummary 리스트로 변환해 채운다.
         """
-        org_type_map = self._build_org_type_map()
-        vat_map = self._build_vat_map()
-
-        rows: List[OrgSummary] = []
-
-        df = self.drafts_df.copy()
-        # 칼럼명은 실제 기안자료 기준으로 맞추어야 함
-        # 예: 순번, 구분, 발송료, 인증료, 부가세, 금액, 정산금액 등
-        for _, row in df.iterrows():
-            gubun = self._clean_str(row.get("구분", ""))
-            if not gubun:
-                continue
-
-            org_name, charge_name = self._parse_org_and_charge(gubun)
-
-            # 정산금액이 없으면 '금액' 컬럼을 사용 (파일 구조에 따라 조정)
-            amount = row.get("정산금액", None)
-            if pd.isna(amount):
-                amount = row.get("금액", 0)
-            try:
-                amount_int = int(round(float(amount)))
-            except Exception:
-                amount_int = 0
-
-            vat_value = row.get("부가세", 0)
-            try:
-                vat_int = int(round(float(vat_value)))
-            except Exception:
-                vat_int = 0
-
-            is_kakao_only = org_type_map.get(org_name, False)
-            has_vat = vat_map.get(org_name, vat_int > 0)
-            pdf_type: Literal["kakao", "multi"] = "kakao" if is_kakao_only else "multi"
-
-            region = self._extract_region(org_name)
-
-            rows.append(
-                OrgSummary(
-                    org_name=org_name,
-                    charge_name=charge_name,
-                    region=region,
-                    total_amount=amount_int,
-                    vat_amount=vat_int,
-                    is_kakao_only=is_kakao_only,
-                    has_vat=has_vat,
-                    pdf_type=pdf_type,
-                )
-            )
-
-        self.org_rows = rows
+        frame = self.build_org_frame()
+
+        # 문자열 컬럼은 intern → 같은 기관명/지역/유형은 객체 하나를 공유
+        columns = []
+        for c in ORG_FRAME_COLUMNS:
+            values = frame[c].tolist()
+            if c in ORG_STR_COLUMNS:
+                values = list(map(sys.intern, values))
+            columns.append(values)
+
+        self.org_rows = [OrgSummary(*values) for values in zip(*columns)]
 
     # -----------------------------
     #  4) 누락기관(Settle ID 기준) 추출
@@ -272,35 +290,48 @@ class SettlementProcessor:
         if not self.org_rows:
             self.build_org_rows()
 
-        total_amount = sum(r.total_amount for r in self.org_rows)
-        kakao_amount = sum(r.total_amount for r in self.org_rows if r.is_kakao_only)
-        multi_amount = sum(r.total_amount for r in self.org_rows if not r.is_kakao_only)
+        total_amount = kakao_amount = 0
+        invoice_count_kakao = 0
+        vat_excluded_amount = 0
+        pdf_kakao_count = pdf_multi_count = 0
+        vat_included_set = set()
+        vat_excluded_set = set()
+        region_amounts: Dict[str, int] = {}
+        org_amounts: Dict[str, int] = {}
+
+        # org_rows 한 번만 순회하면서 ①~⑥ 누적
+        for r in self.org_rows:
+            amt = r.total_amount
+            total_amount += amt
 
-        invoice_count_total = len(self.org_rows)
-        invoice_count_kakao = len([r for r in self.org_rows if r.is_kakao_only])
-        invoice_count_multi = len([r for r in self.org_rows if not r.is_kakao_only])
+            if r.is_kakao_only:
+                kakao_amount += amt
+                invoice_count_kakao += 1
 
-        vat_included_amount = sum(r.total_amount for r in self.org_rows if not r.has_vat)
-        vat_excluded_amount = sum(r.total_amount for r in self.org_rows if r.has_vat)
+            if r.has_vat:
+                vat_excluded_amount += amt
+                vat_excluded_set.add(r.org_name)
+            else:
+                vat_included_set.add(r.org_name)
 
-        vat_included_orgs = sorted({r.org_name for r in self.org_rows if not r.has_vat})
-        vat_excluded_orgs = sorted({r.org_name for r in self.org_rows if r.has_vat})
+            region_amounts[r.region] = region_amounts.get(r.region, 0) + amt
+            org_amounts[r.org_name] = org_amounts.get(r.org_name, 0) + amt
 
-        region_amounts: Dict[str, int] = {}
-        for r in self.org_rows:
-            region_amounts.setdefault(r.region, 0)
-            region_amounts[r.region] += r.total_amount
+            if r.pdf_type == "kakao":
+                pdf_kakao_count += 1
+            elif r.pdf_type == "multi":
+                pdf_multi_count += 1
 
-        # 기관별 TOP 3
-        org_amounts: Dict[str, int] = {}
-        for r in self.org_rows:
-            org_amounts.setdefault(r.org_name, 0)
-            org_amounts[r.org_name] += r.total_amount
+        invoice_count_total = len(self.org_rows)
+        invoice_count_multi = invoice_count_total - invoice_count_kakao
+        multi_amount = total_amount - kakao_amount
+        vat_included_amount = total_amount - vat_excluded_amount
 
-        top3 = sorted(org_amounts.items(), key=lambda x: x[1], reverse=True)[:3]
+        vat_included_orgs = sorted(vat_included_set)
+        vat_excluded_orgs = sorted(vat_excluded_set)
 
-        pdf_kakao_count = len([r for r in self.org_rows if r.pdf_type == "kakao"])
-        pdf_multi_count = len([r for r in self.org_rows if r.pdf_type == "multi"])
+        # 기관별 TOP 3 (전체 정렬 없이 상위 3개만)
+        top3 = heapq.nlargest(3, org_amounts.items(), key=lambda x: x[1])
 
         return OverviewResult(
             total_amount=total_amount,
@@ -322,29 +353,33 @@ class SettlementProcessor:
     # -----------------------------
     #  6) PDF/엑셀용 상세 DF 반환
     # -----------------------------
-    def to_detail_dataframe(self) -> pd.DataFrame:
+    def to_detail_dataframe(self, partners: Optional[PartnerDirectory] = None) -> pd.DataFrame:
         """
         OrgSummary 리스트를 DataFrame으로 변환.
         PDF/엑셀 상세내역 생성의 베이스가 된다.
+        partners 를 주면 기관명 기준으로 담당자 컬럼을 한 번에 붙인다.
         """
         if not self.org_rows:
             self.build_org_rows()
 
-        data = []
-        for r in self.org_rows:
-            data.append(
-                {
-                    "기관명": r.org_name,
-                    "청구명": r.charge_name,
-                    "지역": r.region,
-                    "정산금액": r.total_amount,
-                    "부가세": r.vat_amount,
-                    "카카오전용": "Y" if r.is_kakao_only else "N",
-                    "VAT별도": "Y" if r.has_vat else "N",
-                    "PDF유형": r.pdf_type,
-                }
-            )
-        return pd.DataFrame(data)
+        # 행마다 dict 를 만들지 않고 필드별 컬럼 리스트로 바로 변환
+        rows = self.org_rows
+        is_kakao_only = np.fromiter((r.is_kakao_only for r in rows), dtype=bool, count=len(rows))
+        has_vat = np.fromiter((r.has_vat for r in rows), dtype=bool, count=len(rows))
+
+        detail = pd.DataFrame(
+            {
+                "기관명": [r.org_name for r in rows],
+                "청구명": [r.charge_name for r in rows],
+                "지역": [r.region for r in rows],
+                "정산금액": [r.total_amount for r in rows],
+                "부가세": [r.vat_amount for r in rows],
+                "카카오전용": np.where(is_kakao_only, "Y", "N").astype(object),
+                "VAT별도": np.where(has_vat, "Y", "N").astype(object),
+                "PDF유형": [r.pdf_type for r in rows],
+            }
+        )
+        return partners.join(detail) if partners is not None else detail
 
     def get_missing_settle_ids(self) -> List[str]:
         if not self.missing_settle_ids:
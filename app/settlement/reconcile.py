@@ -0,0 +1,235 @@
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.settlement.uploader import load_kakao_stats
+
+
+# -------------------------------------------------------
+# 연간(다월) 대사 엔진
+#   카카오 월별 통계 N개 ↔ '2025년 발송료' 1월~12월 컬럼을
+#   Settle ID × 월 행렬 두 개로 만든 뒤 한 번에 비교한다.
+# -------------------------------------------------------
+
+MONTHS = list(range(1, 13))
+MONTH_COLS = [f"{m}월" for m in MONTHS]
+
+KAKAO_AMOUNT_CANDIDATES = ["금액", "정산금액", "청구금액", "합계", "총금액"]
+
+STATUS_MISSING = "누락"          # 카카오에는 있는데 마스터에 Settle ID 없음
+STATUS_EXTRA = "초과"            # 마스터에는 금액이 있는데 해당 월 카카오 통계에 없음
+STATUS_MISMATCH = "금액불일치"    # 양쪽 다 있으나 금액 차이 > tolerance
+
+DEFAULT_LOAD_WORKERS = 4         # 월별 xlsx 동시 로드 수 (PDF 렌더 풀과 별도)
+
+
+def guess_month(filename: str) -> Optional[int]:
+    """
+    파일명에서 월 추출.
+    예: '카카오_3월.xlsx' → 3, 'kakao_2025-11.xlsx' → 11, 'stats_202507.xlsx' → 7
+    """
+    for pattern in (r"(\d{1,2})\s*월", r"20\d{2}[-_.]?(\d{2})(?!\d)"):
+        m = re.search(pattern, filename)
+        if m and 1 <= int(m.group(1)) <= 12:
+            return int(m.group(1))
+    return None
+
+
+def _load_month(args: Tuple[int, bytes, str]) -> Tuple[int, pd.DataFrame]:
+    month, data, engine = args
+    return month, load_kakao_stats(BytesIO(data), engine=engine)
+
+
+def load_monthly_files(
+    files: Dict[int, Union[bytes, List[bytes]]],
+    workers: Optional[int] = None,
+    engine: str = "openpyxl",
+    use_processes: bool = True,
+) -> Dict[int, pd.DataFrame]:
+    """
+    {월: xlsx bytes (또는 bytes 목록)} → {월: 카카오 통계 DF}, 파일들을 병렬로 읽는다.
+    같은 월 파일이 여러 개면 읽은 순서대로 이어 붙인다.
+    엑셀 파싱은 GIL 을 잡는 CPU 작업이라 기본은 프로세스 풀.
+    - workers=None : DEFAULT_LOAD_WORKERS (설정 load_workers 로 조정)
+    """
+    tasks = [
+        (month, data, engine)
+        for month, items in sorted(files.items())
+        for data in ([items] if isinstance(items, (bytes, bytearray)) else items)
+    ]
+    if not tasks:
+        return {}
+
+    if workers is None:
+        workers = DEFAULT_LOAD_WORKERS
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        loaded = list(map(_load_month, tasks))
+    else:
+        if use_processes:
+            # 페이지(스크립트) 스레드에서 호출되므로 fork 대신 spawn
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+        with pool as ex:
+            loaded = list(ex.map(_load_month, tasks))
+
+    frames: Dict[int, List[pd.DataFrame]] = {}
+    for month, df in loaded:
+        frames.setdefault(month, []).append(df)
+    return {
+        month: parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+        for month, parts in frames.items()
+    }
+
+
+def _clean_ids(s: pd.Series) -> pd.Series:
+    s = s.astype(object)
+    return s.where(s.notna(), "").astype(str).str.strip()
+
+
+@dataclass
+class ReconcileResult:
+    kakao_matrix: pd.DataFrame     # Settle ID × 월 (카카오 합계, 없으면 NaN)
+    master_matrix: pd.DataFrame    # Settle ID × 월 (마스터 금액, 없으면 NaN)
+    cells: pd.DataFrame            # 문제 셀 목록: settle_id, 월, 카카오금액, 마스터금액, 차이, 상태
+
+    def counts(self) -> Dict[str, int]:
+        vc = self.cells["상태"].value_counts()
+        return {s: int(vc.get(s, 0)) for s in (STATUS_MISSING, STATUS_EXTRA, STATUS_MISMATCH)}
+
+
+class MultiMonthReconciler:
+    """
+    rates_df('2025년 발송료')의 월 컬럼과 여러 달의 카카오 통계를 한 번에 대사.
+
+    - kakao_key / kakao_amount_col : 카카오 통계의 Settle ID / 금액 컬럼
+      (금액 컬럼 미지정 시 KAKAO_AMOUNT_CANDIDATES 순서로 탐색)
+    - master_key : 발송료 시트의 카카오 settle id 컬럼
+    - tolerance  : 금액불일치로 보지 않는 허용 오차(원)
+    """
+
+    def __init__(
+        self,
+        rates_df: pd.DataFrame,
+        kakao_key: str = "Settle ID",
+        kakao_amount_col: Optional[str] = None,
+        master_key: str = "카카오 settle id",
+        tolerance: float = 0,
+    ):
+        self.rates_df = rates_df
+        self.kakao_key = kakao_key
+        self.kakao_amount_col = kakao_amount_col
+        self.master_key = master_key
+        self.tolerance = tolerance
+
+    # ---------------------------
+    # 행렬 생성
+    # ---------------------------
+    def master_matrix(self) -> pd.DataFrame:
+        rates = self.rates_df
+        month_cols = [c for c in MONTH_COLS if c in rates.columns]
+
+        values = pd.DataFrame(
+            {
+                int(c[:-1]): pd.to_numeric(rates[c], errors="coerce")
+                for c in month_cols
+            },
+            index=rates.index,
+        )
+        ids = _clean_ids(rates[self.master_key]) if self.master_key in rates.columns else pd.Series("", index=rates.index)
+        values = values[ids != ""]
+
+        # 같은 Settle ID 가 여러 줄이면 합산 (전부 NaN 이면 NaN 유지)
+        matrix = values.groupby(ids[ids != ""]).sum(min_count=1)
+        matrix.index.name = "settle_id"
+        return matrix.reindex(columns=MONTHS)
+
+    def _amount_col(self, df: pd.DataFrame) -> Optional[str]:
+        if self.kakao_amount_col:
+            return self.kakao_amount_col if self.kakao_amount_col in df.columns else None
+        for c in KAKAO_AMOUNT_CANDIDATES:
+            if c in df.columns:
+                return c
+        return None
+
+    def kakao_matrix(self, monthly: Dict[int, pd.DataFrame]) -> pd.DataFrame:
+        """{월: 카카오 DF} → Settle ID × 월 금액 행렬 (월별 파일을 long 으로 합쳐 pivot 1회)"""
+        parts = []
+        for month, df in monthly.items():
+            if self.kakao_key not in df.columns:
+                continue
+            col = self._amount_col(df)
+            amount = (
+                pd.to_numeric(df[col], errors="coerce").fillna(0)
+                if col else pd.Series(0.0, index=df.index)
+            )
+            parts.append(
+                pd.DataFrame(
+                    {
+                        "settle_id": _clean_ids(df[self.kakao_key]).to_numpy(),
+                        "월": month,
+                        "금액": amount.to_numpy(dtype=float),
+                    }
+                )
+            )
+
+        if not parts:
+            return pd.DataFrame(columns=MONTHS, dtype=float)
+
+        long = pd.concat(parts, ignore_index=True)
+        long = long[long["settle_id"] != ""]
+        matrix = long.pivot_table(index="settle_id", columns="월", values="금액", aggfunc="sum")
+        return matrix.reindex(columns=MONTHS)
+
+    # ---------------------------
+    # 대사
+    # ---------------------------
+    def reconcile(self, monthly: Dict[int, pd.DataFrame]) -> ReconcileResult:
+        """
+        업로드된 달(monthly 의 key)만 비교 대상.
+        두 행렬을 Settle ID 합집합으로 정렬한 뒤 셀 단위 마스크로 상태를 판정한다.
+        """
+        kakao = self.kakao_matrix(monthly)
+        master = self.master_matrix()
+        months = sorted(m for m in monthly if m in MONTHS)
+
+        ids = kakao.index.union(master.index)
+        k = kakao.reindex(index=ids, columns=months)
+        m = master.reindex(index=ids, columns=months)
+
+        in_master = pd.Series(ids.isin(master.index), index=ids)
+        k_has = k.notna()
+        m_has = m.notna() & m.ne(0)
+
+        missing = k_has & ~in_master.to_numpy()[:, None]
+        extra = m_has & ~k_has
+        diff = k.fillna(0) - m.fillna(0)
+        mismatch = k_has & in_master.to_numpy()[:, None] & (diff.abs() > self.tolerance)
+
+        status = np.select(
+            [missing.to_numpy(dtype=bool), extra.to_numpy(dtype=bool), mismatch.to_numpy(dtype=bool)],
+            [STATUS_MISSING, STATUS_EXTRA, STATUS_MISMATCH],
+            default="",
+        )
+
+        # 문제 셀만 (행, 열) 좌표로 뽑아 long 포맷으로
+        r, c = np.nonzero(status != "")
+        cells = pd.DataFrame(
+            {
+                "settle_id": ids.to_numpy()[r],
+                "월": np.asarray(months, dtype=int)[c] if months else np.empty(0, dtype=int),
+                "카카오금액": k.to_numpy(dtype=float)[r, c],
+                "마스터금액": m.to_numpy(dtype=float)[r, c],
+                "차이": diff.to_numpy(dtype=float)[r, c],
+                "상태": status[r, c],
+            }
+        )
+
+        return ReconcileResult(kakao_matrix=kakao, master_matrix=master, cells=cells)
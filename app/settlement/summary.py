@@ -1,6 +1,14 @@
 import pandas as pd
 from typing import Dict, List, Tuple
 
+from app.settlement.parsing import region_series
+
+
+MONTH_COLS = [
+    "1월", "2월", "3월", "4월", "5월", "6월",
+    "7월", "8월", "9월", "10월", "11월", "12월",
+]
+
 
 class SettlementSummary:
     """
@@ -16,15 +24,21 @@ class SettlementSummary:
         rates_df: pd.DataFrame,
         drafts_df: pd.DataFrame | None = None,
     ):
-        self.kakao_df = kakao_df.copy()
-        self.rates_df = rates_df.copy()
-        self.drafts_df = drafts_df.copy() if drafts_df is not None else None
+        # 입력 DF는 읽기 전용으로 참조만 한다 (copy 하지 않음).
+        # 총액/지역 등 파생 값은 self.frame 에만 만든다.
+        self.kakao_df = kakao_df
+        self.rates_df = rates_df
+        self.drafts_df = drafts_df
 
         self.kakao_id_col = "Settle ID"
         self.master_id_col = "카카오 settle id"
 
         self.kakao_amount_col = self._detect_kakao_amount_col()
 
+        # 섹션별 결과 캐시 + 정규화 프레임 (생성 시 1회 계산)
+        self._cache: Dict[str, object] = {}
+        self.frame = self._build_frame()
+
     # ------------------------------------------------
     # 공통 유틸
     # ------------------------------------------------
@@ -45,6 +59,73 @@ class SettlementSummary:
                 return c
         return None
 
+    @staticmethod
+    def _to_float(s: pd.Series) -> pd.Series:
+        return pd.to_numeric(s, errors="coerce").fillna(0).astype(float)
+
+    @staticmethod
+    def _region(org: pd.Series) -> pd.Series:
+        """
+        기관명 → 지역. SettlementProcessor 와 같은 규칙(parsing.extract_region):
+        ○○시 → ○○군 → ○○구 순으로 추출, 그 외는 '전국'
+        """
+        return region_series(org)
+
+    def _build_frame(self) -> pd.DataFrame:
+        """
+        rates_df 에서 요약에 필요한 값만 뽑은 정규화 프레임.
+        - 기관명   : 원본 그대로
+        - 월합계   : 1월~12월 합산
+        - 합계     : '합 계' 컬럼 (없으면 0)
+        - 총액     : '합 계'가 있으면 합계, 없으면 월합계
+        - 지역     : _region 규칙
+        - 부가세   : 숫자 변환 값 (컬럼 없으면 NaN)
+        - settle_id: _clean 처리된 카카오 settle id
+        원본 시트를 copy 하지 않고 필요한 컬럼만 새 프레임으로 만든다.
+        """
+        rates = self.rates_df
+        index = rates.index
+
+        month_cols = [c for c in MONTH_COLS if c in rates.columns]
+        if month_cols:
+            month_sum = rates[month_cols].apply(self._to_float).sum(axis=1)
+        else:
+            month_sum = pd.Series(0.0, index=index)
+
+        has_total = "합 계" in rates.columns
+        total = self._to_float(rates["합 계"]) if has_total else pd.Series(0.0, index=index)
+
+        org = rates["기관명"] if "기관명" in rates.columns else pd.Series(None, index=index, dtype=object)
+
+        if "부가세" in rates.columns:
+            vat = self._to_float(rates["부가세"])
+        else:
+            vat = pd.Series(float("nan"), index=index)
+
+        if self.master_id_col in rates.columns:
+            sid = rates[self.master_id_col].astype(object)
+            sid = sid.where(sid.notna(), "").astype(str).str.strip()
+        else:
+            sid = pd.Series("", index=index, dtype=object)
+
+        return pd.DataFrame(
+            {
+                "기관명": org,
+                "월합계": month_sum,
+                "합계": total,
+                "총액": total if has_total else month_sum,
+                "지역": self._region(org),
+                "부가세": vat,
+                "settle_id": sid,
+            },
+            index=index,
+        )
+
+    def _cached(self, key: str, fn):
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
     # ------------------------------------------------
     # ① 총 매출
     # ------------------------------------------------
@@ -52,20 +133,15 @@ class SettlementSummary:
         """
         카카오 총액, 다수기관 총액, 전체 총액
         """
+        return self._cached("total_sales", self._total_sales)
+
+    def _total_sales(self) -> Dict[str, int]:
         kakao_total = 0
         if self.kakao_amount_col:
             kakao_total = int(self.kakao_df[self.kakao_amount_col].fillna(0).sum())
 
         # 2025 발송료의 월별/합계 컬럼 기반
-        month_cols = [
-            "1월", "2월", "3월", "4월", "5월", "6월",
-            "7월", "8월", "9월", "10월", "11월", "12월", "합 계"
-        ]
-        month_cols = [c for c in month_cols if c in self.rates_df.columns]
-
-        multi_total = 0
-        if month_cols:
-            multi_total = int(self.rates_df[month_cols].fillna(0).astype(float).sum().sum())
+        multi_total = int(self.frame["월합계"].sum() + self.frame["합계"].sum())
 
         return {
             "카카오 총액": kakao_total,
@@ -81,6 +157,9 @@ class SettlementSummary:
         - 카카오 발행 건수 : 카카오 엑셀에 등장한 고유 Settle ID 개수
         - 다수기관 발행 건수 : 2025 발송료에 등록된 고유 기관 수
         """
+        return self._cached("bill_counts", self._bill_counts)
+
+    def _bill_counts(self) -> Dict[str, int]:
         kakao_cnt = 0
         if self.kakao_id_col in self.kakao_df.columns:
             kakao_cnt = (
@@ -91,12 +170,7 @@ class SettlementSummary:
             )
 
         if "기관명" in self.rates_df.columns:
-            multi_cnt = (
-                self.rates_df["기관명"]
-                .dropna()
-                .astype(str)
-                .nunique()
-            )
+            multi_cnt = self.frame["기관명"].dropna().astype(str).nunique()
         else:
             multi_cnt = 0
 
@@ -115,6 +189,9 @@ class SettlementSummary:
         - 부가세 > 0 : 부가세 별도 여야 하는 기관
         - 부가세 = 0 : VAT 포함(면세 또는 포함) 기관
         """
+        return self._cached("vat_summary", self._vat_summary)
+
+    def _vat_summary(self) -> Dict[str, object]:
         if "부가세" not in self.rates_df.columns:
             return {
                 "VAT 포함 총액": 0,
@@ -123,34 +200,20 @@ class SettlementSummary:
                 "VAT 미포함 기관": [],
             }
 
-        df = self.rates_df.copy()
-        df["부가세"] = df["부가세"].fillna(0).astype(float)
-
-        # 합계 컬럼이 있으면 그걸 기준으로, 없으면 월 합산
-        if "합 계" in df.columns:
-            df["총액"] = df["합 계"].fillna(0).astype(float)
-        else:
-            month_cols = [
-                "1월", "2월", "3월", "4월", "5월", "6월",
-                "7월", "8월", "9월", "10월", "11월", "12월"
-            ]
-            month_cols = [c for c in month_cols if c in df.columns]
-            df["총액"] = df[month_cols].fillna(0).astype(float).sum(axis=1)
-
-        vat_yes = df[df["부가세"] > 0]
-        vat_no = df[df["부가세"] == 0]
+        df = self.frame
+        vat_yes = df["부가세"] > 0
+        vat_no = df["부가세"] == 0
 
-        vat_yes_sum = int(vat_yes["총액"].sum())
-        vat_no_sum = int(vat_no["총액"].sum())
-
-        vat_yes_orgs = vat_yes["기관명"].dropna().astype(str).tolist() if "기관명" in vat_yes.columns else []
-        vat_no_orgs = vat_no["기관명"].dropna().astype(str).tolist() if "기관명" in vat_no.columns else []
+        def _orgs(mask: pd.Series) -> List[str]:
+            if "기관명" not in self.rates_df.columns:
+                return []
+            return df.loc[mask, "기관명"].dropna().astype(str).tolist()
 
         return {
-            "VAT 포함 총액": vat_no_sum,
-            "VAT 미포함 총액": vat_yes_sum,
-            "VAT 포함 기관": vat_no_orgs,
-            "VAT 미포함 기관": vat_yes_orgs,
+            "VAT 포함 총액": int(df.loc[vat_no, "총액"].sum()),
+            "VAT 미포함 총액": int(df.loc[vat_yes, "총액"].sum()),
+            "VAT 포함 기관": _orgs(vat_no),
+            "VAT 미포함 기관": _orgs(vat_yes),
         }
 
     # ------------------------------------------------
@@ -158,41 +221,16 @@ class SettlementSummary:
     # ------------------------------------------------
     def region_summary(self) -> pd.DataFrame:
         """
-        기관명 → 지역 추출 후, 지역별 총액 집계.
-        규칙: ○○시청 → ○○시, ○○군청 → ○○군, ○○구청 → ○○구
-        그 외는 '기타'
+        기관명 → 지역(_region 규칙) 후, 지역별 총액 집계.
         """
+        return self._cached("region_summary", self._region_summary)
+
+    def _region_summary(self) -> pd.DataFrame:
         if "기관명" not in self.rates_df.columns:
             return pd.DataFrame()
 
-        df = self.rates_df.copy()
-
-        def _region(org: str) -> str:
-            if pd.isna(org):
-                return "기타"
-            org = str(org)
-            if "시청" in org:
-                return org.replace("시청", "시")
-            if "군청" in org:
-                return org.replace("군청", "군")
-            if "구청" in org:
-                return org.replace("구청", "구")
-            return "기타"
-
-        df["지역"] = df["기관명"].apply(_region)
-
-        if "합 계" in df.columns:
-            df["총액"] = df["합 계"].fillna(0).astype(float)
-        else:
-            month_cols = [
-                "1월", "2월", "3월", "4월", "5월", "6월",
-                "7월", "8월", "9월", "10월", "11월", "12월"
-            ]
-            month_cols = [c for c in month_cols if c in df.columns]
-            df["총액"] = df[month_cols].fillna(0).astype(float).sum(axis=1)
-
         region_df = (
-            df.groupby("지역")["총액"]
+            self.frame.groupby("지역", observed=True)["총액"]
             .sum()
             .reset_index()
             .sort_values("총액", ascending=False)
@@ -204,30 +242,15 @@ class SettlementSummary:
     # ⑤ 기관별 매출 TOP 3
     # ------------------------------------------------
     def top3_orgs(self) -> List[Tuple[str, int]]:
+        return self._cached("top3_orgs", self._top3_orgs)
+
+    def _top3_orgs(self) -> List[Tuple[str, int]]:
         if "기관명" not in self.rates_df.columns:
             return []
 
-        df = self.rates_df.copy()
-
-        if "합 계" in df.columns:
-            df["총액"] = df["합 계"].fillna(0).astype(float)
-        else:
-            month_cols = [
-                "1월", "2월", "3월", "4월", "5월", "6월",
-                "7월", "8월", "9월", "10월", "11월", "12월"
-            ]
-            month_cols = [c for c in month_cols if c in df.columns]
-            df["총액"] = df[month_cols].fillna(0).astype(float).sum(axis=1)
-
-        grouped = (
-            df.groupby("기관명")["총액"]
-            .sum()
-            .reset_index()
-            .sort_values("총액", ascending=False)
-        )
-
-        top3 = grouped.head(3)
-        return [(row["기관명"], int(row["총액"])) for _, row in top3.iterrows()]
+        # 기관명이 category 여도 실제 등장한 기관만 집계
+        top3 = self.frame.groupby("기관명", observed=True)["총액"].sum().nlargest(3)
+        return [(org, int(amount)) for org, amount in top3.items()]
 
     # ------------------------------------------------
     # ⑥ PDF 발행 유형별 집계
@@ -237,24 +260,18 @@ class SettlementSummary:
         - 카카오 PDF 대상: 카카오 통계에 존재하는 Settle ID 수
         - 다수기관 PDF 대상: 발송료 시트에는 있으나 카카오 통계에는 없는 Settle ID 수
         """
+        return self._cached("pdf_type_counts", self._pdf_type_counts)
 
+    def _pdf_type_counts(self) -> Dict[str, int]:
         if self.kakao_id_col in self.kakao_df.columns:
-            kakao_ids = {
-                self._clean(x)
-                for x in self.kakao_df[self.kakao_id_col]
-                if self._clean(x)
-            }
+            ids = self.kakao_df[self.kakao_id_col].astype(object)
+            ids = ids.where(ids.notna(), "").astype(str).str.strip()
+            kakao_ids = set(ids[ids != ""].unique())
         else:
             kakao_ids = set()
 
-        if self.master_id_col in self.rates_df.columns:
-            master_ids = {
-                self._clean(x)
-                for x in self.rates_df[self.master_id_col]
-                if self._clean(x)
-            }
-        else:
-            master_ids = set()
+        sid = self.frame["settle_id"]
+        master_ids = set(sid[sid != ""].unique())
 
         # 카카오에만 있는 것 = 실제 카카오 PDF
         kakao_only = kakao_ids
@@ -273,6 +290,7 @@ class SettlementSummary:
     def build_summary_dict(self) -> Dict[str, object]:
         """
         Streamlit 화면에서 한 번에 쓰기 좋은 dict 패키지.
+        각 섹션은 정규화 프레임 기반 + 캐시되므로 반복 호출 비용이 없다.
         """
         totals = self.total_sales()
         bills = self.bill_counts()
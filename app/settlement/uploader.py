@@ -1,5 +1,24 @@
 import pandas as pd
-from typing import NamedTuple, BinaryIO, Optional
+from typing import Iterable, Literal, NamedTuple, BinaryIO, Optional
+
+from app.settlement.xlsx_stream import StreamWorkbook, read_sheet_stream
+
+
+Engine = Literal["openpyxl", "stream"]
+
+# stream 엔진에서 마스터 시트 중 실제로 읽는 컬럼
+# (SettlementProcessor / SettlementSummary / MissingFinder / PDF 생성기 사용분)
+MONTH_COLS = [
+    "1월", "2월", "3월", "4월", "5월", "6월",
+    "7월", "8월", "9월", "10월", "11월", "12월",
+]
+RATES_USECOLS = [
+    "기관명", "청구명", "부서(서식)", "카카오 settle id",
+    "중계자(1)", "중계자(2)", "중계자(3)",
+    "부가세", "정산발송료", "정산인증료", "합 계", "합계",
+    *MONTH_COLS,
+]
+DRAFTS_USECOLS = ["순번", "구분", "발송료", "인증료", "부가세", "금액", "정산금액"]
 
 
 class MasterData(NamedTuple):
@@ -8,7 +27,7 @@ class MasterData(NamedTuple):
     drafts: pd.DataFrame     # 기안자료
 
 
-def _find_sheet(excel: pd.ExcelFile, candidates: list[str]) -> str:
+def _find_sheet(excel, candidates: list[str]) -> str:
     """
     파일명이 아니라 '시트명'을 기준으로 찾는다.
     - 완전 일치 먼저
@@ -38,21 +57,43 @@ def _find_sheet(excel: pd.ExcelFile, candidates: list[str]) -> str:
     )
 
 
-def load_master_workbook(file_obj: BinaryIO) -> MasterData:
+def _open_workbook(file_obj: BinaryIO, engine: Engine):
+    if engine == "stream":
+        return StreamWorkbook(file_obj)
+    if engine == "openpyxl":
+        return pd.ExcelFile(file_obj, engine="openpyxl")
+    raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+
+
+def _read_sheet(book, sheet_name: str, usecols: Optional[Iterable[str]]) -> pd.DataFrame:
+    if isinstance(book, StreamWorkbook):
+        return read_sheet_stream(book, sheet_name, usecols=usecols)
+
+    if usecols is not None:
+        wanted = set(usecols)
+        return pd.read_excel(book, sheet_name=sheet_name, usecols=lambda c: c in wanted)
+    return pd.read_excel(book, sheet_name=sheet_name)
+
+
+def load_master_workbook(file_obj: BinaryIO, engine: Engine = "openpyxl") -> MasterData:
     """
     아이앤텍 '2025 전자고지 정산 시트' 마스터에서
     - 2025년 발송료 시트
     - 기안자료 시트
     두 개만 읽어온다.
     파일명은 전혀 사용하지 않는다.
+
+    engine="stream" 이면 시트 XML 을 직접 스트리밍 파싱하고
+    RATES_USECOLS / DRAFTS_USECOLS 컬럼만 읽는다.
     """
-    xls = pd.ExcelFile(file_obj, engine="openpyxl")
+    book = _open_workbook(file_obj, engine)
 
-    rate_sheet_name = _find_sheet(xls, ["2025년 발송료", "2025 발송료"])
-    draft_sheet_name = _find_sheet(xls, ["기안자료"])
+    rate_sheet_name = _find_sheet(book, ["2025년 발송료", "2025 발송료"])
+    draft_sheet_name = _find_sheet(book, ["기안자료"])
 
-    rates = pd.read_excel(xls, sheet_name=rate_sheet_name)
-    drafts = pd.read_excel(xls, sheet_name=draft_sheet_name)
+    stream = engine == "stream"
+    rates = _read_sheet(book, rate_sheet_name, RATES_USECOLS if stream else None)
+    drafts = _read_sheet(book, draft_sheet_name, DRAFTS_USECOLS if stream else None)
 
     # 완전 빈 행, 전부 NaN인 행은 미리 정리
     rates = rates.dropna(how="all")
@@ -61,23 +102,30 @@ def load_master_workbook(file_obj: BinaryIO) -> MasterData:
     return MasterData(rates=rates, drafts=drafts)
 
 
-def load_kakao_stats(file_obj: BinaryIO, sheet_name: Optional[str] = None) -> pd.DataFrame:
+def load_kakao_stats(
+    file_obj: BinaryIO,
+    sheet_name: Optional[str] = None,
+    engine: Engine = "openpyxl",
+    usecols: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
     """
     카카오 월별 정산 엑셀을 읽는다.
     - 기본: 첫 번째 시트
     - 필요하면 sheet_name으로 명시 가능
     - 여기서는 구조를 깨지 않고 그대로 넘긴 뒤,
       나중 processor에서 컬럼(일자, 기관명, Settle ID 등)을 사용해 가공한다.
+    - engine="stream": 10만 행 이상 통계 파일용 스트리밍 파서
+    - usecols: 읽을 컬럼명 목록 (None 이면 전체)
     """
-    xls = pd.ExcelFile(file_obj, engine="openpyxl")
+    book = _open_workbook(file_obj, engine)
 
     if sheet_name is None:
-        target_sheet = xls.sheet_names[0]
+        target_sheet = book.sheet_names[0]
     else:
         # 시트명을 정확히 입력하지 않아도 되도록 느슨하게 매칭
-        target_sheet = _find_sheet(xls, [sheet_name])
+        target_sheet = _find_sheet(book, [sheet_name])
 
-    df = pd.read_excel(xls, sheet_name=target_sheet)
+    df = _read_sheet(book, target_sheet, usecols)
     df = df.dropna(how="all")
 
     return df
@@ -60,6 +60,42 @@ def clean_df(df: pd.DataFrame) -> pd.DataFrame:
     for col in df.columns:
         if df[col].dtype == "object":
             df[col] = df[col].astype(str).str.strip()
+        elif isinstance(df[col].dtype, pd.CategoricalDtype) and "" not in df[col].cat.categories:
+            # category 컬럼은 fillna("") 전에 "" 카테고리가 있어야 함
+            df[col] = df[col].cat.add_categories("")
 
     df = df.fillna("")
     return df
+
+
+# -------------------------------------------------------
+# 5) 컬럼명 느슨한 매칭 (원본명 / settlement_page 정규화명 모두 허용)
+# -------------------------------------------------------
+
+def normalize_col_name(col) -> str:
+    """공백 · _ · - 제거 + 소문자 (settlement_page.normalize_col 과 같은 규칙)"""
+    return str(col).replace(" ", "").replace("_", "").replace("-", "").lower()
+
+
+def find_column(df: pd.DataFrame, candidates):
+    """candidates 순서대로 df 에서 일치하는 실제 컬럼명을 찾는다 (없으면 None)"""
+    by_norm = {normalize_col_name(c): c for c in df.columns}
+    for cand in candidates:
+        key = normalize_col_name(cand)
+        if key in by_norm:
+            return by_norm[key]
+    return None
+
+
+# -------------------------------------------------------
+# 6) 날짜 컬럼 → Timestamp (엑셀 일련번호 포함)
+# -------------------------------------------------------
+
+def to_dates(s: pd.Series) -> pd.Series:
+    """
+    문자열 날짜 / datetime / 엑셀 일련번호(숫자) 모두 Timestamp 로.
+    xlsx_stream 리더는 날짜 서식을 해석하지 않아 일련번호(45717 등)가 그대로 온다.
+    """
+    if pd.api.types.is_numeric_dtype(s):
+        return pd.to_datetime(s, unit="D", origin="1899-12-30", errors="coerce")
+    return pd.to_datetime(s, errors="coerce")
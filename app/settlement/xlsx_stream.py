@@ -0,0 +1,302 @@
+import posixpath
+import re
+import time
+import tracemalloc
+import zipfile
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+from xml.etree.ElementTree import iterparse
+
+import pandas as pd
+
+
+# -------------------------------------------------------
+# xlsx(OOXML) 스트리밍 리더
+#   openpyxl 셀 객체 모델 없이 시트 XML 을 행 단위로 훑으면서
+#   필요한 컬럼만 리스트로 모은다.
+#   - 날짜 서식은 해석하지 않음 (엑셀 일련번호 숫자 그대로)
+#   - 수식 셀은 캐시된 결과값(<v>)을 사용
+# -------------------------------------------------------
+
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+
+def _col_index(letters: str) -> int:
+    """'A' → 0, 'Z' → 25, 'AA' → 26"""
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx - 1
+
+
+def _number(text: str):
+    if not text:
+        return None
+    try:
+        if any(ch in text for ch in ".eE"):
+            return float(text)
+        return int(text)
+    except ValueError:
+        return text
+
+
+def _text_of(elem) -> str:
+    """<si>/<is> 안의 <t> (서식 run 포함) 텍스트를 이어 붙인다."""
+    return "".join(t.text or "" for t in elem.iter(f"{NS_MAIN}t"))
+
+
+class StreamWorkbook:
+    """
+    pd.ExcelFile 대신 쓰는 가벼운 워크북 핸들.
+    sheet_names 속성을 제공하므로 uploader._find_sheet 에 그대로 넘길 수 있다.
+    """
+
+    def __init__(self, file_obj: BinaryIO):
+        if hasattr(file_obj, "seek"):
+            file_obj.seek(0)
+        self._zip = zipfile.ZipFile(file_obj)
+        self._sheet_paths = self._read_sheet_paths()
+        self.sheet_names: List[str] = list(self._sheet_paths)
+        self._shared: Optional[List[str]] = None
+
+    def _read_sheet_paths(self) -> Dict[str, str]:
+        rels: Dict[str, str] = {}
+        with self._zip.open("xl/_rels/workbook.xml.rels") as f:
+            for _, el in iterparse(f):
+                if el.tag == f"{NS_PKG_REL}Relationship":
+                    target = el.get("Target", "")
+                    if target.startswith("/"):
+                        path = target.lstrip("/")
+                    else:
+                        path = posixpath.normpath(posixpath.join("xl", target))
+                    rels[el.get("Id")] = path
+
+        paths: Dict[str, str] = {}
+        with self._zip.open("xl/workbook.xml") as f:
+            for _, el in iterparse(f):
+                if el.tag == f"{NS_MAIN}sheet":
+                    paths[el.get("name")] = rels[el.get(f"{NS_REL}id")]
+        return paths
+
+    def _shared_strings(self) -> List[str]:
+        if self._shared is None:
+            shared: List[str] = []
+            if "xl/sharedStrings.xml" in self._zip.namelist():
+                with self._zip.open("xl/sharedStrings.xml") as f:
+                    for _, el in iterparse(f):
+                        if el.tag == f"{NS_MAIN}si":
+                            shared.append(_text_of(el))
+                            el.clear()
+            self._shared = shared
+        return self._shared
+
+    def _shared_strings_at(self, indices: Iterable[int]) -> Dict[int, str]:
+        """
+        필요한 shared string 만 조회.
+        전체 목록을 아직 읽지 않았다면 가장 큰 index 까지만 읽고 멈춘다 (헤더 전용).
+        """
+        wanted = set(indices)
+        if not wanted:
+            return {}
+        if self._shared is not None:
+            return {i: self._shared[i] for i in wanted if i < len(self._shared)}
+
+        found: Dict[int, str] = {}
+        last = max(wanted)
+        if "xl/sharedStrings.xml" not in self._zip.namelist():
+            return found
+        with self._zip.open("xl/sharedStrings.xml") as f:
+            i = 0
+            for _, el in iterparse(f):
+                if el.tag != f"{NS_MAIN}si":
+                    continue
+                if i in wanted:
+                    found[i] = _text_of(el)
+                el.clear()
+                if i >= last:
+                    break
+                i += 1
+        return found
+
+    def read_header(self, sheet_name: str) -> List[str]:
+        """
+        시트의 첫 번째 비어 있지 않은 행만 읽어 컬럼명 목록을 반환.
+        read_sheet_stream 의 컬럼명과 같은 규칙이며, 나머지 행은 압축 해제하지 않는다.
+        """
+        raw: Dict[int, Tuple[str, str]] = {}
+        with self._zip.open(self._sheet_paths[sheet_name]) as f:
+            for _, el in iterparse(f):
+                if el.tag != f"{NS_MAIN}row":
+                    continue
+                next_col = 0
+                for cell in el.iter(f"{NS_MAIN}c"):
+                    ref = cell.get("r")
+                    m = _CELL_REF.match(ref) if ref else None
+                    col = _col_index(m.group(1)) if m else next_col
+                    next_col = col + 1
+
+                    ctype = cell.get("t", "n")
+                    if ctype == "inlineStr":
+                        is_el = cell.find(f"{NS_MAIN}is")
+                        raw[col] = ("str", _text_of(is_el) if is_el is not None else "")
+                        continue
+                    v = cell.find(f"{NS_MAIN}v")
+                    if v is not None and v.text is not None:
+                        raw[col] = (ctype, v.text)
+                el.clear()
+                if raw:
+                    break
+
+        if not raw:
+            return []
+
+        shared = self._shared_strings_at(int(t) for c, t in raw.values() if c == "s")
+        header: Dict[int, object] = {}
+        for col, (ctype, text) in raw.items():
+            if ctype == "s":
+                header[col] = shared.get(int(text), "")
+            elif ctype == "b":
+                header[col] = text == "1"
+            elif ctype in ("str", "e"):
+                header[col] = text
+            else:
+                header[col] = _number(text)
+        return _header_names(header, max(header) + 1)
+
+    def iter_rows(self, sheet_name: str) -> Iterable[Tuple[int, Dict[int, object]]]:
+        """(엑셀 행 번호(1부터), {컬럼 index: 값}) 을 순서대로 yield."""
+        shared = self._shared_strings()
+
+        with self._zip.open(self._sheet_paths[sheet_name]) as f:
+            row_no = 0
+            for _, el in iterparse(f):
+                if el.tag != f"{NS_MAIN}row":
+                    continue
+
+                row_no = int(el.get("r", row_no + 1))
+                values: Dict[int, object] = {}
+                next_col = 0
+
+                for cell in el.iter(f"{NS_MAIN}c"):
+                    ref = cell.get("r")
+                    if ref:
+                        m = _CELL_REF.match(ref)
+                        col = _col_index(m.group(1)) if m else next_col
+                    else:
+                        col = next_col
+                    next_col = col + 1
+
+                    ctype = cell.get("t", "n")
+                    if ctype == "inlineStr":
+                        is_el = cell.find(f"{NS_MAIN}is")
+                        values[col] = _text_of(is_el) if is_el is not None else ""
+                        continue
+
+                    v = cell.find(f"{NS_MAIN}v")
+                    if v is None or v.text is None:
+                        continue
+
+                    if ctype == "s":
+                        values[col] = shared[int(v.text)]
+                    elif ctype == "b":
+                        values[col] = v.text == "1"
+                    elif ctype in ("str", "e"):
+                        values[col] = v.text
+                    else:
+                        values[col] = _number(v.text)
+
+                el.clear()
+                yield row_no, values
+
+
+def _header_names(header: Dict[int, object], width: int) -> List[str]:
+    """pandas.read_excel 과 같은 규칙: 빈 헤더 → 'Unnamed: i', 중복 → 'a.1'"""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for i in range(width):
+        v = header.get(i)
+        name = f"Unnamed: {i}" if v is None or v == "" else str(v)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def read_sheet_stream(
+    workbook: StreamWorkbook,
+    sheet_name: str,
+    usecols: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """
+    첫 행을 헤더로 보고 시트를 DataFrame 으로 읽는다.
+    usecols 를 주면 해당 헤더의 컬럼만 값으로 만든다 (없는 컬럼은 무시).
+    index 는 pd.read_excel 과 같게 '헤더 다음 행 = 0' 기준 행 번호.
+    """
+    rows = workbook.iter_rows(sheet_name)
+
+    header: Dict[int, object] = {}
+    header_row = 0
+    for header_row, header in rows:
+        if header:
+            break
+    else:
+        return pd.DataFrame()
+
+    names = _header_names(header, max(header) + 1)
+    wanted = set(usecols) if usecols is not None else None
+    keep = [(i, n) for i, n in enumerate(names) if wanted is None or n in wanted]
+
+    columns: Dict[int, List[object]] = {i: [] for i, _ in keep}
+    index: List[int] = []
+    missing = float("nan")
+
+    for row_no, values in rows:
+        index.append(row_no - header_row - 1)
+        for i, col in columns.items():
+            col.append(values.get(i, missing))
+
+    df = pd.DataFrame(
+        {name: columns[i] for i, name in keep},
+        index=pd.Index(index),
+    )
+
+    # read_excel 과 동일하게, 전부 숫자로 해석되는 문자열 컬럼은 숫자로 변환
+    for name in df.columns:
+        if not pd.api.types.is_numeric_dtype(df[name]):
+            try:
+                df[name] = pd.to_numeric(df[name])
+            except (ValueError, TypeError):
+                pass
+
+    return df
+
+
+# -------------------------------------------------------
+# 엔진 비교용: 실행 시간 + 최대 메모리 측정
+# -------------------------------------------------------
+
+def measure_load(fn: Callable, *args, **kwargs) -> Tuple[object, Dict[str, float]]:
+    """
+    fn(*args, **kwargs) 실행 결과와 함께
+    {'seconds': 소요시간, 'peak_mb': tracemalloc 기준 최대 할당량} 반환.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    seconds = time.perf_counter() - start
+
+    _, peak = tracemalloc.get_traced_memory()
+    if not was_tracing:
+        tracemalloc.stop()
+
+    return result, {"seconds": seconds, "peak_mb": peak / (1024 * 1024)}
@@ -1,7 +1,12 @@
 # app/utils/loader.py
 
+import copy
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 import pandas as pd
 
 
@@ -15,28 +20,136 @@ UTILS_DIR = BASE_DIR / "utils"
 SETTINGS_FILE = UTILS_DIR / "settings.json"
 PARTNER_DB_FILE = UTILS_DIR / "partner_db.xlsx"
 
+DEFAULT_SETTINGS = {
+    "welcome_text": "환영합니다! 아이앤텍 전자고지 정산 대시보드입니다.",
+    "login_fail_limit": 5,
+    "main_image": "app/images/imagesusagi_kuma.png",
+    "youtube_url": "",
+}
+
 
 # ----------------------------------------
-# 🔵 settings.json 로드
+# 🔵 settings.json 공유 저장소
 # ----------------------------------------
-def load_settings() -> dict:
-    """settings.json 읽기 (없으면 기본값 반환)"""
+# 프로세스 안의 모든 Streamlit 세션이 파싱된 dict 하나를 같이 쓴다.
+#   - 읽기: 파일 stat(수정시각 + 크기)이 그대로면 다시 파싱하지 않음
+#   - 쓰기: 같은 폴더 임시 파일에 쓴 뒤 os.replace (중간 상태 파일 없음)
+#   - 변경 알림: subscribe(callback) → 값이 바뀔 때 callback(새 설정 사본)
+#     세션마다 version 을 기억해 두고 비교해도 된다.
+SettingsCallback = Callable[[dict], None]
+
+
+class SettingsStore:
+    """settings.json 하나를 감싸는 프로세스 공용 캐시 (모듈 싱글턴 settings_store)"""
+
+    def __init__(self, path: Path, defaults: dict):
+        self.path = Path(path)
+        self.defaults = dict(defaults)
+        self.version = 0
+
+        self._lock = threading.RLock()
+        self._data: Optional[dict] = None
+        self._stat: Optional[Tuple[int, int]] = None
+        self._subscribers: List[SettingsCallback] = []
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_file(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return {**self.defaults, **data}  # 기본값 + 사용자 설정 덮어쓰기
+        except Exception:
+            return dict(self.defaults)
+
+    def _notify(self, data: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(copy.deepcopy(data))
+            except Exception:
+                pass  # 구독자 오류가 설정 읽기/저장을 막지 않도록
+
+    def get(self) -> dict:
+        """캐시된 설정 (공유 객체이므로 수정 금지 — 수정용은 load_settings)"""
+        stat = self._file_stat()
+        with self._lock:
+            if self._data is not None and stat == self._stat:
+                return self._data
+
+            previous = self._data
+            self._data = self._read_file() if stat is not None else dict(self.defaults)
+            self._stat = stat
+            changed = previous is not None and previous != self._data
+            if changed:
+                self.version += 1
+            data = self._data
+
+        if changed:
+            self._notify(data)
+        return data
 
-    default_settings = {
-        "welcome_text": "환영합니다! 아이앤텍 전자고지 정산 대시보드입니다.",
-        "login_fail_limit": 5,
-        "main_image": "app/images/imagesusagi_kuma.png",
-        "youtube_url": "",
-    }
+    def save(self, data: dict) -> None:
+        """임시 파일에 쓰고 os.replace 로 교체 (원자적 저장, 기존 파일 권한 유지)"""
+        text = json.dumps(data, indent=4, ensure_ascii=False)
 
-    if not SETTINGS_FILE.exists():
-        return default_settings
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                mode = os.stat(self.path).st_mode & 0o777
+            except OSError:
+                mode = 0o644  # 새 파일: mkstemp 기본값(0600) 대신 일반 파일 권한
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
 
-    try:
-        data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-        return {**default_settings, **data}  # 기본값 + 사용자 설정 덮어쓰기
-    except Exception:
-        return default_settings
+            previous = self._data
+            self._data = {**self.defaults, **copy.deepcopy(data)}
+            self._stat = self._file_stat()
+            changed = previous != self._data
+            if changed:
+                self.version += 1
+            saved = self._data
+
+        if changed:
+            self._notify(saved)
+
+    def subscribe(self, callback: SettingsCallback) -> Callable[[], None]:
+        """변경 알림 등록. 반환값을 호출하면 해제."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+
+settings_store = SettingsStore(SETTINGS_FILE, DEFAULT_SETTINGS)
+
+
+# ----------------------------------------
+# 🔵 settings.json 로드
+# ----------------------------------------
+def load_settings() -> dict:
+    """settings.json 읽기 (없으면 기본값 반환). 호출마다 수정 가능한 사본."""
+    return copy.deepcopy(settings_store.get())
 
 
 # ----------------------------------------
@@ -44,8 +157,9 @@ def load_settings() -> dict:
 # ----------------------------------------
 def save_settings(data: dict) -> None:
     """settings.json 저장"""
-    SETTINGS_FILE.write_text(
-        json.dumps(data, indent=4, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    settings_store.save(data)
+
 
+def subscribe_settings(callback: SettingsCallback) -> Callable[[], None]:
+    """설정 변경 시 callback(새 설정 사본) 호출. 반환값은 해제 함수."""
+    return settings_store.subscribe(callback)
@@ -1,9 +1,11 @@
+import json
 import os
 from datetime import datetime
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))      # utils 폴더
 LOG_DIR = os.path.join(BASE_DIR, "..", "logs")             # app/logs
 LOG_FILE = os.path.join(LOG_DIR, "system.log")
+METRICS_FILE = os.path.join(LOG_DIR, "metrics.jsonl")    # 작업별 계측 레코드 (JSON 1줄 = 1건)
 
 os.makedirs(LOG_DIR, exist_ok=True)
 
@@ -19,3 +21,16 @@ def read_logs():
         return []
     with open(LOG_FILE, "r", encoding="utf-8") as f:
         return [line.strip() for line in f.readlines()]
+
+def write_metrics(record: dict):
+    record = {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), **record}
+    line = json.dumps(record, ensure_ascii=False)
+
+    with open(METRICS_FILE, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def read_metrics():
+    if not os.path.exists(METRICS_FILE):
+        return []
+    with open(METRICS_FILE, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,305 @@
+"""
+정산 파이프라인 벤치마크.
+
+    python -m benchmarks.run                                   # 1k / 10k / 100k 행
+    python -m benchmarks.run --rows 1000,10000 --pdfs 20 -o bench.json
+
+규모별로 합성 워크북을 만들고 각 단계의 시간(최소/중앙값)과
+메모리(tracemalloc peak)를 측정해 JSON 으로 출력한다.
+같은 seed · 옵션으로 커밋마다 돌려 결과 JSON 을 비교하면 된다.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from io import BytesIO
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from app.settlement.index import SettlementIndex
+from app.settlement.kakao_invoice import build_kakao_invoices
+from app.settlement.missing import MissingFinder
+from app.settlement.normalize import categorize_frames, frame_memory
+from app.settlement.pdf_generator import generate_kakao_pdf, generate_multi_pdf
+from app.settlement.processor import SettlementProcessor
+from app.settlement.summary import SettlementSummary
+from app.settlement.uploader import load_kakao_stats, load_master_workbook
+from benchmarks.synthetic import (
+    SyntheticData,
+    make_dataset,
+    write_kakao_workbook,
+    write_master_workbook,
+)
+
+
+# -------------------------------------------------------
+# 측정 헬퍼
+# -------------------------------------------------------
+
+def time_call(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """fn 을 repeat 번 실행한 시간(초) 최소/중앙값"""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {
+        "min": round(min(times), 6),
+        "median": round(statistics.median(times), 6),
+        "repeat": repeat,
+    }
+
+
+def peak_memory(fn: Callable[[], object]) -> Dict[str, float]:
+    """fn 실행 중 Python 할당 peak (MB). numpy 버퍼도 tracemalloc 에 잡힌다."""
+    tracemalloc.start()
+    try:
+        t0 = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_mb": round(peak / 1024 / 1024, 3), "seconds": round(seconds, 6)}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+# -------------------------------------------------------
+# 단계별 벤치마크
+# -------------------------------------------------------
+
+ENGINES = ("openpyxl", "stream")
+
+
+def bench_load(data: SyntheticData, repeat: int) -> Dict[str, object]:
+    """합성 워크북을 xlsx 로 쓴 뒤 엔진별 로드 시간"""
+    master_xlsx = write_master_workbook(data)
+    kakao_xlsx = write_kakao_workbook(data)
+    return {
+        "master_xlsx_bytes": len(master_xlsx),
+        "kakao_xlsx_bytes": len(kakao_xlsx),
+        "load_master_workbook": {
+            engine: time_call(lambda: load_master_workbook(BytesIO(master_xlsx), engine=engine), repeat)
+            for engine in ENGINES
+        },
+        "load_kakao_stats": {
+            engine: time_call(lambda: load_kakao_stats(BytesIO(kakao_xlsx), engine=engine), repeat)
+            for engine in ENGINES
+        },
+    }
+
+
+def bench_engines(data: SyntheticData, repeat: int) -> Dict[str, object]:
+    rates, drafts, kakao = data
+
+    def _org_rows():
+        p = SettlementProcessor(rates, drafts, kakao)
+        p.build_org_rows()
+        return p
+
+    def _overview():
+        p = SettlementProcessor(rates, drafts, kakao)
+        p.build_org_rows()
+        return p.calc_overview()
+
+    # slots/intern OrgSummary 리스트 → 상세 DF 변환만 (행 구축은 미리 1회)
+    built = _org_rows()
+
+    return {
+        "build_org_rows": time_call(_org_rows, repeat),
+        "calc_overview": time_call(_overview, repeat),
+        "to_detail_dataframe": time_call(built.to_detail_dataframe, repeat),
+        "build_summary_dict": time_call(
+            lambda: SettlementSummary(kakao, rates, drafts).build_summary_dict(), repeat
+        ),
+        "missing_summary": time_call(lambda: MissingFinder(kakao, rates).summary(), repeat),
+    }
+
+
+def bench_memory(data: SyntheticData) -> Dict[str, object]:
+    """
+    - org_rows   : OrgSummary 리스트 생성 peak + 결과 객체 수
+    - detail_frame: OrgSummary 리스트 → to_detail_dataframe 변환 peak
+    - categorical: categorize_frames 전/후 프레임 메모리
+    - engines    : 입력 DF 를 복사하지 않는 엔진 3종 생성 peak (입력 대비)
+                   + 엔진마다 df.copy() 로 받는 방식의 peak · 차이(saved_mb)
+    """
+    rates, drafts, kakao = data
+
+    holder = {}
+
+    def _org_rows():
+        p = SettlementProcessor(rates, drafts, kakao)
+        p.build_org_rows()
+        holder["rows"] = len(p.org_rows)
+
+    org_rows = peak_memory(_org_rows)
+    org_rows["rows"] = holder["rows"]
+
+    # OrgSummary 리스트 → 상세 DF 변환 peak (행 구축 제외)
+    built = SettlementProcessor(rates, drafts, kakao)
+    built.build_org_rows()
+    detail_frame = peak_memory(built.to_detail_dataframe)
+
+    _, report = categorize_frames({"카카오": kakao, "발송료": rates, "기안자료": drafts})
+
+    # 페이지처럼 엔진 3종을 동시에 살려 둔 상태로 측정
+    def _engines():
+        alive = [
+            SettlementProcessor(rates, drafts, kakao),
+            SettlementSummary(kakao, rates, drafts),
+            MissingFinder(kakao, rates),
+        ]
+        alive[-1].summary()
+
+    # 비교 기준: 엔진마다 입력을 df.copy() 해서 받는 방식
+    def _engines_with_copy():
+        alive = [
+            SettlementProcessor(rates.copy(), drafts.copy(), kakao.copy()),
+            SettlementSummary(kakao.copy(), rates.copy(), drafts.copy()),
+            MissingFinder(kakao.copy(), rates.copy()),
+        ]
+        alive[-1].summary()
+
+    engines = peak_memory(_engines)
+    with_copy = peak_memory(_engines_with_copy)
+    engines["input_mb"] = round(sum(frame_memory(df) for df in data) / 1024 / 1024, 3)
+    engines["with_copy_peak_mb"] = with_copy["peak_mb"]
+    engines["with_copy_seconds"] = with_copy["seconds"]
+    engines["saved_mb"] = round(with_copy["peak_mb"] - engines["peak_mb"], 3)
+
+    return {
+        "org_rows": org_rows,
+        "detail_frame": detail_frame,
+        "categorical": report.to_dict(orient="records"),
+        "engines": engines,
+    }
+
+
+def bench_pdfs(data: SyntheticData, n_pdfs: int) -> Dict[str, object]:
+    """PDF 생성기 2종: 건당 시간 · 초당 건수 · 평균 바이트"""
+    rates, _, kakao = data
+
+    # 카카오 PDF 입력은 settlement_page 정규화 컬럼명 기준
+    kakao_norm = kakao.rename(columns=lambda c: str(c).replace(" ", "").lower())
+    sids = kakao_norm["settleid"].dropna().astype(str).unique()[:n_pdfs].tolist()
+    index = SettlementIndex(rates, settle_col="카카오 settle id")
+    invoices = build_kakao_invoices(kakao_norm, sids, index)
+
+    orgs = index.orgs()[:n_pdfs]
+
+    def _run(render: Callable[[object], bytes], items: List[object]) -> Dict[str, float]:
+        sizes = []
+        t0 = time.perf_counter()
+        for item in items:
+            sizes.append(len(render(item)))
+        seconds = time.perf_counter() - t0
+        return {
+            "count": len(items),
+            "seconds": round(seconds, 6),
+            "pdfs_per_sec": round(len(items) / seconds, 2) if seconds else 0.0,
+            "avg_bytes": int(sum(sizes) / len(sizes)) if sizes else 0,
+        }
+
+    return {
+        "kakao": _run(
+            lambda sid: generate_kakao_pdf(None, "기관", sid, *invoices[sid]),
+            sids,
+        ),
+        "multi": _run(lambda org: generate_multi_pdf(None, index.rows_for_org(org)), orgs),
+    }
+
+
+# -------------------------------------------------------
+# 실행
+# -------------------------------------------------------
+
+def run(
+    rows: List[int],
+    n_orgs: int,
+    n_settle_ids: int,
+    n_pdfs: int,
+    repeat: int,
+    seed: int,
+    skip_xlsx: bool = False,
+) -> Dict[str, object]:
+    results = []
+    for n in rows:
+        data = make_dataset(
+            rates_rows=n, drafts_rows=n, kakao_rows=n,
+            n_orgs=n_orgs, n_settle_ids=n_settle_ids, seed=seed,
+        )
+        entry: Dict[str, object] = {"rows": n}
+
+        if not skip_xlsx:
+            entry.update(bench_load(data, repeat))
+
+        entry.update(bench_engines(data, repeat))
+        entry["memory"] = bench_memory(data)
+        entry["pdf"] = bench_pdfs(data, n_pdfs)
+        results.append(entry)
+        print(f"[bench] rows={n} 완료", file=sys.stderr)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "params": {
+                "rows": rows, "orgs": n_orgs, "settle_ids": n_settle_ids,
+                "pdfs": n_pdfs, "repeat": repeat, "seed": seed,
+            },
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="정산 파이프라인 벤치마크 (JSON 출력)")
+    parser.add_argument("--rows", default="1000,10000,100000", help="시트별 행 수 (쉼표 구분)")
+    parser.add_argument("--orgs", type=int, default=500, help="기관 수")
+    parser.add_argument("--settle-ids", type=int, default=800, help="Settle ID 수")
+    parser.add_argument("--pdfs", type=int, default=50, help="생성기별 PDF 건수")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-xlsx", action="store_true", help="xlsx 쓰기/읽기 단계 생략")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 (없으면 stdout)")
+    args = parser.parse_args(argv)
+
+    report = run(
+        rows=[int(x) for x in args.rows.split(",") if x.strip()],
+        n_orgs=args.orgs,
+        n_settle_ids=args.settle_ids,
+        n_pdfs=args.pdfs,
+        repeat=args.repeat,
+        seed=args.seed,
+        skip_xlsx=args.skip_xlsx,
+    )
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+from io import BytesIO
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# -------------------------------------------------------
+# 합성 정산 데이터 생성기
+#   실제 '2025 전자고지 정산 시트'(2025년 발송료 · 기안자료)와
+#   카카오 월별 통계와 같은 컬럼 구성으로, 규모만 바꿔 가며 만든다.
+#   같은 seed 면 항상 같은 데이터 → 커밋 간 결과 비교 가능.
+# -------------------------------------------------------
+
+MONTH_COLS = [f"{m}월" for m in range(1, 13)]
+
+_REGIONS = ["수원시", "평택시", "가평군", "강남구", "양평군", "전주시", "해운대구", "세종시", "원주시", "제주시"]
+_SUFFIXES = ["청", " 보건소", " 주민센터", "종합관제사업소", " 차량등록사업소"]
+_NATIONAL = ["국민연금공단", "한국전력", "국민건강보험공단", "도로교통공단"]
+_CHARGES = ["주민등록증 재발급 안내문", "지방세 고지", "과태료 (1차)", "건강검진 안내", "자동차세 고지", ""]
+_CARRIERS = ["카카오", "KT", "네이버"]
+
+
+class SyntheticData(NamedTuple):
+    rates: pd.DataFrame      # 2025년 발송료
+    drafts: pd.DataFrame     # 기안자료
+    kakao: pd.DataFrame      # 카카오 월별 통계
+
+
+def make_org_names(n_orgs: int, rng: np.random.Generator) -> np.ndarray:
+    """'수원시 영통구청' 류 지역 기관명 + 일부 전국 기관명."""
+    names = []
+    for i in range(n_orgs):
+        if i < len(_NATIONAL) and rng.random() < 0.5:
+            names.append(_NATIONAL[i])
+            continue
+        region = _REGIONS[i % len(_REGIONS)]
+        names.append(f"{region} 기관{i}{_SUFFIXES[i % len(_SUFFIXES)]}")
+    return np.array(names, dtype=object)
+
+
+def make_settle_ids(n_settle_ids: int) -> np.ndarray:
+    return np.array([f"S{i:06d}" for i in range(n_settle_ids)], dtype=object)
+
+
+def make_rates(
+    n_rows: int,
+    orgs: np.ndarray,
+    settle_ids: np.ndarray,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """2025년 발송료: 기관 1줄당 월별 금액 + 중계자(1..3) + 카카오 settle id"""
+    org = rng.choice(orgs, n_rows)
+    months = rng.integers(0, 200_000, size=(n_rows, 12))
+    months[rng.random((n_rows, 12)) < 0.2] = 0
+
+    # 중계자: 절반 이상은 카카오 단독, 나머지는 카카오+KT/네이버 조합
+    c1 = rng.choice(_CARRIERS, n_rows, p=[0.7, 0.2, 0.1])
+    c2 = np.where(rng.random(n_rows) < 0.3, rng.choice(_CARRIERS, n_rows), "")
+    c3 = np.where(rng.random(n_rows) < 0.1, rng.choice(_CARRIERS, n_rows), "")
+
+    # 카카오 settle id: 일부 비어 있음 (카카오 미사용 기관)
+    sid = rng.choice(settle_ids, n_rows).astype(object)
+    sid[rng.random(n_rows) < 0.05] = None
+
+    total = months.sum(axis=1)
+    send_fee = total * 0.8
+    auth_fee = total * 0.2
+    # 부가세: 40% 기관만 과세 (합계의 10%), 나머지 0
+    vat = np.where(rng.random(n_rows) < 0.4, total * 0.1, 0).round().astype("int64")
+
+    df = pd.DataFrame(
+        {
+            "기관명": org,
+            "청구명": rng.choice(_CHARGES, n_rows),
+            "부서(서식)": rng.choice(["세무과", "민원과", "교통과", "복지과"], n_rows),
+            "카카오 settle id": sid,
+            "중계자(1)": c1,
+            "중계자(2)": c2,
+            "중계자(3)": c3,
+            "부가세": vat,
+            "정산발송료": send_fee.round().astype("int64"),
+            "정산인증료": auth_fee.round().astype("int64"),
+        }
+    )
+    for i, col in enumerate(MONTH_COLS):
+        df[col] = months[:, i]
+    df["합 계"] = total
+    return df
+
+
+def make_drafts(n_rows: int, orgs: np.ndarray, rng: np.random.Generator) -> pd.DataFrame:
+    """기안자료: '기관명(청구명)' 형태의 구분 + 금액/부가세"""
+    org = rng.choice(orgs, n_rows)
+    charge = rng.choice(_CHARGES, n_rows)
+    gubun = np.where(charge == "", org, org + "(" + charge + ")")
+
+    amount = rng.integers(0, 500_000, n_rows)
+    return pd.DataFrame(
+        {
+            "순번": np.arange(1, n_rows + 1),
+            "구분": gubun,
+            "발송료": (amount * 0.8).round().astype("int64"),
+            "인증료": (amount * 0.2).round().astype("int64"),
+            "부가세": np.where(rng.random(n_rows) < 0.4, (amount * 0.1).round(), 0).astype("int64"),
+            "금액": amount,
+            "정산금액": amount,
+        }
+    )
+
+
+def make_kakao(
+    n_rows: int,
+    orgs: np.ndarray,
+    settle_ids: np.ndarray,
+    rng: np.random.Generator,
+    unknown_ratio: float = 0.02,
+) -> pd.DataFrame:
+    """
+    카카오 월별 통계: Settle ID × 일자 단위 건수/금액.
+    unknown_ratio 만큼은 마스터에 없는 Settle ID (누락 탐지 대상).
+    """
+    sid = rng.choice(settle_ids, n_rows).astype(object)
+    unknown = rng.random(n_rows) < unknown_ratio
+    sid[unknown] = [f"X{i:06d}" for i in rng.integers(0, 10_000, int(unknown.sum()))]
+
+    days = pd.date_range("2025-01-01", "2025-12-31", freq="D")
+    notified = rng.integers(0, 5_000, n_rows)
+    return pd.DataFrame(
+        {
+            "일자": rng.choice(days.strftime("%Y-%m-%d"), n_rows),
+            "Settle ID": sid,
+            "기관명": rng.choice(orgs, n_rows),
+            "알림 수신 건수": notified,
+            "열람 시 인증 건수": (notified * rng.random(n_rows) * 0.6).astype("int64"),
+            "OTT검증 건수": (notified * rng.random(n_rows) * 0.1).astype("int64"),
+            "금액": notified * 8,
+        }
+    )
+
+
+def make_dataset(
+    rates_rows: int = 1_000,
+    drafts_rows: int = 1_000,
+    kakao_rows: int = 1_000,
+    n_orgs: int = 300,
+    n_settle_ids: int = 500,
+    seed: int = 0,
+) -> SyntheticData:
+    rng = np.random.default_rng(seed)
+    orgs = make_org_names(n_orgs, rng)
+    settle_ids = make_settle_ids(n_settle_ids)
+    return SyntheticData(
+        rates=make_rates(rates_rows, orgs, settle_ids, rng),
+        drafts=make_drafts(drafts_rows, orgs, rng),
+        kakao=make_kakao(kakao_rows, orgs, settle_ids, rng),
+    )
+
+
+# -------------------------------------------------------
+# xlsx 직렬화 (load_master_workbook / load_kakao_stats 입력용)
+# -------------------------------------------------------
+
+def write_master_workbook(data: SyntheticData, path: Optional[str] = None) -> bytes:
+    """'2025년 발송료' + '기안자료' 시트를 가진 마스터 워크북. path 가 없으면 bytes 만 반환."""
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        data.rates.to_excel(writer, sheet_name="2025년 발송료", index=False)
+        data.drafts.to_excel(writer, sheet_name="기안자료", index=False)
+    raw = buf.getvalue()
+    if path:
+        with open(path, "wb") as f:
+            f.write(raw)
+    return raw
+
+
+def write_kakao_workbook(data: SyntheticData, path: Optional[str] = None) -> bytes:
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        data.kakao.to_excel(writer, sheet_name="통계", index=False)
+    raw = buf.getvalue()
+    if path:
+        with open(path, "wb") as f:
+            f.write(raw)
+    return raw
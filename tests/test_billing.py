@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from app.settlement.billing import RateTable, price_kakao_stats
+
+
+@pytest.fixture
+def rate_table():
+    # 같은 기관, 2025-07-01 부터 단가 인상
+    return RateTable(
+        pd.DataFrame(
+            {
+                "기관명": ["A기관", "A기관"],
+                "적용시작일": ["2025-01-01", "2025-07-01"],
+                "발송단가": [10, 20],
+                "인증단가": [100, 200],
+            }
+        )
+    )
+
+
+def _stats(**extra):
+    return pd.DataFrame({"기관명": ["A기관"], "알림 수신 건수": [3], **extra})
+
+
+def test_missing_date_column_requires_as_of(rate_table):
+    with pytest.raises(ValueError):
+        price_kakao_stats(_stats(), rate_table)
+
+
+def test_as_of_selects_rate_in_effect_for_that_month(rate_table):
+    march = price_kakao_stats(_stats(), rate_table, as_of=pd.Timestamp("2025-03-01"))
+    august = price_kakao_stats(_stats(), rate_table, as_of=pd.Timestamp("2025-08-01"))
+    assert march["발송료"].tolist() == [30.0]
+    assert august["발송료"].tolist() == [60.0]
+
+
+def test_date_column_wins_over_as_of(rate_table):
+    priced = price_kakao_stats(
+        _stats(일자=["2025-03-15"]), rate_table, as_of=pd.Timestamp("2025-08-01")
+    )
+    assert priced["발송료"].tolist() == [30.0]
+
+
+def test_lookup_keeps_distinct_keys_apart_with_high_cardinality():
+    # 컬럼마다 고유값 2**17 - 1 개 → 컬럼별 코드를 곱해 합친 정수 키라면
+    # 2**64 를 넘어 기관명 코드가 2**13 차이 나는 두 조합이 같은 키가 됨
+    n = 2**17 - 1
+    filler = pd.DataFrame(
+        {
+            "기관명": [f"기관{i}" for i in range(n)],
+            "중계자": [f"중계{i}" for i in range(n)],
+            "문서유형": [f"문서{i}" for i in range(n)],
+            "일자": pd.Timestamp("2025-01-01") + pd.to_timedelta(range(n), unit="s"),
+        }
+    )
+    # 기관명만 다르고 나머지는 같은 두 행 (새 고유값 없음)
+    pair = filler.iloc[[0, 0]].reset_index(drop=True)
+    pair["기관명"] = ["기관5", f"기관{5 + 2**13}"]
+
+    table = RateTable(pd.DataFrame({"기관명": pair["기관명"], "발송단가": [1, 2]}))
+    out = table.lookup(pd.concat([filler, pair], ignore_index=True)).iloc[-2:]
+    assert out["발송단가"].tolist() == [1.0, 2.0]
@@ -0,0 +1,62 @@
+from io import BytesIO
+
+from app.settlement import cache as cache_mod
+from app.settlement.cache import WorkbookCache
+
+
+class _Upload(BytesIO):
+    """Streamlit UploadedFile 흉내 (file_id 만 추가)"""
+
+    def __init__(self, data: bytes, file_id: str):
+        super().__init__(data)
+        self.file_id = file_id
+
+
+def test_digest_hashes_once_per_file_id(monkeypatch):
+    calls = []
+    original = cache_mod.content_hash
+
+    def counting(data):
+        calls.append(len(data))
+        return original(data)
+
+    monkeypatch.setattr(cache_mod, "content_hash", counting)
+    cache = WorkbookCache()
+    upload = _Upload(b"xlsx-bytes", "f1")
+
+    first = cache.digest(upload)
+    assert cache.digest(upload) == first
+    assert len(calls) == 1
+
+    # file_id 가 없는 객체는 매번 내용 해시
+    plain = BytesIO(b"xlsx-bytes")
+    assert cache.digest(plain) == first
+    cache.digest(plain)
+    assert len(calls) == 3
+
+
+def test_digests_and_load_seconds_are_bounded():
+    cache = WorkbookCache(max_entries=2)
+    for i in range(5):
+        cache.digest(_Upload(f"data-{i}".encode(), f"f{i}"))
+        cache.get_or_load(f"d{i}", "part", lambda: i)
+
+    assert len(cache) == 2
+    assert len(cache._digests) == 2
+    assert set(cache._load_seconds) == {("d3", "part"), ("d4", "part")}
+    assert cache.load_seconds("d0", "part") == 0.0
+
+
+def test_loader_skips_file_read_on_hit():
+    cache = WorkbookCache()
+    upload = _Upload(b"xlsx-bytes", "f1")
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "parsed"
+
+    digest = cache.digest(upload)
+    assert cache.get_or_load(digest, "part", loader) == "parsed"
+    assert cache.get_or_load(cache.digest(upload), "part", loader) == "parsed"
+    assert len(calls) == 1
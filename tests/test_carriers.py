@@ -0,0 +1,42 @@
+import pandas as pd
+
+from app.settlement.carriers import CarrierStats
+
+
+def _excel_serial(dates):
+    """xlsx_stream 이 읽은 날짜 셀과 같은 엑셀 일련번호(int)"""
+    return ((pd.to_datetime(dates) - pd.Timestamp("1899-12-30")).days).astype("int64")
+
+
+def test_month_from_excel_serial_dates():
+    kt = pd.DataFrame(
+        {
+            "기관명": ["수원시", "수원시", "평택시"],
+            "일자": _excel_serial(["2025-03-15", "2025-07-01", "2025-11-30"]),
+            "발송요청건": [10, 20, 30],
+            "수신건수": [9, 19, 29],
+            "열람건수": [1, 2, 3],
+            "맵핑건수": [1, 1, 1],
+        }
+    )
+
+    volumes = CarrierStats().add("kt", kt).volumes()
+
+    assert sorted(volumes["월"]) == [3, 7, 11]
+    assert volumes.loc[volumes["월"] == 7, "발송"].item() == 20
+
+
+def test_month_from_date_strings():
+    naver = pd.DataFrame(
+        {
+            "기관명": ["가평군", "가평군"],
+            "일자": ["2025-02-01", "2025-02-28"],
+            "발송건수": [5, 6],
+            "열람건수": [1, 1],
+        }
+    )
+
+    volumes = CarrierStats().add("naver", naver).volumes()
+
+    assert volumes["월"].tolist() == [2]
+    assert volumes["발송"].tolist() == [11]
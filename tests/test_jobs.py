@@ -0,0 +1,122 @@
+import time
+
+import pytest
+
+from app.settlement import jobs as jobs_mod
+from app.settlement.jobs import STATUS_DONE, STATUS_FAILED, JobRunner
+from app.settlement.metrics import BatchMetrics
+
+
+def _wait(runner: JobRunner, job_id: str, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = runner.get(job_id)
+        if job.status in (STATUS_DONE, STATUS_FAILED):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"작업이 끝나지 않음: {runner.get(job_id)}")
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs_mod, "write_metrics", lambda record: None)
+    return JobRunner(job_dir=tmp_path, workers=1)
+
+
+def _produce(count: int, fail_at=None):
+    def produce(metrics):
+        for i in range(count):
+            if i == fail_at:
+                raise RuntimeError("PDF 생성 실패")
+            metrics.add_pdf(4)
+            yield f"{i}.pdf", b"%PDF"
+    return produce
+
+
+def test_job_done_writes_zip(runner):
+    job_id = runner._submit("me", "kakao", 3, "a.zip", _produce(3), "store", None)
+
+    job = _wait(runner, job_id)
+
+    assert job.status == STATUS_DONE
+    assert job.done == 3
+    assert (runner.job_dir / f"{job_id}.zip").exists()
+
+
+def test_failed_job_is_marked_and_cleaned(runner):
+    job_id = runner._submit("me", "kakao", 3, "a.zip", _produce(3, fail_at=1), "store", None)
+
+    job = _wait(runner, job_id)
+
+    assert job.status == STATUS_FAILED
+    assert "PDF 생성 실패" in job.error
+    assert job.result_path is None
+    assert not (runner.job_dir / f"{job_id}.zip").exists()
+
+
+def test_final_report_error_does_not_leave_job_running(runner, monkeypatch):
+    original = runner._report
+
+    def flaky_report(job_id, metrics, **fields):
+        if fields.get("status") == STATUS_DONE:
+            raise OSError("database is locked")
+        return original(job_id, metrics, **fields)
+
+    monkeypatch.setattr(runner, "_report", flaky_report)
+    job_id = runner._submit("me", "kakao", 2, "a.zip", _produce(2), "store", None)
+
+    job = _wait(runner, job_id)
+
+    assert job.status == STATUS_FAILED
+    assert not (runner.job_dir / f"{job_id}.zip").exists()
+
+
+def test_metrics_log_error_keeps_job_done(runner, monkeypatch):
+    def broken(record):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(jobs_mod, "write_metrics", broken)
+    job_id = runner._submit("me", "multi", 1, "a.zip", _produce(1), "store", None)
+
+    assert _wait(runner, job_id).status == STATUS_DONE
+
+
+def test_queue_wait_is_excluded_from_speed(runner, monkeypatch):
+    records = []
+    monkeypatch.setattr(jobs_mod, "write_metrics", records.append)
+
+    metrics = BatchMetrics()
+    metrics.stages["lookup"] = 0.01
+    metrics.started -= 100          # 페이지에서 100초 전에 만든 metrics (큐 대기 가정)
+
+    job_id = runner._submit("me", "kakao", 2, "a.zip", _produce(2), "store", metrics)
+    _wait(runner, job_id)
+    deadline = time.monotonic() + 5     # metrics 기록은 상태 갱신 직후 finally 에서
+    while not records and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert records[0]["seconds"] < 10
+    assert records[0]["stages"]["lookup"] == 0.01
+
+
+def test_jobs_interrupted_by_restart_expire_and_get_cleaned(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs_mod, "write_metrics", lambda record: None)
+    first = JobRunner(job_dir=tmp_path, workers=1, ttl_seconds=60)
+    with first._connect() as conn:
+        conn.execute(
+            f"INSERT INTO jobs ({jobs_mod._COLUMNS}) VALUES ({', '.join('?' * 15)})",
+            ("stale", "me", "kakao", jobs_mod.STATUS_RUNNING, 3, 1, time.time(),
+             None, None, None, "x.zip", None, 0, None, None),
+        )
+    partial = tmp_path / "stale.zip"
+    partial.write_bytes(b"partial")
+
+    restarted = JobRunner(job_dir=tmp_path, workers=1, ttl_seconds=0)
+    job = restarted.get("stale")
+    assert job.status == STATUS_FAILED
+    assert job.expires_at is not None
+
+    time.sleep(0.01)
+    assert restarted.cleanup_expired() == 1
+    assert restarted.get("stale") is None
+    assert not partial.exists()
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from app.settlement.index import SettlementIndex
+from app.settlement.kakao_invoice import build_kakao_invoices, build_kakao_summary_row
+from app.settlement.utils import normalize_col_name
+from benchmarks.synthetic import make_dataset
+
+
+def _normalized(df: pd.DataFrame) -> pd.DataFrame:
+    """settlement_page 정규화 + 강제 맵핑과 같은 컬럼명 (카카오 settle id → settleid)"""
+    return df.rename(columns=normalize_col_name).rename(columns={"카카오settleid": "settleid"})
+
+
+def _data():
+    data = make_dataset(rates_rows=200, drafts_rows=50, kakao_rows=2_000, n_orgs=40, n_settle_ids=60, seed=3)
+    return _normalized(data.kakao), _normalized(data.rates)
+
+
+def test_stats_only_invoice_is_not_zero():
+    kakao, _ = _data()
+    sids = kakao["settleid"].astype(str).unique()[:10].tolist()
+
+    invoices = build_kakao_invoices(kakao, sids)
+
+    for sid in sids:
+        summary, detail = invoices[sid]
+        expected = int(kakao.loc[kakao["settleid"] == sid, "금액"].sum())
+        assert len(detail) > 0
+        assert summary["발송료"] == expected > 0
+        assert summary["총금액"] == summary["발송료"] + summary["인증료"] + summary["부가세"]
+
+
+def test_master_fees_take_precedence():
+    kakao, rates = _data()
+    index = SettlementIndex(rates)
+    sids = sorted(set(kakao["settleid"].astype(str)) & set(index.settle_ids()))[:10]
+    assert sids
+
+    invoices = build_kakao_invoices(kakao, sids, index)
+
+    for sid in sids:
+        rows = rates[rates["settleid"] == sid]
+        summary, detail = invoices[sid]
+        assert len(detail) > 0
+        assert summary["발송료"] == int(rows["정산발송료"].sum())
+        assert summary["인증료"] == int(rows["정산인증료"].sum())
+        assert summary["부가세"] == int(rows["부가세"].sum())
+        assert summary["총금액"] > 0
+
+
+def test_summary_row_uses_rates_df():
+    kakao, rates = _data()
+    sid = sorted(set(kakao["settleid"].astype(str)) & set(rates["settleid"].dropna().astype(str)))[0]
+
+    row = build_kakao_summary_row(kakao, rates, sid)
+
+    assert row["발송료"] == int(rates.loc[rates["settleid"] == sid, "정산발송료"].sum())
+
+
+def test_unknown_settle_id_is_zero():
+    kakao, rates = _data()
+
+    summary, detail = build_kakao_invoices(kakao, ["없는ID"], SettlementIndex(rates))["없는ID"]
+
+    assert summary == {"발송료": 0, "인증료": 0, "부가세": 0, "총금액": 0}
+    assert detail.empty
@@ -0,0 +1,82 @@
+import json
+import os
+
+import pytest
+
+from app.utils.loader import SettingsStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SettingsStore(tmp_path / "settings.json", {"welcome_text": "기본", "login_fail_limit": 5})
+
+
+def test_save_keeps_existing_file_mode(store):
+    store.path.write_text("{}", encoding="utf-8")
+    os.chmod(store.path, 0o640)
+
+    store.save({"welcome_text": "변경"})
+
+    assert store.path.stat().st_mode & 0o777 == 0o640
+    assert json.loads(store.path.read_text(encoding="utf-8")) == {"welcome_text": "변경"}
+
+
+def test_save_new_file_is_not_private_tempfile_mode(store):
+    store.save({"login_fail_limit": 3})
+    assert store.path.stat().st_mode & 0o777 == 0o644
+
+
+def test_save_is_atomic_and_leaves_no_temp_files(store, monkeypatch):
+    store.save({"welcome_text": "처음"})
+
+    def broken_replace(src, dst):
+        raise OSError("디스크 오류")
+
+    monkeypatch.setattr(os, "replace", broken_replace)
+    with pytest.raises(OSError):
+        store.save({"welcome_text": "실패"})
+
+    # 원본 그대로 + 임시 파일 정리
+    assert json.loads(store.path.read_text(encoding="utf-8")) == {"welcome_text": "처음"}
+    assert [p.name for p in store.path.parent.iterdir()] == ["settings.json"]
+
+
+def test_get_sees_saved_value_and_bumps_version(store):
+    assert store.get()["welcome_text"] == "기본"
+    version = store.version
+
+    store.save({"welcome_text": "변경"})
+
+    assert store.get() == {"welcome_text": "변경", "login_fail_limit": 5}
+    assert store.version == version + 1
+
+
+def test_subscribers_are_notified_on_save_and_external_edit(store):
+    store.get()
+    received = []
+    unsubscribe = store.subscribe(received.append)
+
+    store.save({"welcome_text": "저장"})
+    assert received == [{"welcome_text": "저장", "login_fail_limit": 5}]
+
+    # 다른 프로세스가 파일을 직접 고친 경우 → 다음 get() 에서 알림
+    store.path.write_text(json.dumps({"welcome_text": "외부 수정", "extra": 1}), encoding="utf-8")
+    os.utime(store.path, ns=(0, 1))
+    store.get()
+    assert received[-1]["welcome_text"] == "외부 수정"
+    assert len(received) == 2
+
+    # 값이 같으면 알림 없음, 해제 후에도 없음
+    store.save({"welcome_text": "외부 수정", "extra": 1})
+    unsubscribe()
+    store.save({"welcome_text": "해제 후"})
+    assert len(received) == 2
+
+
+def test_subscriber_error_does_not_break_save(store):
+    def broken(_):
+        raise RuntimeError("구독자 오류")
+
+    store.subscribe(broken)
+    store.save({"welcome_text": "변경"})
+    assert store.get()["welcome_text"] == "변경"
@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from app.settlement.normalize import categorize_frames, frame_memory
+from benchmarks.synthetic import make_dataset
+
+
+@pytest.mark.parametrize("kakao_rows", [50, 1_000, 10_000])
+def test_categorize_never_grows_a_frame(kakao_rows):
+    data = make_dataset(
+        rates_rows=1_000, drafts_rows=1_000, kakao_rows=kakao_rows,
+        n_orgs=500, n_settle_ids=800, seed=0,
+    )
+    frames = {"카카오": data.kakao, "발송료": data.rates, "기안자료": data.drafts}
+    out, report = categorize_frames(frames)
+
+    for name, df in frames.items():
+        assert frame_memory(out[name]) <= frame_memory(df), name
+    assert (report["절감률(%)"] >= 0).all()
+
+
+def test_categories_are_per_frame():
+    small = pd.DataFrame({"기관명": ["A"] * 100})
+    large = pd.DataFrame({"기관명": [f"기관{i}" for i in range(100)] * 20})
+    out, _ = categorize_frames({"small": small, "large": large})
+
+    assert list(out["small"]["기관명"].cat.categories) == ["A"]
+    assert len(out["large"]["기관명"].cat.categories) == 100
+
+
+def test_unique_column_stays_object():
+    df = pd.DataFrame({"기관명": [f"기관{i}" for i in range(100)]})
+    out, report = categorize_frames({"df": df})
+
+    assert not isinstance(out["df"]["기관명"].dtype, pd.CategoricalDtype)
+    assert report.loc[0, "변환 컬럼 수"] == 0
@@ -0,0 +1,26 @@
+from io import BytesIO
+
+import pandas as pd
+
+from app.settlement.pdf_generator import FALLBACK_FONT, PdfRenderer
+
+
+def test_font_name_falls_back_when_font_file_missing(tmp_path):
+    renderer = PdfRenderer(font_name="NoSuchFontKR", font_file=str(tmp_path / "missing.otf"))
+    assert renderer.font_name == FALLBACK_FONT
+
+    rows = pd.DataFrame([{"기관명": "테스트기관", "합 계": 1000}])
+    pdf = renderer.render_multi(None, rows)
+    assert pdf.startswith(b"%PDF")
+
+
+def test_legacy_font_name_and_draw_text_still_importable():
+    from reportlab.pdfgen import canvas
+
+    from app.settlement.pdf_generator import FONT_NAME, PREFERRED_FONT, draw_text, get_renderer
+
+    assert FONT_NAME == PREFERRED_FONT
+
+    c = canvas.Canvas(BytesIO())
+    draw_text(c, "테스트", 10, 10)
+    assert c._fontname == get_renderer().font_name
@@ -0,0 +1,135 @@
+import re
+from dataclasses import astuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.settlement.processor import SettlementProcessor
+from benchmarks.synthetic import make_dataset
+
+
+# -------------------------------------------------------
+# 기준 구현: 벡터화 이전 build_org_rows (iterrows 행 루프) 그대로
+# -------------------------------------------------------
+
+def _clean_str(x) -> str:
+    if pd.isna(x):
+        return ""
+    return str(x).strip()
+
+
+def _parse_org_and_charge(gubun: str):
+    m = re.match(r"^(.*)\((.*)\)$", gubun.strip())
+    if m:
+        return m.group(1).strip(), m.group(2).strip()
+    return gubun.strip(), ""
+
+
+def _extract_region(org_name: str) -> str:
+    for pattern in (r"([가-힣]+시)", r"([가-힣]+군)", r"([가-힣]+구)"):
+        m = re.search(pattern, org_name)
+        if m:
+            return m.group(1)
+    return "전국"
+
+
+def _normalize_yes(value) -> bool:
+    return str(value).strip().upper() in {"Y", "O", "YES", "예", "과세", "별도"}
+
+
+def reference_org_rows(rates_df: pd.DataFrame, drafts_df: pd.DataFrame):
+    org_type, vat_map = {}, {}
+    for _, row in rates_df.iterrows():
+        org = _clean_str(row.get("기관명", ""))
+        if not org:
+            continue
+        carriers = {_clean_str(row.get(f"중계자({i})", "")) for i in (1, 2, 3)} - {""}
+        org_type[org] = carriers == {"카카오"}
+        vat_map[org] = _normalize_yes(row.get("부가세", ""))
+
+    rows = []
+    for _, row in drafts_df.iterrows():
+        gubun = _clean_str(row.get("구분", ""))
+        if not gubun:
+            continue
+        org_name, charge_name = _parse_org_and_charge(gubun)
+
+        amount = row.get("정산금액", None)
+        if pd.isna(amount):
+            amount = row.get("금액", 0)
+        try:
+            amount_int = int(round(float(amount)))
+        except Exception:
+            amount_int = 0
+
+        try:
+            vat_int = int(round(float(row.get("부가세", 0))))
+        except Exception:
+            vat_int = 0
+
+        is_kakao_only = org_type.get(org_name, False)
+        rows.append(
+            (
+                org_name,
+                charge_name,
+                _extract_region(org_name),
+                amount_int,
+                vat_int,
+                is_kakao_only,
+                vat_map.get(org_name, vat_int > 0),
+                "kakao" if is_kakao_only else "multi",
+            )
+        )
+    return rows
+
+
+def _actual(rates_df, drafts_df, kakao_df):
+    processor = SettlementProcessor(rates_df, drafts_df, kakao_df)
+    processor.build_org_rows()
+    return [astuple(r) for r in processor.org_rows]
+
+
+# -------------------------------------------------------
+# 합성 데이터 + 경계값
+# -------------------------------------------------------
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_build_org_rows_matches_reference_loop(seed):
+    data = make_dataset(rates_rows=400, drafts_rows=400, kakao_rows=200, n_orgs=60, n_settle_ids=80, seed=seed)
+
+    assert _actual(*data) == reference_org_rows(data.rates, data.drafts)
+
+
+def test_build_org_rows_edge_values():
+    rates = pd.DataFrame(
+        {
+            "기관명": ["수원시 영통구청", "평택시종합관제사업소", "  가평군 보건소 ", "", None, "국민연금공단", "해운대구 기관"],
+            "카카오 settle id": ["S1", None, "", "S4", "S5", np.nan, "  "],
+            "중계자(1)": ["카카오", "카카오", "KT", "카카오", "카카오", None, " 카카오 "],
+            "중계자(2)": ["", "네이버", None, "", "", "", ""],
+            "중계자(3)": [None, "", "", "", "", "", np.nan],
+            "부가세": ["Y", " 과세 ", "o", 0, np.nan, 123, "별도"],
+        }
+    )
+    drafts = pd.DataFrame(
+        {
+            "구분": [
+                "수원시 영통구청(영통3동 주민등록증 재발급 안내문)",
+                "평택시종합관제사업소",
+                "  가평군 보건소 (건강검진) ",
+                "",
+                None,
+                "국민연금공단(고지)",
+                "미등록 기관(안내)",
+                "해운대구 기관()",
+                "(괄호만)",
+            ],
+            "정산금액": [1000.4, np.nan, "2,500", 0, 10, -3.5, 0.5, 1.5, "abc"],
+            "금액": [1, 777.6, 3, 4, 5, 6, 7, 8, 9],
+            "부가세": [100, np.nan, "", "x", 0, -0.5, 0.5, 2.5, "  12 "],
+        }
+    )
+    kakao = pd.DataFrame({"Settle ID": ["S1", "S9"]})
+
+    assert _actual(rates, drafts, kakao) == reference_org_rows(rates, drafts)
@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+
+from app.settlement.missing import MissingFinder
+from app.settlement.normalize import categorize_frames
+from app.settlement.processor import SettlementProcessor
+from app.settlement.summary import SettlementSummary
+from benchmarks.synthetic import make_dataset
+
+
+# -------------------------------------------------------
+# 엔진은 입력 DataFrame 을 읽기 전용으로만 써야 한다 (copy 없이 참조)
+# -------------------------------------------------------
+
+def _inputs(categorical: bool):
+    data = make_dataset(rates_rows=300, drafts_rows=300, kakao_rows=500, n_orgs=50, n_settle_ids=80, seed=7)
+    frames = {"rates": data.rates, "drafts": data.drafts, "kakao": data.kakao}
+    if categorical:
+        frames, _ = categorize_frames(frames)
+    return frames
+
+
+def _snapshot(frames):
+    return {name: df.copy(deep=True) for name, df in frames.items()}
+
+
+def _assert_unchanged(frames, snapshot):
+    for name, df in frames.items():
+        before = snapshot[name]
+        assert list(df.columns) == list(before.columns), name
+        assert df.dtypes.equals(before.dtypes), name
+        assert df.equals(before), name
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_processor_does_not_mutate_inputs(categorical):
+    frames = _inputs(categorical)
+    snapshot = _snapshot(frames)
+
+    p = SettlementProcessor(frames["rates"], frames["drafts"], frames["kakao"])
+    p.build_org_rows()
+    p.build_org_frame()
+    p.calc_overview()
+    p.to_detail_dataframe()
+    p.get_missing_settle_ids()
+
+    _assert_unchanged(frames, snapshot)
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_summary_does_not_mutate_inputs(categorical):
+    frames = _inputs(categorical)
+    snapshot = _snapshot(frames)
+
+    s = SettlementSummary(frames["kakao"], frames["rates"], frames["drafts"])
+    s.total_sales()
+    s.bill_counts()
+    s.vat_summary()
+    s.region_summary()
+    s.top3_orgs()
+    s.pdf_type_counts()
+    s.build_summary_dict()
+
+    _assert_unchanged(frames, snapshot)
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_missing_finder_does_not_mutate_inputs(categorical):
+    frames = _inputs(categorical)
+    extra = frames["kakao"].head(50).copy()
+    frames["extra"] = extra
+    snapshot = _snapshot(frames)
+
+    m = MissingFinder(frames["kakao"], frames["rates"]).add_kakao(extra)
+    m.get_missing_settle_ids()
+    m.get_extra_settle_ids()
+    missing_orgs = m.get_missing_orgs()
+    m.summary()
+    m.to_dataframe()
+
+    _assert_unchanged(frames, snapshot)
+
+    # 반환된 결과를 고쳐도 입력에 반영되지 않아야 함
+    if len(missing_orgs.columns):
+        missing_orgs.iloc[:, 0] = "changed"
+    _assert_unchanged(frames, snapshot)
@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from app.settlement import reconcile
+from app.settlement.reconcile import DEFAULT_LOAD_WORKERS, load_monthly_files
+
+
+def _patch(monkeypatch):
+    sizes = []
+
+    def pool(max_workers):
+        sizes.append(max_workers)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    monkeypatch.setattr(reconcile, "ThreadPoolExecutor", pool)
+    monkeypatch.setattr(reconcile, "_load_month", lambda args: (args[0], pd.DataFrame({"b": [args[1]]})))
+    return sizes
+
+
+def test_load_workers_default_is_independent_of_pdf_setting(monkeypatch):
+    sizes = _patch(monkeypatch)
+    files = {m: [f"{m}".encode()] for m in range(1, 13)}
+
+    load_monthly_files(files, use_processes=False)
+    load_monthly_files(files, workers=2, use_processes=False)
+
+    assert sizes == [DEFAULT_LOAD_WORKERS, 2]
+
+
+def test_same_month_parts_are_concatenated(monkeypatch):
+    _patch(monkeypatch)
+    out = load_monthly_files({3: [b"a", b"b"], 4: b"c"}, use_processes=False)
+    assert out[3]["b"].tolist() == [b"a", b"b"]
+    assert out[4]["b"].tolist() == [b"c"]